@@ -0,0 +1 @@
+"""Offline benchmarks for the Miner Pool Stats integration."""
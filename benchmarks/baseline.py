@@ -0,0 +1,68 @@
+"""Saved benchmark results to compare new runs against."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+# Relative slowdown or memory growth reported as a regression
+DEFAULT_THRESHOLD = 0.2
+
+type Results = dict[str, dict[str, float]]
+
+
+def compare(
+    results: Results, baseline: Results, fields: tuple[str, ...], threshold: float
+) -> list[str]:
+    """Return the runs with fields exceeding the baseline."""
+    regressions = []
+    for key, result in results.items():
+        if (previous := baseline.get(key)) is None:
+            continue
+        for field in fields:
+            value = result.get(field)
+            previous_value = previous.get(field)
+            if value is None or not previous_value:
+                continue
+            if value > previous_value * (1 + threshold):
+                regressions.append(
+                    f"{key} {field}: {previous_value:.2f} -> {value:.2f}"
+                    f" (+{(value / previous_value - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def load_results(path: Path) -> Results:
+    """Load saved results."""
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_results(path: Path, results: Results) -> None:
+    """Save the results as a baseline."""
+    path.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+
+
+def add_baseline_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options saving and comparing a baseline to a command line parser."""
+    parser.add_argument("--save", type=Path, help="save the results as a baseline")
+    parser.add_argument("--compare", type=Path, help="compare with a saved baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+
+def check_baseline(
+    args: argparse.Namespace, results: Results, fields: tuple[str, ...]
+) -> int:
+    """Save or compare the results as requested, returns the exit code."""
+    if args.save:
+        save_results(args.save, results)
+
+    if args.compare:
+        if regressions := compare(
+            results, load_results(args.compare), fields, args.threshold
+        ):
+            print("Regressions:", *regressions, sep="\n  ")
+            return 1
+        print("No regressions")
+
+    return 0
@@ -0,0 +1,89 @@
+"""Shared helpers of the Miner Pool Stats benchmarks."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import tempfile
+from types import MappingProxyType, MethodType
+from typing import Any
+
+from aiohttp import ClientSession, ClientTimeout
+
+from custom_components.miner_pool_stats.const import CONF_TITLE, CONF_UNIQUE_ID, DOMAIN
+from custom_components.miner_pool_stats.factory import PoolFactory
+from custom_components.miner_pool_stats.metrics import current_poll_metrics
+from custom_components.miner_pool_stats.pool import PoolClient
+from custom_components.miner_pool_stats.transport import (
+    DATA_TRANSPORT,
+    PoolResponse,
+    PoolTransport,
+)
+from homeassistant.config_entries import SOURCE_USER, ConfigEntry, ConfigEntryState
+from homeassistant.core import HomeAssistant
+
+
+class PayloadTransport(PoolTransport):
+    """Transport answering every request with the same payload."""
+
+    status = 200
+    body = b""
+
+    async def async_get(
+        self,
+        url: str,
+        headers: dict[str, str] | None,
+        timeout: ClientTimeout,
+    ) -> PoolResponse:
+        """Return the payload without a network round trip."""
+        if (metrics := current_poll_metrics.get()) is not None:
+            metrics.add_payload(len(self.body))
+        return PoolResponse(self.status, self.body)
+
+
+async def async_no_recorder(_client: PoolClient, _worker_name: str) -> float:
+    """Skip the best difficulty history, there is no recorder in the benchmarks."""
+    return 0.0
+
+
+@asynccontextmanager
+async def async_benchmark_hass(
+    transport_class: type[PoolTransport] = PayloadTransport,
+    **transport_kwargs: Any,
+) -> AsyncIterator[tuple[HomeAssistant, PoolTransport]]:
+    """Create a bare Home Assistant instance using the given transport."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        async with ClientSession() as session:
+            transport = transport_class(session, **transport_kwargs)
+            hass.data[DATA_TRANSPORT] = transport
+            yield hass, transport
+
+
+async def async_create_client(
+    hass: HomeAssistant, config_data: dict[str, Any]
+) -> PoolClient:
+    """Create the client of a pool without recorder lookups."""
+    client = await PoolFactory.async_get(hass, config_data)
+    # bound per instance so the parse loop pays no patching overhead
+    client._get_max_best_difficulty = MethodType(async_no_recorder, client)  # type: ignore[method-assign]
+    return client
+
+
+def create_config_entry(
+    config_data: dict[str, Any], options: dict[str, Any] | None = None
+) -> ConfigEntry:
+    """Create a config entry that is being set up, without a config entries manager."""
+    return ConfigEntry(
+        data=config_data,
+        discovery_keys=MappingProxyType({}),
+        domain=DOMAIN,
+        minor_version=1,
+        options=options or {},
+        source=SOURCE_USER,
+        state=ConfigEntryState.SETUP_IN_PROGRESS,
+        subentries_data=None,
+        title=config_data[CONF_TITLE],
+        unique_id=config_data[CONF_UNIQUE_ID],
+        version=1,
+    )
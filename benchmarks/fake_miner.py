@@ -0,0 +1,234 @@
+"""Local stand-in for a fleet of miners serving the cgminer API.
+
+Every miner listens on its own port of the loopback interface, answers the
+``summary``, ``pools`` and ``summary+pools`` commands after an optional
+latency with jitter, and closes the connection like cgminer does. A share
+of the miners can be offline, they accept the connection but never answer
+so the client runs into its deadline. Serve a fleet to point a Home
+Assistant instance at it, or poll it with the cgminer client:
+
+    python -m benchmarks.fake_miner --miners 200 --latency 0.05
+    python -m benchmarks.fake_miner --miners 200 --offline-rate 0.05 --poll 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+from collections.abc import Awaitable, Callable
+import contextlib
+from dataclasses import dataclass
+import json
+import random
+from time import perf_counter, time
+from typing import Any
+
+from custom_components.miner_pool_stats.const import (
+    CONF_ADDRESS,
+    CONF_COIN_KEY,
+    CONF_COIN_NAME,
+    CONF_HOSTS,
+    CONF_POOL_KEY,
+    CONF_POOL_NAME,
+    CONF_TITLE,
+    CONF_UNIQUE_ID,
+    POOL_SOURCE_CGMINER_KEY,
+    POOL_SOURCE_CGMINER_NAME,
+    CryptoCoin,
+)
+
+from .common import async_benchmark_hass, async_create_client
+
+
+@dataclass
+class FakeMinerOptions:
+    """Behavior of the fake miners."""
+
+    miners: int = 10
+    latency: float = 0.0  # seconds
+    jitter: float = 0.0  # seconds
+    offline_rate: float = 0.0
+    seed: int | None = None
+
+
+def _summary(index: int) -> dict[str, Any]:
+    return {
+        "STATUS": [{"STATUS": "S", "Code": 11, "Msg": "Summary"}],
+        "SUMMARY": [
+            {
+                "Elapsed": 86_400 + index,
+                "GHS 5s": 1_200.0 + index,
+                "GHS av": 1_180.0 + index,
+                "Accepted": 10_000 + index,
+                "Rejected": index % 7,
+                "Best Share": 1_000_000 + index * 1_000,
+            }
+        ],
+        "id": 1,
+    }
+
+
+def _pools(index: int) -> dict[str, Any]:
+    return {
+        "STATUS": [{"STATUS": "S", "Code": 7, "Msg": f"{index + 1} Pool(s)"}],
+        "POOLS": [
+            {
+                "POOL": 0,
+                "URL": "stratum+tcp://solo.ckpool.org:3333",
+                "Status": "Alive",
+                "Stratum Active": True,
+                "User": f"bc1qfakeminer.miner{index:04d}",
+                "Best Share": 900_000 + index * 1_000,
+                "Last Share Time": int(time()) - index % 60,
+            }
+        ],
+        "id": 1,
+    }
+
+
+class FakeMinerFleet:
+    """Serve the cgminer API of a fleet of miners."""
+
+    def __init__(self, options: FakeMinerOptions) -> None:
+        """Initialize the fleet."""
+        self.options = options
+        self.commands: Counter[str] = Counter()
+        self.hosts: list[str] = []
+        self._random = random.Random(options.seed)
+        self._servers: list[asyncio.Server] = []
+
+    async def async_start(self, host: str = "127.0.0.1") -> list[str]:
+        """Start a server per miner, returns the miners as host and port."""
+        offline = set(
+            self._random.sample(
+                range(self.options.miners),
+                round(self.options.miners * self.options.offline_rate),
+            )
+        )
+        for index in range(self.options.miners):
+            server = await asyncio.start_server(
+                self._create_handler(index, index in offline), host, 0
+            )
+            self._servers.append(server)
+            port = server.sockets[0].getsockname()[1]
+            self.hosts.append(f"{host}:{port}")
+        return self.hosts
+
+    def _create_handler(
+        self, index: int, offline: bool
+    ) -> Callable[[asyncio.StreamReader, asyncio.StreamWriter], Awaitable[None]]:
+        responses = {"summary": _summary(index), "pools": _pools(index)}
+
+        async def _async_handle(
+            reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+        ) -> None:
+            try:
+                request = json.loads(await reader.read(4096))
+                command = str(request.get("command", ""))
+                self.commands[command] += 1
+
+                if offline:
+                    # hold the connection until the client gives up
+                    await reader.read()
+                    return
+
+                delay = self.options.latency + self._random.uniform(
+                    -self.options.jitter, self.options.jitter
+                )
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                if "+" in command:
+                    response = {name: [responses[name]] for name in command.split("+")}
+                else:
+                    response = responses[command]
+                writer.write(json.dumps(response).encode() + b"\x00")
+                await writer.drain()
+            except (ValueError, KeyError, ConnectionError):
+                pass
+            finally:
+                # cgminer closes the connection after every command
+                writer.close()
+
+        return _async_handle
+
+    async def async_stop(self) -> None:
+        """Stop serving."""
+        for server in self._servers:
+            server.close()
+        for server in self._servers:
+            await server.wait_closed()
+        self._servers.clear()
+
+
+def get_config_data(hosts: list[str]) -> dict[str, Any]:
+    """Get the config entry data of the fleet."""
+    return {
+        CONF_TITLE: f"{POOL_SOURCE_CGMINER_NAME} - BTC - fleet",
+        CONF_UNIQUE_ID: f"{POOL_SOURCE_CGMINER_KEY}_btc_fleet",
+        CONF_POOL_KEY: POOL_SOURCE_CGMINER_KEY,
+        CONF_POOL_NAME: POOL_SOURCE_CGMINER_NAME,
+        CONF_COIN_KEY: CryptoCoin.BTC.value,
+        CONF_COIN_NAME: CryptoCoin.BTC.name,
+        CONF_ADDRESS: "fleet",
+        CONF_HOSTS: hosts,
+    }
+
+
+async def _async_poll(fleet: FakeMinerFleet, rounds: int) -> None:
+    """Poll the fleet with the cgminer client and report the round times."""
+    async with async_benchmark_hass() as (hass, _):
+        client = await async_create_client(hass, get_config_data(fleet.hosts))
+        for _ in range(rounds):
+            start = perf_counter()
+            data = await client.async_get_data()
+            online = sum(worker.is_online for worker in data.worker_list)
+            print(
+                f"Polled {len(data.worker_list)} miners in"
+                f" {(perf_counter() - start) * 1000:.0f} ms, {online} online"
+            )
+
+
+async def _async_run(args: argparse.Namespace) -> None:
+    fleet = FakeMinerFleet(
+        FakeMinerOptions(
+            miners=args.miners,
+            latency=args.latency,
+            jitter=args.jitter,
+            offline_rate=args.offline_rate,
+            seed=args.seed,
+        )
+    )
+    hosts = await fleet.async_start(args.host)
+    try:
+        if args.poll:
+            await _async_poll(fleet, args.poll)
+            print(f"Commands: {dict(fleet.commands)}")
+            return
+        print(f"Serving {len(hosts)} miners:\n{', '.join(hosts)}")
+        await asyncio.Event().wait()
+    finally:
+        await fleet.async_stop()
+
+
+def main() -> None:
+    """Serve or poll a fleet of fake miners."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--miners", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument("--offline-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument(
+        "--poll", type=int, default=0, help="rounds to poll with the client"
+    )
+    args = parser.parse_args()
+
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_async_run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""Load test of many config entries against the pool simulator.
+
+Sets up the given number of ``PoolCoordinator`` instances, spread over the
+pool sources, refreshes them all together for a number of rounds and
+reports the throughput, the event loop lag and the memory use:
+
+    python -m benchmarks.load --entries 500 --rounds 5 --workers 50 --latency 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import math
+import resource
+from time import perf_counter
+from unittest.mock import patch
+
+from custom_components.miner_pool_stats.coordinator import PoolCoordinator
+from custom_components.miner_pool_stats.pool import PoolClient
+
+from .common import async_benchmark_hass, async_no_recorder, create_config_entry
+from .payloads import PAYLOAD_GENERATORS, get_config_data
+from .simulator import (
+    PoolSimulator,
+    SimulatorTransport,
+    add_simulator_arguments,
+    get_simulator_options,
+)
+
+# Interval of the event loop lag probe in seconds
+LOOP_LAG_INTERVAL = 0.05
+
+
+async def _async_probe_loop_lag(samples: list[float]) -> None:
+    """Measure how late the event loop wakes up a sleeping task."""
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(LOOP_LAG_INTERVAL)
+        samples.append(loop.time() - start - LOOP_LAG_INTERVAL)
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    """Return the nearest-rank percentile of the values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(math.ceil(percent / 100 * len(ordered)), 1) - 1]
+
+
+def _max_rss_mib() -> float:
+    """Return the peak resident memory of the process in MiB."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def async_run(args: argparse.Namespace) -> None:
+    """Run the load test."""
+    pool_keys = args.pools or sorted(PAYLOAD_GENERATORS)
+    simulator = PoolSimulator(get_simulator_options(args))
+    simulator_url = await simulator.async_start()
+    rss_start = _max_rss_mib()
+
+    lag_samples: list[float] = []
+    lag_probe = asyncio.create_task(_async_probe_loop_lag(lag_samples))
+
+    try:
+        async with async_benchmark_hass(
+            SimulatorTransport, simulator_url=simulator_url
+        ) as (hass, _):
+            with patch.object(
+                PoolClient, "_get_max_best_difficulty", async_no_recorder
+            ):
+                coordinators = [
+                    PoolCoordinator(
+                        hass,
+                        create_config_entry(
+                            get_config_data(
+                                pool_keys[index % len(pool_keys)],
+                                address=f"bc1qload{index:06d}",
+                                pool_url=str(simulator_url),
+                            )
+                        ),
+                    )
+                    for index in range(args.entries)
+                ]
+
+                start = perf_counter()
+                setup_results = await asyncio.gather(
+                    *(
+                        coordinator.async_config_entry_first_refresh()
+                        for coordinator in coordinators
+                    ),
+                    return_exceptions=True,
+                )
+                setup_time = perf_counter() - start
+                coordinators = [
+                    coordinator
+                    for coordinator, result in zip(
+                        coordinators, setup_results, strict=True
+                    )
+                    if not isinstance(result, BaseException)
+                ]
+                print(
+                    f"Set up {len(coordinators)}/{args.entries} entries"
+                    f" in {setup_time:.2f} s"
+                )
+
+                round_times = []
+                successful_polls = 0
+                for _ in range(args.rounds):
+                    start = perf_counter()
+                    await asyncio.gather(
+                        *(coordinator.async_refresh() for coordinator in coordinators)
+                    )
+                    round_times.append(perf_counter() - start)
+                    successful_polls += sum(
+                        coordinator.last_update_success for coordinator in coordinators
+                    )
+
+                for coordinator in coordinators:
+                    await coordinator.async_shutdown()
+    finally:
+        lag_probe.cancel()
+        await simulator.async_stop()
+
+    polls = len(coordinators) * args.rounds
+    total_time = sum(round_times)
+    print(
+        f"Polls: {successful_polls}/{polls} successful"
+        f" in {total_time:.2f} s, {polls / total_time if total_time else 0:.1f} polls/s\n"
+        f"Round time: median {_percentile(round_times, 50):.2f} s"
+        f" max {max(round_times, default=0):.2f} s\n"
+        f"Loop lag: p50 {_percentile(lag_samples, 50) * 1000:.1f} ms"
+        f" p95 {_percentile(lag_samples, 95) * 1000:.1f} ms"
+        f" max {max(lag_samples, default=0) * 1000:.1f} ms\n"
+        f"Peak memory: {_max_rss_mib():.1f} MiB"
+        f" (+{_max_rss_mib() - rss_start:.1f} MiB)\n"
+        f"Simulator responses: {dict(simulator.responses)}"
+    )
+
+
+def main() -> None:
+    """Run the load test."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument(
+        "--pool", action="append", choices=sorted(PAYLOAD_GENERATORS), dest="pools"
+    )
+    add_simulator_arguments(parser)
+    asyncio.run(async_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
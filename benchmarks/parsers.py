@@ -0,0 +1,148 @@
+"""Parse time and peak memory of every pool client.
+
+Each client fetches a synthetic response through ``async_get_data`` from a
+transport that skips the network, so the results cover JSON decoding and the
+parse loop. Run from the repository root with Home Assistant installed:
+
+    python -m benchmarks.parsers --save benchmarks/baseline.json
+    python -m benchmarks.parsers --compare benchmarks/baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import asdict, dataclass
+from statistics import median
+import sys
+from time import perf_counter
+import tracemalloc
+
+from custom_components.miner_pool_stats.metrics import (
+    PollMetrics,
+    PollStage,
+    current_poll_metrics,
+)
+from custom_components.miner_pool_stats.pool import PoolClient
+
+from .baseline import Results, add_baseline_arguments, check_baseline
+from .common import PayloadTransport, async_benchmark_hass, async_create_client
+from .payloads import PAYLOAD_GENERATORS, WORKER_COUNTS, generate_body, get_config_data
+
+# Fields of the results compared with the baseline
+COMPARED_FIELDS = ("total_ms", "peak_kib")
+
+
+@dataclass
+class ParserResult:
+    """Measurements of a client parsing one payload size."""
+
+    payload_bytes: int
+    decode_ms: float
+    parse_ms: float
+    total_ms: float
+    peak_kib: float
+
+
+async def async_measure(client: PoolClient, rounds: int) -> tuple[float, ...]:
+    """Return the median decode, parse and total time in milliseconds."""
+    samples = []
+    for _ in range(rounds):
+        metrics = PollMetrics()
+        metrics.start_poll()
+        token = current_poll_metrics.set(metrics)
+        start = perf_counter()
+        try:
+            await client.async_get_data()
+        finally:
+            current_poll_metrics.reset(token)
+        samples.append(
+            (
+                metrics.stage_time(PollStage.DECODE) * 1000,
+                metrics.stage_time(PollStage.PARSE) * 1000,
+                (perf_counter() - start) * 1000,
+            )
+        )
+    return tuple(median(values) for values in zip(*samples, strict=True))
+
+
+async def async_measure_peak_memory(client: PoolClient) -> float:
+    """Return the peak memory allocated by a fetch in KiB."""
+    # measured on its own run, tracing slows down the timed runs
+    tracemalloc.start()
+    try:
+        await client.async_get_data()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+async def async_benchmark(
+    client: PoolClient, transport: PayloadTransport, body: bytes, rounds: int
+) -> ParserResult:
+    """Benchmark a client fetching a response body."""
+    transport.body = body
+    decode_ms, parse_ms, total_ms = await async_measure(client, rounds)
+    return ParserResult(
+        payload_bytes=len(body),
+        decode_ms=decode_ms,
+        parse_ms=parse_ms,
+        total_ms=total_ms,
+        peak_kib=await async_measure_peak_memory(client),
+    )
+
+
+def print_result(name: str, result: ParserResult) -> None:
+    """Print the measurements of a run."""
+    print(
+        f"{name:<40} {result.payload_bytes / 1024:>10.1f} KiB"
+        f" decode {result.decode_ms:>9.2f} ms"
+        f" parse {result.parse_ms:>9.2f} ms"
+        f" total {result.total_ms:>9.2f} ms"
+        f" peak {result.peak_kib:>10.1f} KiB"
+    )
+
+
+def as_results(results: dict[str, ParserResult]) -> Results:
+    """Convert the measurements to saved results."""
+    return {name: asdict(result) for name, result in results.items()}
+
+
+async def async_run(
+    pool_keys: list[str], worker_counts: list[int], rounds: int
+) -> dict[str, ParserResult]:
+    """Benchmark the clients at every worker count."""
+    results: dict[str, ParserResult] = {}
+    async with async_benchmark_hass() as (hass, transport):
+        assert isinstance(transport, PayloadTransport)
+        for pool_key in pool_keys:
+            client = await async_create_client(hass, get_config_data(pool_key))
+            for worker_count in worker_counts:
+                name = f"{pool_key}/{worker_count}"
+                results[name] = await async_benchmark(
+                    client, transport, generate_body(pool_key, worker_count), rounds
+                )
+                print_result(name, results[name])
+    return results
+
+
+def main() -> int:
+    """Run the parser benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--pool", action="append", choices=sorted(PAYLOAD_GENERATORS), dest="pools"
+    )
+    parser.add_argument("--workers", type=int, nargs="+", default=list(WORKER_COUNTS))
+    parser.add_argument("--rounds", type=int, default=5)
+    add_baseline_arguments(parser)
+    args = parser.parse_args()
+
+    results = asyncio.run(
+        async_run(args.pools or sorted(PAYLOAD_GENERATORS), args.workers, args.rounds)
+    )
+    return check_baseline(args, as_results(results), COMPARED_FIELDS)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
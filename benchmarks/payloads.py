@@ -0,0 +1,207 @@
+"""Synthetic pool responses for the Miner Pool Stats benchmarks."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import timedelta
+import json
+from typing import Any
+
+from custom_components.miner_pool_stats.const import (
+    CONF_ADDRESS,
+    CONF_API_KEY,
+    CONF_COIN_KEY,
+    CONF_COIN_NAME,
+    CONF_POOL_KEY,
+    CONF_POOL_NAME,
+    CONF_POOL_URL,
+    CONF_TITLE,
+    CONF_UNIQUE_ID,
+    POOL_SOURCE_CK_POOL_KEY,
+    POOL_SOURCE_CK_POOL_NAME,
+    POOL_SOURCE_COIN_MINERS_KEY,
+    POOL_SOURCE_COIN_MINERS_NAME,
+    POOL_SOURCE_F2_POOL_KEY,
+    POOL_SOURCE_F2_POOL_NAME,
+    POOL_SOURCE_MINING_CORE_KEY,
+    POOL_SOURCE_MINING_CORE_NAME,
+    POOL_SOURCE_MINING_DUTCH_KEY,
+    POOL_SOURCE_MINING_DUTCH_NAME,
+    POOL_SOURCE_PUBLIC_POOL_KEY,
+    POOL_SOURCE_PUBLIC_POOL_NAME,
+    POOL_SOURCE_SOLO_POOL_KEY,
+    POOL_SOURCE_SOLO_POOL_NAME,
+    CryptoCoin,
+)
+from homeassistant.util.dt import utcnow
+
+ADDRESS = "bc1qbenchmarkaddress0000000000000000000000"
+POOL_URL = "http://127.0.0.1:8080"
+
+# Worker counts of the default benchmark runs
+WORKER_COUNTS = (10, 1_000, 50_000)
+
+POOL_NAMES = {
+    POOL_SOURCE_CK_POOL_KEY: POOL_SOURCE_CK_POOL_NAME,
+    POOL_SOURCE_COIN_MINERS_KEY: POOL_SOURCE_COIN_MINERS_NAME,
+    POOL_SOURCE_F2_POOL_KEY: POOL_SOURCE_F2_POOL_NAME,
+    POOL_SOURCE_MINING_CORE_KEY: POOL_SOURCE_MINING_CORE_NAME,
+    POOL_SOURCE_MINING_DUTCH_KEY: POOL_SOURCE_MINING_DUTCH_NAME,
+    POOL_SOURCE_PUBLIC_POOL_KEY: POOL_SOURCE_PUBLIC_POOL_NAME,
+    POOL_SOURCE_SOLO_POOL_KEY: POOL_SOURCE_SOLO_POOL_NAME,
+}
+
+
+def get_config_data(
+    pool_key: str, address: str = ADDRESS, pool_url: str = POOL_URL
+) -> dict[str, Any]:
+    """Get the config entry data of a pool."""
+    return {
+        CONF_TITLE: f"{POOL_NAMES[pool_key]} {address}",
+        CONF_UNIQUE_ID: f"{pool_key}_{address}",
+        CONF_POOL_KEY: pool_key,
+        CONF_POOL_NAME: POOL_NAMES[pool_key],
+        CONF_POOL_URL: pool_url,
+        CONF_COIN_KEY: CryptoCoin.BTC.value,
+        CONF_COIN_NAME: "Bitcoin",
+        CONF_ADDRESS: address,
+        CONF_API_KEY: "benchmark-api-key",
+    }
+
+
+def worker_name(index: int) -> str:
+    """Get the name of a synthetic worker."""
+    return f"worker{index:05d}"
+
+
+def _ckpool(worker_count: int) -> Any:
+    last_share = int(utcnow().timestamp())
+    return {
+        "bestever": 1_234_567.0,
+        "worker": [
+            {
+                "workername": f"{ADDRESS}.{worker_name(index)}",
+                "hashrate5m": "1.35T",
+                "lastshare": last_share - index % 3600,
+                "bestever": 1000.0 + index,
+            }
+            for index in range(worker_count)
+        ],
+    }
+
+
+def _coin_miners(worker_count: int) -> Any:
+    return {
+        "currency": "BTC",
+        "total": 0.5,
+        "unpaid": 0.01,
+        "miners": [
+            {"ID": worker_name(index), "accepted": 1.35e12}
+            for index in range(worker_count)
+        ],
+    }
+
+
+def _f2_pool(worker_count: int) -> Any:
+    current_time = utcnow()
+    return {
+        "paid": 0.5,
+        "balance": 0.01,
+        "worker_length": worker_count,
+        "workers": [
+            [
+                worker_name(index),
+                1.35e12,
+                1.3e12,
+                0,
+                1.35e12,
+                None,
+                (current_time - timedelta(seconds=index % 3600)).isoformat(),
+            ]
+            for index in range(worker_count)
+        ],
+    }
+
+
+def _mining_core(worker_count: int) -> Any:
+    return {
+        "totalPaid": 0.5,
+        "performance": {
+            "workers": {
+                worker_name(index): {"hashrate": 1.35e12, "sharesPerSecond": 0.1}
+                for index in range(worker_count)
+            }
+        },
+    }
+
+
+def _mining_dutch(worker_count: int) -> Any:
+    return {
+        "getuserworkers": {
+            "data": {
+                "miners": [
+                    {
+                        "username": worker_name(index),
+                        "hashrate": 1_350_000.0,
+                        "difficulty": 1000.0 + index,
+                        "alive": 1,
+                    }
+                    for index in range(worker_count)
+                ]
+            }
+        }
+    }
+
+
+def _public_pool(worker_count: int) -> Any:
+    current_time = utcnow()
+    return {
+        "bestDifficulty": 1_234_567.0,
+        "workersCount": worker_count,
+        "workers": [
+            {
+                "name": worker_name(index),
+                "sessionId": f"{index:08x}",
+                "bestDifficulty": 1000.0 + index,
+                "hashRate": 1.35e12,
+                "startTime": (current_time - timedelta(days=1)).isoformat(),
+                "lastSeen": (
+                    current_time - timedelta(seconds=index % 3600)
+                ).isoformat(),
+            }
+            for index in range(worker_count)
+        ],
+    }
+
+
+def _solo_pool(worker_count: int) -> Any:
+    return {
+        "paymentsTotal": 0.5,
+        "payments": 0.01,
+        "workersTotal": worker_count,
+        "workers": {
+            worker_name(index): {"hr": 1.35e12, "offline": False}
+            for index in range(worker_count)
+        },
+    }
+
+
+PAYLOAD_GENERATORS: dict[str, Callable[[int], Any]] = {
+    POOL_SOURCE_CK_POOL_KEY: _ckpool,
+    POOL_SOURCE_COIN_MINERS_KEY: _coin_miners,
+    POOL_SOURCE_F2_POOL_KEY: _f2_pool,
+    POOL_SOURCE_MINING_CORE_KEY: _mining_core,
+    POOL_SOURCE_MINING_DUTCH_KEY: _mining_dutch,
+    POOL_SOURCE_PUBLIC_POOL_KEY: _public_pool,
+    POOL_SOURCE_SOLO_POOL_KEY: _solo_pool,
+}
+
+
+def generate_payload(pool_key: str, worker_count: int) -> Any:
+    """Generate the response of a pool with the given number of workers."""
+    return PAYLOAD_GENERATORS[pool_key](worker_count)
+
+
+def generate_body(pool_key: str, worker_count: int) -> bytes:
+    """Generate the encoded response of a pool with the given number of workers."""
+    return json.dumps(generate_payload(pool_key, worker_count)).encode()
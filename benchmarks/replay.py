@@ -0,0 +1,73 @@
+"""Replay of captured pool responses.
+
+Feeds the responses captured with the "Capture pool responses" option
+through ``async_get_data`` of the matching client, measuring them like the
+parser benchmarks. Copy the ``miner_pool_stats/corpus`` folder of the Home
+Assistant configuration directory and run from the repository root:
+
+    python -m benchmarks.replay corpus --save replay-baseline.json
+    python -m benchmarks.replay corpus --compare replay-baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from pathlib import Path
+import sys
+
+from custom_components.miner_pool_stats.capture import (
+    REDACTED_ADDRESS,
+    REDACTED_API_KEY,
+    load_corpus,
+)
+from custom_components.miner_pool_stats.const import CONF_API_KEY, CONF_COIN_KEY
+
+from .baseline import add_baseline_arguments, check_baseline
+from .common import PayloadTransport, async_benchmark_hass, async_create_client
+from .parsers import (
+    COMPARED_FIELDS,
+    ParserResult,
+    as_results,
+    async_benchmark,
+    print_result,
+)
+from .payloads import get_config_data
+
+
+async def async_run(directory: Path, rounds: int) -> dict[str, ParserResult]:
+    """Benchmark the clients with every captured response."""
+    results: dict[str, ParserResult] = {}
+    async with async_benchmark_hass() as (hass, transport):
+        assert isinstance(transport, PayloadTransport)
+        for captured in load_corpus(directory):
+            # failed requests raise before parsing
+            if captured.status != 200:
+                continue
+            client = await async_create_client(
+                hass,
+                get_config_data(captured.pool_key, address=REDACTED_ADDRESS)
+                | {CONF_COIN_KEY: captured.coin_key, CONF_API_KEY: REDACTED_API_KEY},
+            )
+            name = f"{captured.pool_key}/{captured.captured_at}"
+            results[name] = await async_benchmark(
+                client, transport, captured.body.encode(), rounds
+            )
+            print_result(name, results[name])
+    return results
+
+
+def main() -> int:
+    """Run the replay benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("corpus", type=Path, help="folder of captured responses")
+    parser.add_argument("--rounds", type=int, default=5)
+    add_baseline_arguments(parser)
+    args = parser.parse_args()
+
+    results = asyncio.run(async_run(args.corpus, args.rounds))
+    return check_baseline(args, as_results(results), COMPARED_FIELDS)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
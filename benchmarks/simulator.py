@@ -0,0 +1,257 @@
+"""Local stand-in for the pool APIs called by the Miner Pool Stats clients.
+
+Every pool answers with a synthetic response of the configured number of
+workers, after an optional latency with jitter, and fails a share of the
+requests with a server error or a 429 rate limit. Self-hosted pools
+(Mining Core, Public Pool) can use the simulator url as their pool url, and
+Mining Core entries with WebSocket notifications receive ``hashrateupdated``
+and ``blockfound`` messages from its ``/notifications`` relay.
+Requests of the hosted pools are sent to the simulator by
+``SimulatorTransport``, which moves the pool host into the path. Run it on
+its own to point a Home Assistant instance at it:
+
+    python -m benchmarks.simulator --port 8080 --workers 100 --latency 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+from collections.abc import Awaitable, Callable
+import contextlib
+from dataclasses import dataclass
+import random
+
+from aiohttp import ClientSession, ClientTimeout, web
+from yarl import URL
+
+from custom_components.miner_pool_stats.const import (
+    POOL_SOURCE_CK_POOL_KEY,
+    POOL_SOURCE_COIN_MINERS_KEY,
+    POOL_SOURCE_F2_POOL_KEY,
+    POOL_SOURCE_MINING_CORE_KEY,
+    POOL_SOURCE_MINING_DUTCH_KEY,
+    POOL_SOURCE_PUBLIC_POOL_KEY,
+    POOL_SOURCE_SOLO_POOL_KEY,
+    CryptoCoin,
+)
+from custom_components.miner_pool_stats.transport import PoolResponse, PoolTransport
+
+from .payloads import ADDRESS, generate_body, worker_name
+
+# Paths of the pool APIs, the hosted pools are prefixed with their host
+POOL_ROUTES = {
+    POOL_SOURCE_CK_POOL_KEY: "/solo.ckpool.org/users/{address}",
+    POOL_SOURCE_COIN_MINERS_KEY: "/pool.coin-miners.info/api/walletEx",
+    POOL_SOURCE_F2_POOL_KEY: "/api.f2pool.com/{coin}/{address}",
+    POOL_SOURCE_MINING_CORE_KEY: "/api/pools/{coin}/miners/{address}",
+    POOL_SOURCE_MINING_DUTCH_KEY: "/www.mining-dutch.nl/pools/{coin}.php",
+    POOL_SOURCE_PUBLIC_POOL_KEY: "/api/client/{address}",
+    POOL_SOURCE_SOLO_POOL_KEY: "/{coin}.solopool.org/api/accounts/{address}",
+}
+
+# Path of the Mining Core WebSocket notification relay
+NOTIFICATIONS_ROUTE = "/notifications"
+
+
+@dataclass
+class SimulatorOptions:
+    """Behavior of the simulated pools."""
+
+    workers: int = 10
+    latency: float = 0.0  # seconds
+    jitter: float = 0.0  # seconds
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    seed: int | None = None
+    # notifications of the Mining Core relay
+    notify_interval: float = 1.0  # seconds
+    block_rate: float = 0.0  # share of the notifications reporting a block
+    pool_id: str = CryptoCoin.BTC.value
+    miner: str = ADDRESS
+
+
+class PoolSimulator:
+    """Serve synthetic responses for all pool APIs."""
+
+    def __init__(self, options: SimulatorOptions) -> None:
+        """Initialize the simulator."""
+        self.options = options
+        self.requests: Counter[str] = Counter()
+        self.responses: Counter[int] = Counter()
+        self.notifications: Counter[str] = Counter()
+        self._random = random.Random(options.seed)
+        self._bodies: dict[str, bytes] = {}
+        self._runner: web.AppRunner | None = None
+
+    def create_app(self) -> web.Application:
+        """Create the web application serving the pool APIs."""
+        app = web.Application()
+        app.add_routes(
+            web.get(path, self._create_handler(pool_key))
+            for pool_key, path in POOL_ROUTES.items()
+        )
+        app.router.add_get(NOTIFICATIONS_ROUTE, self._async_notify)
+        return app
+
+    def _create_handler(
+        self, pool_key: str
+    ) -> Callable[[web.Request], Awaitable[web.Response]]:
+        async def _async_handle(_request: web.Request) -> web.Response:
+            return await self._async_respond(pool_key)
+
+        return _async_handle
+
+    async def _async_respond(self, pool_key: str) -> web.Response:
+        """Answer a request after the simulated latency."""
+        options = self.options
+        self.requests[pool_key] += 1
+
+        delay = options.latency + self._random.uniform(-options.jitter, options.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        roll = self._random.random()
+        if roll < options.throttle_rate:
+            response = web.Response(status=429, headers={"Retry-After": "60"})
+        elif roll < options.throttle_rate + options.error_rate:
+            response = web.Response(status=500)
+        else:
+            # generated once, the workers of every address are the same
+            if (body := self._bodies.get(pool_key)) is None:
+                body = self._bodies[pool_key] = generate_body(pool_key, options.workers)
+            response = web.Response(body=body, content_type="application/json")
+
+        self.responses[response.status] += 1
+        return response
+
+    async def _async_notify(self, request: web.Request) -> web.WebSocketResponse:
+        """Send notifications of the Mining Core relay until the client leaves."""
+        options = self.options
+        ws = web.WebSocketResponse(heartbeat=30)
+        await ws.prepare(request)
+
+        block_height = 800_000
+        while not ws.closed:
+            await asyncio.sleep(options.notify_interval)
+            if self._random.random() < options.block_rate:
+                block_height += 1
+                notification = {
+                    "type": "blockfound",
+                    "poolId": options.pool_id,
+                    "miner": options.miner,
+                    "blockHeight": block_height,
+                }
+            else:
+                notification = {
+                    "type": "hashrateupdated",
+                    "poolId": options.pool_id,
+                    "miner": options.miner,
+                    "worker": worker_name(
+                        self._random.randrange(max(options.workers, 1))
+                    ),
+                    # H/s, around the hash rate of the polled responses
+                    "hashrate": 1.35e12 * self._random.uniform(0.8, 1.2),
+                }
+            with contextlib.suppress(ConnectionResetError):
+                await ws.send_json(notification)
+                self.notifications[notification["type"]] += 1
+
+        return ws
+
+    async def async_start(self, host: str = "127.0.0.1", port: int = 0) -> URL:
+        """Start serving, returns the url of the simulator."""
+        self._runner = web.AppRunner(self.create_app())
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+        bound_port = self._runner.addresses[0][1]
+        return URL.build(scheme="http", host=host, port=bound_port)
+
+    async def async_stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+class SimulatorTransport(PoolTransport):
+    """Transport sending the requests of the hosted pools to the simulator.
+
+    All simulated pools share one host, and so the request limit per host.
+    """
+
+    def __init__(self, session: ClientSession, *, simulator_url: URL) -> None:
+        """Initialize the transport."""
+        super().__init__(session)
+        self._simulator_url = simulator_url
+
+    async def async_get(
+        self,
+        url: str,
+        headers: dict[str, str] | None,
+        timeout: ClientTimeout,
+    ) -> PoolResponse:
+        """Send a GET request to the simulator."""
+        target = URL(url)
+        if target.host != self._simulator_url.host:
+            target = self._simulator_url.with_path(
+                f"/{target.host}{target.path}"
+            ).with_query(target.query)
+        return await super().async_get(str(target), headers, timeout)
+
+
+def add_simulator_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options of the simulator to a command line parser."""
+    parser.add_argument("--workers", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--notify-interval", type=float, default=1.0, help="seconds")
+    parser.add_argument("--block-rate", type=float, default=0.0)
+    parser.add_argument("--pool-id", default=CryptoCoin.BTC.value)
+    parser.add_argument("--miner", default=ADDRESS)
+
+
+def get_simulator_options(args: argparse.Namespace) -> SimulatorOptions:
+    """Get the options of the simulator from the parsed command line."""
+    return SimulatorOptions(
+        workers=args.workers,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        seed=args.seed,
+        notify_interval=args.notify_interval,
+        block_rate=args.block_rate,
+        pool_id=args.pool_id,
+        miner=args.miner,
+    )
+
+
+async def _async_serve(options: SimulatorOptions, host: str, port: int) -> None:
+    simulator = PoolSimulator(options)
+    url = await simulator.async_start(host, port)
+    print(f"Serving simulated pools at {url}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await simulator.async_stop()
+
+
+def main() -> None:
+    """Run the simulator until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    add_simulator_arguments(parser)
+    args = parser.parse_args()
+
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_async_serve(get_simulator_options(args), args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
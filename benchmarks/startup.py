@@ -0,0 +1,152 @@
+"""Startup time of the integration.
+
+Measures the import time of the integration in a fresh interpreter, with the
+Home Assistant modules it builds on already loaded as they are at startup.
+Then sets up 1, 50 and 500 config entries together, from creating their
+coordinators to creating their sensor entities, against a transport serving
+synthetic responses:
+
+    python -m benchmarks.startup --save startup-baseline.json
+    python -m benchmarks.startup --compare startup-baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Iterable
+import json
+from statistics import median
+import subprocess
+import sys
+from time import perf_counter
+from typing import Any
+from unittest.mock import patch
+
+from custom_components.miner_pool_stats.const import POOL_SOURCE_CK_POOL_KEY
+from custom_components.miner_pool_stats.coordinator import PoolCoordinator
+from custom_components.miner_pool_stats.pool import PoolClient
+from custom_components.miner_pool_stats.sensor import async_setup_entry
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.entity import Entity
+
+from .baseline import Results, add_baseline_arguments, check_baseline
+from .common import (
+    PayloadTransport,
+    async_benchmark_hass,
+    async_no_recorder,
+    create_config_entry,
+)
+from .payloads import PAYLOAD_GENERATORS, generate_body, get_config_data
+
+ENTRY_COUNTS = (1, 50, 500)
+
+# Fields of the results compared with the baseline
+COMPARED_FIELDS = ("import_ms", "setup_ms")
+
+# Run in a fresh interpreter, prints the import time and the loaded modules
+IMPORT_SCRIPT = """
+import importlib, json, sys, time
+import aiohttp
+import homeassistant.components.sensor
+import homeassistant.core
+import homeassistant.helpers.update_coordinator
+modules = set(sys.modules)
+start = time.perf_counter()
+importlib.import_module("custom_components.miner_pool_stats")
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "import_ms": elapsed * 1000,
+    "modules": sorted(set(sys.modules) - modules),
+}))
+"""
+
+
+def measure_import(rounds: int) -> dict[str, float]:
+    """Return the median import time of the integration and its new modules."""
+    samples = []
+    modules: list[str] = []
+    for _ in range(rounds):
+        output = subprocess.run(
+            [sys.executable, "-c", IMPORT_SCRIPT],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+        result = json.loads(output)
+        samples.append(result["import_ms"])
+        modules = result["modules"]
+
+    integration_modules = [
+        module for module in modules if module.startswith("custom_components.")
+    ]
+    print(
+        f"Import: {median(samples):.1f} ms, {len(modules)} new modules,"
+        f" integration modules: {', '.join(integration_modules)}"
+    )
+    return {"import_ms": median(samples), "modules": len(modules)}
+
+
+async def async_measure_setup(
+    entry_count: int, pool_key: str, workers: int
+) -> dict[str, float]:
+    """Return the time to set up the entries until their entities are created."""
+    async with async_benchmark_hass() as (hass, transport):
+        assert isinstance(transport, PayloadTransport)
+        transport.body = generate_body(pool_key, workers)
+        await dr.async_load(hass)
+        await er.async_load(hass)
+
+        entities = 0
+
+        def _async_add_entities(
+            new_entities: Iterable[Entity], *_args: Any, **_kwargs: Any
+        ) -> None:
+            nonlocal entities
+            entities += len(list(new_entities))
+
+        async def _async_setup_entry(index: int) -> None:
+            entry = create_config_entry(
+                get_config_data(pool_key, address=f"bc1qstartup{index:06d}")
+            )
+            coordinator = PoolCoordinator(hass, entry)
+            await coordinator.async_config_entry_first_refresh()
+            entry.runtime_data = coordinator
+            await async_setup_entry(hass, entry, _async_add_entities)
+
+        with patch.object(PoolClient, "_get_max_best_difficulty", async_no_recorder):
+            start = perf_counter()
+            await asyncio.gather(
+                *(_async_setup_entry(index) for index in range(entry_count))
+            )
+            setup_ms = (perf_counter() - start) * 1000
+
+    print(
+        f"Setup of {entry_count:>4} entries: {setup_ms:>9.1f} ms,"
+        f" {setup_ms / entry_count:>7.2f} ms per entry, {entities} entities"
+    )
+    return {"setup_ms": setup_ms, "entities": entities}
+
+
+def main() -> int:
+    """Run the startup benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, nargs="+", default=list(ENTRY_COUNTS))
+    parser.add_argument(
+        "--pool", choices=sorted(PAYLOAD_GENERATORS), default=POOL_SOURCE_CK_POOL_KEY
+    )
+    parser.add_argument("--workers", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=5)
+    add_baseline_arguments(parser)
+    args = parser.parse_args()
+
+    results: Results = {"import": measure_import(args.rounds)}
+    for entry_count in args.entries:
+        results[f"setup/{entry_count}"] = asyncio.run(
+            async_measure_setup(entry_count, args.pool, args.workers)
+        )
+    return check_baseline(args, results, COMPARED_FIELDS)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
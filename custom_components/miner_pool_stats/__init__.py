@@ -4,10 +4,34 @@ from __future__ import annotations
 
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
+from .batch import BATCH_POOL_SOURCES
+from .const import (
+    CONF_BATCH_REQUESTS,
+    CONF_POOL_KEY,
+    CONF_PUSH_NOTIFICATIONS,
+    CONF_WEBHOOK,
+    CONF_WEBHOOK_ID,
+    DOMAIN,
+    POOL_SOURCE_MINING_CORE_KEY,
+)
 from .coordinator import PoolConfigEntry, PoolCoordinator
+from .mining_core_push import MiningCoreNotificationListener
+from .pool import PoolInitData
+from .services import async_setup_services
+from .webhook import async_register_webhook
 
-_PLATFORMS: list[Platform] = [Platform.SENSOR]
+_PLATFORMS: list[Platform] = [Platform.BINARY_SENSOR, Platform.SENSOR]
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Miner Pool Stats services."""
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: PoolConfigEntry) -> bool:
@@ -20,9 +44,34 @@ async def async_setup_entry(hass: HomeAssistant, entry: PoolConfigEntry) -> bool
 
     await hass.config_entries.async_forward_entry_setups(entry, _PLATFORMS)
 
+    # keep polling as a fallback while the pool pushes its notifications
+    if entry.data[CONF_POOL_KEY] == POOL_SOURCE_MINING_CORE_KEY and entry.options.get(
+        CONF_PUSH_NOTIFICATIONS, False
+    ):
+        MiningCoreNotificationListener(
+            hass, entry, coordinator, PoolInitData(dict(entry.data))
+        ).async_start()
+
+    if entry.data[CONF_POOL_KEY] in BATCH_POOL_SOURCES and entry.options.get(
+        CONF_BATCH_REQUESTS, False
+    ):
+        entry.async_on_unload(coordinator.async_join_batch())
+
+    if entry.options.get(CONF_WEBHOOK, False):
+        async_register_webhook(hass, entry, entry.options[CONF_WEBHOOK_ID])
+
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: PoolConfigEntry) -> None:
+    """Apply the changed options in place or reload the config entry."""
+    if entry.runtime_data.async_update_options(entry.options):
+        return
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: PoolConfigEntry) -> bool:
     """Unload a config entry."""
     return await hass.config_entries.async_unload_platforms(entry, _PLATFORMS)
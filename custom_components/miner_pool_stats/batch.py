@@ -0,0 +1,99 @@
+"""Aligned polling of self-hosted pool servers for the Miner Pool Stats integration."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN, POOL_SOURCE_MINING_CORE_KEY, POOL_SOURCE_PUBLIC_POOL_KEY
+
+if TYPE_CHECKING:
+    from .coordinator import PoolCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Pool sources hosting many addresses on a server configured by the user
+BATCH_POOL_SOURCES = {POOL_SOURCE_MINING_CORE_KEY, POOL_SOURCE_PUBLIC_POOL_KEY}
+
+DATA_BATCHES: HassKey[dict[tuple[str, str], PoolBatch]] = HassKey(f"{DOMAIN}_batches")
+
+
+class PoolBatch:
+    """Align the refreshes of all addresses of one pool server on one timer.
+
+    The member coordinators stop polling on their own, the batch refreshes
+    them all at once over the pooled connections of the shared transport,
+    which caps the concurrent requests to the server. Each address is still
+    fetched with its own request: neither Mining Core nor Public Pool serves
+    the workers of many addresses in one response.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, key: tuple[str, str], update_interval: timedelta
+    ) -> None:
+        """Initialize the batch."""
+        self._hass = hass
+        self._key = key
+        self._update_interval = update_interval
+        self._coordinators: dict[str, PoolCoordinator] = {}
+        self._unsub_interval: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add(self, coordinator: PoolCoordinator) -> CALLBACK_TYPE:
+        """Add a coordinator to the batch, returns a callback removing it."""
+
+        entry_id = coordinator.config_entry.entry_id
+        self._coordinators[entry_id] = coordinator
+
+        if self._unsub_interval is None:
+            self._unsub_interval = async_track_time_interval(
+                self._hass,
+                self._async_refresh,
+                self._update_interval,
+                name=f"{DOMAIN} batch {self._key[1]}",
+                cancel_on_shutdown=True,
+            )
+
+        @callback
+        def _async_remove() -> None:
+            self._coordinators.pop(entry_id, None)
+            if self._coordinators:
+                return
+            if self._unsub_interval is not None:
+                self._unsub_interval()
+                self._unsub_interval = None
+            self._hass.data[DATA_BATCHES].pop(self._key, None)
+
+        return _async_remove
+
+    async def _async_refresh(self, _now: datetime) -> None:
+        """Refresh all member coordinators."""
+        _LOGGER.debug(
+            "Refreshing %s addresses of %s", len(self._coordinators), self._key[1]
+        )
+        await asyncio.gather(
+            *(
+                coordinator.async_refresh()
+                for coordinator in list(self._coordinators.values())
+                # pushed data keeps these coordinators up to date
+                if not coordinator.push_active
+            )
+        )
+
+
+@callback
+def async_get_batch(
+    hass: HomeAssistant, pool_key: str, pool_url: str, update_interval: timedelta
+) -> PoolBatch:
+    """Get the batch of a pool server, shared by its config entries."""
+    batches = hass.data.setdefault(DATA_BATCHES, {})
+    key = (pool_key, pool_url.rstrip("/").lower())
+    if (batch := batches.get(key)) is None:
+        batch = batches[key] = PoolBatch(hass, key, update_interval)
+    return batch
@@ -0,0 +1,70 @@
+"""The Pool binary sensor platform."""
+
+from __future__ import annotations
+
+from homeassistant.components.binary_sensor import (
+    DOMAIN as BINARY_SENSOR_DOMAIN,
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+)
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+
+from .const import KEY_ONLINE
+from .coordinator import PoolConfigEntry, PoolCoordinator
+from .entity import PoolAddressWorkerDeviceEntity
+from .pool import PoolInitData
+
+# Coordinator is used to centralize the data updates.
+PARALLEL_UPDATES = 0
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: PoolConfigEntry,
+    async_add_entities: AddConfigEntryEntitiesCallback,
+) -> None:
+    """Set up the Miner Pool binary sensor platform."""
+    coordinator = config_entry.runtime_data
+
+    async_add_entities(
+        PoolAddressWorkerOnlineEntity(coordinator, config_entry, worker.name)
+        for worker in coordinator.data.worker_list
+    )
+
+
+class PoolAddressWorkerOnlineEntity(PoolAddressWorkerDeviceEntity, BinarySensorEntity):
+    """Representation of the connectivity of a Pool Address Worker."""
+
+    _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_translation_key = KEY_ONLINE
+
+    def __init__(
+        self,
+        coordinator: PoolCoordinator,
+        config_entry: PoolConfigEntry,
+        worker_name: str,
+    ) -> None:
+        """Initialize the Pool Address Worker binary sensor."""
+        pool_config = PoolInitData(dict(config_entry.data))
+        super().__init__(coordinator, config_entry, pool_config, worker_name)
+        self._attr_unique_id = f"{config_entry.entry_id}-{worker_name}-{KEY_ONLINE}"
+        self.entity_id = (
+            f"{BINARY_SENSOR_DOMAIN}.{pool_config.unique_id}_{worker_name}_{KEY_ONLINE}"
+        )
+        self._update_properties()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_properties()
+        self.async_write_ha_state()
+
+    @callback
+    def _update_properties(self) -> None:
+        """Update binary sensor properties."""
+        # a worker missing from the data is offline
+        worker = self.coordinator.get_worker(self.worker_name)
+        self._attr_is_on = worker is not None and worker.is_online
@@ -0,0 +1,252 @@
+"""Bulk import of pool addresses for the Miner Pool Stats integration."""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util.yaml import parse_yaml
+
+from .coin_discovery import async_get_coin_discovery
+from .const import (
+    CONF_ACCOUNT_ID,
+    CONF_ADDRESS,
+    CONF_API_KEY,
+    CONF_COIN_KEY,
+    CONF_POOL_KEY,
+    CONF_POOL_NAME,
+    CONF_POOL_URL,
+    POOL_SOURCE_CK_POOL_KEY,
+    POOL_SOURCE_CK_POOL_NAME,
+    POOL_SOURCE_COIN_MINERS_KEY,
+    POOL_SOURCE_COIN_MINERS_NAME,
+    POOL_SOURCE_F2_POOL_COINS,
+    POOL_SOURCE_F2_POOL_KEY,
+    POOL_SOURCE_F2_POOL_NAME,
+    POOL_SOURCE_MINING_CORE_KEY,
+    POOL_SOURCE_MINING_CORE_NAME,
+    POOL_SOURCE_MINING_DUTCH_KEY,
+    POOL_SOURCE_MINING_DUTCH_NAME,
+    POOL_SOURCE_MINING_DUTCH_POOL_COINS,
+    POOL_SOURCE_PUBLIC_POOL_KEY,
+    POOL_SOURCE_PUBLIC_POOL_NAME,
+    POOL_SOURCE_SOLO_POOL_COINS,
+    POOL_SOURCE_SOLO_POOL_KEY,
+    POOL_SOURCE_SOLO_POOL_NAME,
+    CryptoCoin,
+)
+
+# Columns of a row without a header line
+BULK_IMPORT_FIELDS = ("pool", "coin", "address", "api_key", "pool_url")
+
+DEFAULT_PUBLIC_POOL_URL = "https://public-pool.io:40557/"
+
+
+@dataclass(frozen=True, kw_only=True)
+class _BulkPoolSource:
+    """Pool source that can be imported in bulk."""
+
+    name: str
+    # coins of the pool, None if the pool reports its coin
+    coins: tuple[CryptoCoin, ...] | None
+    # the coin is a pool id of the instance, checked against its pools
+    pool_ids: bool = False
+    api_key: bool = False
+    pool_url: str | None = None
+
+
+# Pool sources configured with an address alone, the custom JSON and local
+# miner sources need more settings than a row holds
+BULK_POOL_SOURCES: dict[str, _BulkPoolSource] = {
+    POOL_SOURCE_COIN_MINERS_KEY: _BulkPoolSource(
+        name=POOL_SOURCE_COIN_MINERS_NAME, coins=None
+    ),
+    POOL_SOURCE_PUBLIC_POOL_KEY: _BulkPoolSource(
+        name=POOL_SOURCE_PUBLIC_POOL_NAME,
+        coins=(CryptoCoin.BTC,),
+        pool_url=DEFAULT_PUBLIC_POOL_URL,
+    ),
+    POOL_SOURCE_F2_POOL_KEY: _BulkPoolSource(
+        name=POOL_SOURCE_F2_POOL_NAME,
+        coins=tuple(POOL_SOURCE_F2_POOL_COINS),
+        api_key=True,
+    ),
+    POOL_SOURCE_SOLO_POOL_KEY: _BulkPoolSource(
+        name=POOL_SOURCE_SOLO_POOL_NAME, coins=tuple(POOL_SOURCE_SOLO_POOL_COINS)
+    ),
+    POOL_SOURCE_CK_POOL_KEY: _BulkPoolSource(
+        name=POOL_SOURCE_CK_POOL_NAME, coins=(CryptoCoin.BTC,)
+    ),
+    POOL_SOURCE_MINING_DUTCH_KEY: _BulkPoolSource(
+        name=POOL_SOURCE_MINING_DUTCH_NAME,
+        coins=tuple(POOL_SOURCE_MINING_DUTCH_POOL_COINS),
+        api_key=True,
+    ),
+    POOL_SOURCE_MINING_CORE_KEY: _BulkPoolSource(
+        name=POOL_SOURCE_MINING_CORE_NAME,
+        coins=None,
+        pool_ids=True,
+        pool_url="",
+    ),
+}
+
+
+@dataclass
+class BulkImportRow:
+    """A row of a bulk import, with its config data or why it is invalid."""
+
+    line: int
+    label: str
+    config_data: dict[str, Any] | None = None
+    error: str | None = None
+
+
+def parse_bulk_import(text: str) -> list[BulkImportRow]:
+    """Parse a YAML list or CSV lines of pool, coin, address, api_key and pool_url.
+
+    Raises ValueError when the text holds no rows, a row that does not fit
+    its pool is returned with an error instead.
+    """
+    try:
+        parsed = parse_yaml(text)
+    except HomeAssistantError:
+        parsed = None
+
+    if isinstance(parsed, list):
+        if not all(isinstance(item, dict) for item in parsed):
+            raise ValueError("Every YAML list item must be a mapping")
+        values = [
+            (
+                line,
+                {
+                    str(key): str(value)
+                    for key, value in item.items()
+                    if value is not None
+                },
+            )
+            for line, item in enumerate(parsed, 1)
+        ]
+    else:
+        values = list(_parse_csv(text))
+
+    if not values:
+        raise ValueError("No rows to import")
+
+    return [_create_row(line, row) for line, row in values]
+
+
+def _parse_csv(text: str) -> list[tuple[int, dict[str, str]]]:
+    """Parse CSV lines with an optional header line, skipping comments."""
+    lines = [
+        (line, value)
+        for line, value in enumerate(text.splitlines(), 1)
+        if value.strip() and not value.lstrip().startswith("#")
+    ]
+    rows = [
+        (line, [cell.strip() for cell in cells])
+        for (line, _), cells in zip(
+            lines, csv.reader(value for _, value in lines), strict=True
+        )
+    ]
+
+    fields: tuple[str, ...] = BULK_IMPORT_FIELDS
+    if rows and {"pool", "address"} <= {cell.lower() for cell in rows[0][1]}:
+        fields = tuple(cell.lower() for cell in rows.pop(0)[1])
+
+    return [
+        (line, {key: cell for key, cell in zip(fields, cells, strict=False) if cell})
+        for line, cells in rows
+    ]
+
+
+def _create_row(line: int, values: dict[str, str]) -> BulkImportRow:
+    """Create the config data of a row as the config flow steps do."""
+    pool_key = values.get("pool", "").lower().replace(" ", "_")
+    address = values.get("address", "")
+    row = BulkImportRow(line, f"{line}: {address or '-'}")
+
+    if (source := BULK_POOL_SOURCES.get(pool_key)) is None:
+        row.error = f"Unsupported pool '{values.get('pool', '')}'"
+        return row
+    if not address:
+        row.error = "Missing address"
+        return row
+
+    config_data: dict[str, Any] = {
+        CONF_POOL_KEY: pool_key,
+        CONF_POOL_NAME: source.name,
+        CONF_ADDRESS: address,
+    }
+
+    if source.pool_ids:
+        if not (pool_id := values.get("coin", "").strip()):
+            row.error = f"Missing coin (pool ID) for {source.name}"
+            return row
+        config_data[CONF_COIN_KEY] = pool_id
+    elif source.coins is not None:
+        coin = values.get("coin", "").lower()
+        if not coin and len(source.coins) == 1:
+            coin = source.coins[0].value
+        if coin not in {coin.value for coin in source.coins}:
+            row.error = f"Unsupported coin '{values.get('coin', '')}' for {source.name}"
+            return row
+        config_data[CONF_COIN_KEY] = coin
+
+    if source.api_key:
+        if not (api_key := values.get("api_key")):
+            row.error = f"Missing api_key for {source.name}"
+            return row
+        config_data[CONF_API_KEY] = api_key
+
+    if source.pool_url is not None:
+        if not (pool_url := values.get("pool_url") or source.pool_url):
+            row.error = f"Missing pool_url for {source.name}"
+            return row
+        config_data[CONF_POOL_URL] = pool_url
+
+    if pool_key == POOL_SOURCE_MINING_DUTCH_KEY:
+        # the address of a Mining Dutch entry is the account id
+        config_data[CONF_ACCOUNT_ID] = address
+
+    row.config_data = config_data
+    return row
+
+
+async def async_check_pool_ids(hass: HomeAssistant, rows: list[BulkImportRow]) -> None:
+    """Check the pool ids of the rows against the pools discovered on their instance.
+
+    Rows of an instance whose pools cannot be listed are left to the validation
+    of the entry, which reports why the instance cannot be reached.
+    """
+    checked = [
+        row
+        for row in rows
+        if row.config_data is not None
+        and BULK_POOL_SOURCES[row.config_data[CONF_POOL_KEY]].pool_ids
+    ]
+    discovery = async_get_coin_discovery(hass)
+    # the discovery shares one request per instance
+    results = await asyncio.gather(
+        *(
+            discovery.async_get_mining_core_pools(row.config_data[CONF_POOL_URL])
+            for row in checked
+            if row.config_data is not None
+        )
+    )
+
+    for row, pools in zip(checked, results, strict=True):
+        if row.config_data is None or pools is None:
+            continue
+        pool_id = row.config_data[CONF_COIN_KEY]
+        pool_ids = {pool.id.lower(): pool.id for pool in pools}
+        if (known_id := pool_ids.get(pool_id.lower())) is None:
+            row.error = (
+                f"Unknown pool ID '{pool_id}' at {row.config_data[CONF_POOL_URL]}"
+            )
+            row.config_data = None
+        else:
+            row.config_data[CONF_COIN_KEY] = known_id
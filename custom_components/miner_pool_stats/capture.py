@@ -0,0 +1,119 @@
+"""Capture of pool responses for the Miner Pool Stats integration."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+import json
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.dt import utcnow
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .pool import PoolInitData
+    from .transport import PoolResponse
+
+_LOGGER = logging.getLogger(__name__)
+
+CAPTURE_DIRECTORY = "corpus"
+
+# Responses captured per config entry until the integration is reloaded
+CAPTURE_MAX_RESPONSES = 100
+
+REDACTED_ADDRESS = "REDACTED_ADDRESS"
+REDACTED_API_KEY = "REDACTED_API_KEY"
+
+
+@dataclass
+class CapturedResponse:
+    """Representation of a captured pool response."""
+
+    pool_key: str
+    coin_key: str
+    url: str
+    status: int
+    elapsed_ms: float
+    captured_at: str
+    body: str
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CapturedResponse:
+        """Create an instance from a dictionary in the shape of this class."""
+        return cls(**data)
+
+
+class ResponseCapture:
+    """Write the responses of a pool to the corpus, scrubbing the address and keys.
+
+    The files are written to ``<config>/miner_pool_stats/corpus/<pool_key>``
+    and can be replayed by the benchmarks.
+    """
+
+    def __init__(self, hass: HomeAssistant, pool_config: PoolInitData) -> None:
+        """Initialize the capture."""
+        self._hass = hass
+        self._pool_config = pool_config
+        self._directory = Path(
+            hass.config.path(DOMAIN, CAPTURE_DIRECTORY, pool_config.pool_key)
+        )
+        self._replacements = [
+            (secret, placeholder)
+            for secret, placeholder in (
+                (pool_config.address, REDACTED_ADDRESS),
+                (pool_config.api_key, REDACTED_API_KEY),
+            )
+            if secret
+        ]
+        self._count = 0
+
+    def redact(self, text: str) -> str:
+        """Replace the address and the API key in a text."""
+        for secret, placeholder in self._replacements:
+            text = text.replace(secret, placeholder)
+        return text
+
+    @callback
+    def async_add(self, url: str, response: PoolResponse, elapsed: float) -> None:
+        """Write a response to the corpus in the executor."""
+        if self._count >= CAPTURE_MAX_RESPONSES:
+            return
+        self._count += 1
+
+        captured_at = utcnow()
+        captured = CapturedResponse(
+            pool_key=self._pool_config.pool_key,
+            coin_key=self._pool_config.coin_key,
+            url=self.redact(url),
+            status=response.status,
+            elapsed_ms=elapsed * 1000,
+            captured_at=captured_at.isoformat(),
+            body=self.redact(response.body.decode(errors="replace")),
+        )
+        path = self._directory / f"{captured_at:%Y%m%dT%H%M%S%f}.json"
+        self._hass.async_add_executor_job(_write_response, path, captured)
+
+        if self._count == CAPTURE_MAX_RESPONSES:
+            _LOGGER.info(
+                "Captured %s responses of %s to %s",
+                self._count,
+                self._pool_config.title,
+                self._directory,
+            )
+
+
+def _write_response(path: Path, captured: CapturedResponse) -> None:
+    """Write a captured response."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(asdict(captured)), encoding="utf-8")
+
+
+def load_corpus(directory: Path) -> list[CapturedResponse]:
+    """Load the captured responses of a corpus directory by pool and capture time."""
+    return [
+        CapturedResponse.from_dict(json.loads(path.read_text(encoding="utf-8")))
+        for path in sorted(directory.rglob("*.json"))
+    ]
@@ -0,0 +1,104 @@
+"""Discovery of the coins of self-hosted pools for the Miner Pool Stats integration."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import logging
+from time import monotonic
+from typing import Any
+
+from aiohttp import ClientError, ClientTimeout
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.json import json_loads
+
+from .const import DOMAIN
+from .transport import async_get_transport
+
+_LOGGER = logging.getLogger(__name__)
+
+# Time the pools of an instance are reused by the config flows in seconds
+DISCOVERY_TTL: float = 60 * 60
+
+# Time the instance has to answer in seconds
+DISCOVERY_TIMEOUT = ClientTimeout(total=10)
+
+DATA_COIN_DISCOVERY: HassKey[CoinDiscovery] = HassKey(f"{DOMAIN}_coin_discovery")
+
+
+@dataclass(frozen=True)
+class DiscoveredPool:
+    """A pool of a Mining Core instance."""
+
+    id: str
+    coin: str
+
+
+class CoinDiscovery:
+    """Cache the pools of Mining Core instances for the config flows.
+
+    The pools are kept per pool URL for the TTL, flows asking for an instance
+    that is being fetched wait for that request instead of sending their own.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the discovery."""
+        self._hass = hass
+        self._cache: dict[str, tuple[float, list[DiscoveredPool]]] = {}
+        self._pending: dict[str, asyncio.Task[list[DiscoveredPool] | None]] = {}
+
+    async def async_get_mining_core_pools(
+        self, pool_url: str
+    ) -> list[DiscoveredPool] | None:
+        """Get the pools of an instance, None when they cannot be fetched."""
+        pool_url = pool_url.rstrip("/")
+
+        cached = self._cache.get(pool_url)
+        if cached is not None and monotonic() - cached[0] < DISCOVERY_TTL:
+            return cached[1]
+
+        if (task := self._pending.get(pool_url)) is None:
+            task = self._pending[pool_url] = self._hass.async_create_task(
+                self._async_fetch(pool_url), eager_start=True
+            )
+            task.add_done_callback(lambda _: self._pending.pop(pool_url, None))
+        return await asyncio.shield(task)
+
+    async def _async_fetch(self, pool_url: str) -> list[DiscoveredPool] | None:
+        """Fetch the pools of an instance, failures are not cached."""
+        url = f"{pool_url}/api/pools"
+        try:
+            response = await async_get_transport(self._hass).async_get(
+                url, None, DISCOVERY_TIMEOUT
+            )
+            if response.status != 200:
+                raise ValueError(f"Status code {response.status}")
+            pools = [
+                DiscoveredPool(
+                    str(pool["id"]),
+                    _get_coin_symbol(pool),
+                )
+                for pool in json_loads(response.body)["pools"]
+            ]
+        except (ClientError, TimeoutError, KeyError, TypeError, ValueError) as error:
+            _LOGGER.debug("Discovering the pools of %s failed: %s", url, error)
+            return None
+
+        self._cache[pool_url] = (monotonic(), pools)
+        return pools
+
+
+def _get_coin_symbol(pool: dict[str, Any]) -> str:
+    """Get the symbol of the coin a pool mines, or its id when not reported."""
+    coin = pool.get("coin") or {}
+    return str(coin.get("symbol") or coin.get("type") or pool["id"])
+
+
+@callback
+def async_get_coin_discovery(hass: HomeAssistant) -> CoinDiscovery:
+    """Get the discovery shared by the config flows."""
+    if (discovery := hass.data.get(DATA_COIN_DISCOVERY)) is None:
+        discovery = hass.data[DATA_COIN_DISCOVERY] = CoinDiscovery(hass)
+    return discovery
@@ -2,35 +2,85 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.components import webhook
+from homeassistant.config_entries import (
+    SOURCE_IMPORT,
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.selector import (
     SelectOptionDict,
     SelectSelector,
     SelectSelectorConfig,
     SelectSelectorMode,
+    TextSelector,
+    TextSelectorConfig,
 )
 
+from .batch import BATCH_POOL_SOURCES
+from .bulk_import import BulkImportRow, async_check_pool_ids, parse_bulk_import
+from .coin_discovery import async_get_coin_discovery
 from .const import (
     CONF_ACCOUNT_ID,
     CONF_ADDRESS,
     CONF_API_KEY,
+    CONF_BATCH_REQUESTS,
+    CONF_BEST_DIFFICULTY_PATH,
+    CONF_BULK_ENTRIES,
+    CONF_CAPTURE_RESPONSES,
     CONF_COIN_KEY,
     CONF_COIN_NAME,
+    CONF_CURRENT_BALANCE_PATH,
+    CONF_DETECTED_POOL,
+    CONF_HASH_RATE_DEADBAND,
+    CONF_HASH_RATE_PATH,
+    CONF_HASH_RATE_UNIT,
+    CONF_HOSTS,
+    CONF_JSON_URL,
+    CONF_LONG_TERM_STATISTICS,
+    CONF_LOOP_WATCHDOG,
+    CONF_LOOP_WATCHDOG_THRESHOLD,
+    CONF_ONLINE_THRESHOLD,
     CONF_POOL_KEY,
     CONF_POOL_NAME,
     CONF_POOL_URL,
+    CONF_PUSH_NOTIFICATIONS,
+    CONF_REQUEST_TIMEOUT,
     CONF_TITLE,
+    CONF_TOTAL_PAID_PATH,
     CONF_UNIQUE_ID,
+    CONF_UPDATE_INTERVAL,
+    CONF_WEBHOOK,
+    CONF_WEBHOOK_ID,
+    CONF_WORKER_NAME_PATH,
+    CONF_WORKER_STATE_DEBOUNCE,
+    CONF_WORKERS_PATH,
+    DEFAULT_HASH_RATE_DEADBAND,
+    DEFAULT_LOOP_WATCHDOG_THRESHOLD,
+    DEFAULT_ONLINE_THRESHOLD,
+    DEFAULT_WORKER_STATE_DEBOUNCE,
     DOMAIN,
+    POOL_SOURCE_AUTO_DETECT_KEY,
+    POOL_SOURCE_AUTO_DETECT_NAME,
+    POOL_SOURCE_BULK_IMPORT_KEY,
+    POOL_SOURCE_BULK_IMPORT_NAME,
+    POOL_SOURCE_CGMINER_KEY,
+    POOL_SOURCE_CGMINER_NAME,
     POOL_SOURCE_CK_POOL_KEY,
     POOL_SOURCE_CK_POOL_NAME,
     POOL_SOURCE_COIN_MINERS_KEY,
     POOL_SOURCE_COIN_MINERS_NAME,
+    POOL_SOURCE_CUSTOM_JSON_KEY,
+    POOL_SOURCE_CUSTOM_JSON_NAME,
     POOL_SOURCE_F2_POOL_COINS,
     POOL_SOURCE_F2_POOL_KEY,
     POOL_SOURCE_F2_POOL_NAME,
@@ -47,8 +97,13 @@ from .const import (
     POOL_SOURCE_SOLO_POOL_NAME,
     CryptoCoin,
 )
+from .definition import PoolDefinitionError
+from .detect import DetectedPool, async_detect_pools
 from .factory import PoolFactory
+from .hash import HashRateUnit
 from .pool import PoolConnectionError, PoolInitData
+from .pool_cgminer import parse_hosts
+from .pool_custom_json import get_url_id, is_valid_url_template
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -85,6 +140,22 @@ STEP_POOL_SOURCE_SCHEMA = vol.Schema(
                         value=POOL_SOURCE_MINING_CORE_KEY,
                         label=POOL_SOURCE_MINING_CORE_NAME,
                     ),
+                    SelectOptionDict(
+                        value=POOL_SOURCE_CUSTOM_JSON_KEY,
+                        label=POOL_SOURCE_CUSTOM_JSON_NAME,
+                    ),
+                    SelectOptionDict(
+                        value=POOL_SOURCE_CGMINER_KEY,
+                        label=POOL_SOURCE_CGMINER_NAME,
+                    ),
+                    SelectOptionDict(
+                        value=POOL_SOURCE_AUTO_DETECT_KEY,
+                        label=POOL_SOURCE_AUTO_DETECT_NAME,
+                    ),
+                    SelectOptionDict(
+                        value=POOL_SOURCE_BULK_IMPORT_KEY,
+                        label=POOL_SOURCE_BULK_IMPORT_NAME,
+                    ),
                 ],
                 mode=SelectSelectorMode.DROPDOWN,
             )
@@ -98,6 +169,59 @@ STEP_PUBLIC_POOL_DATA_SCHEMA = vol.Schema(
     }
 )
 
+STEP_MINING_CORE_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_POOL_URL, default="http://umbrel.local:4000"): str,
+    }
+)
+
+STEP_CUSTOM_JSON_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_POOL_NAME, default=POOL_SOURCE_CUSTOM_JSON_NAME): str,
+        vol.Required(CONF_JSON_URL): str,
+        vol.Required(CONF_COIN_KEY, default=CryptoCoin.BTC.value): SelectSelector(
+            SelectSelectorConfig(
+                options=[
+                    SelectOptionDict(value=coin.value, label=coin.name)
+                    for coin in CryptoCoin
+                ],
+                mode=SelectSelectorMode.DROPDOWN,
+            )
+        ),
+        vol.Optional(CONF_API_KEY): str,
+        vol.Optional(CONF_WORKERS_PATH): str,
+        vol.Optional(CONF_WORKER_NAME_PATH): str,
+        vol.Required(CONF_HASH_RATE_PATH): str,
+        vol.Required(CONF_HASH_RATE_UNIT, default=HashRateUnit.H.name): SelectSelector(
+            SelectSelectorConfig(
+                options=[
+                    SelectOptionDict(value=unit.name, label=str(unit))
+                    for unit in HashRateUnit
+                ],
+                mode=SelectSelectorMode.DROPDOWN,
+            )
+        ),
+        vol.Optional(CONF_BEST_DIFFICULTY_PATH): str,
+        vol.Optional(CONF_CURRENT_BALANCE_PATH): str,
+        vol.Optional(CONF_TOTAL_PAID_PATH): str,
+    }
+)
+
+STEP_CGMINER_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_ADDRESS): str,
+        vol.Required(CONF_HOSTS): TextSelector(TextSelectorConfig(multiline=True)),
+    }
+)
+
+STEP_BULK_IMPORT_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_BULK_ENTRIES): TextSelector(
+            TextSelectorConfig(multiline=True)
+        ),
+    }
+)
+
 STEP_WALLET_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_ADDRESS): str,
@@ -105,6 +229,46 @@ STEP_WALLET_DATA_SCHEMA = vol.Schema(
 )
 
 
+async def async_validate_config(
+    hass: HomeAssistant, config_data: dict[str, Any]
+) -> PoolInitData:
+    """Validate the config data allows us to connect and complete it."""
+
+    if CONF_TITLE not in config_data:
+        config_data[CONF_TITLE] = ""
+
+    if CONF_UNIQUE_ID not in config_data:
+        config_data[CONF_UNIQUE_ID] = ""
+
+    if CONF_COIN_KEY not in config_data:
+        config_data[CONF_COIN_KEY] = ""
+
+    if CONF_COIN_NAME not in config_data:
+        config_data[CONF_COIN_NAME] = ""
+
+    pool = await PoolFactory.async_get(hass, config_data)
+    init_data = await pool.async_initialize(config_data)
+
+    config_data.update(init_data)
+
+    try:
+        config_data[CONF_COIN_NAME] = CryptoCoin(config_data[CONF_COIN_KEY]).name
+    except ValueError:
+        config_data[CONF_COIN_NAME] = config_data[CONF_COIN_KEY]
+
+    config_data[CONF_TITLE] = (
+        f"{config_data[CONF_POOL_NAME]} - {config_data[CONF_COIN_NAME]} - {config_data[CONF_ADDRESS]}"
+    )
+    config_data[CONF_UNIQUE_ID] = (
+        f"{config_data[CONF_POOL_KEY]}_{config_data[CONF_COIN_KEY]}_{config_data[CONF_ADDRESS].lower()}"
+    )
+    if config_data[CONF_POOL_KEY] == POOL_SOURCE_CUSTOM_JSON_KEY:
+        # the same address can be configured on more than one custom pool
+        config_data[CONF_UNIQUE_ID] += f"_{get_url_id(config_data[CONF_JSON_URL])}"
+
+    return PoolInitData(config_data)
+
+
 class PoolConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Miner Pool Stats."""
 
@@ -113,43 +277,20 @@ class PoolConfigFlow(ConfigFlow, domain=DOMAIN):
     def __init__(self) -> None:
         """Initialize."""
         self._data: dict[str, Any] = {}
+        self._detected: dict[str, DetectedPool] = {}
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> PoolOptionsFlow:
+        """Get the options flow for this handler."""
+        return PoolOptionsFlow()
 
     async def validate_input(self) -> PoolInitData:
         """Validate the user input allows us to connect.
 
         Data has the keys from STEP_USER_DATA_SCHEMA with values provided by the user.
         """
-
-        if CONF_TITLE not in self._data:
-            self._data[CONF_TITLE] = ""
-
-        if CONF_UNIQUE_ID not in self._data:
-            self._data[CONF_UNIQUE_ID] = ""
-
-        if CONF_COIN_KEY not in self._data:
-            self._data[CONF_COIN_KEY] = ""
-
-        if CONF_COIN_NAME not in self._data:
-            self._data[CONF_COIN_NAME] = ""
-
-        pool = PoolFactory.get(self.hass, self._data)
-        init_data = await pool.async_initialize(self._data)
-
-        self._data.update(init_data)
-
-        try:
-            self._data[CONF_COIN_NAME] = CryptoCoin(self._data[CONF_COIN_KEY]).name
-        except ValueError:
-            self._data[CONF_COIN_NAME] = self._data[CONF_COIN_KEY]
-
-        self._data[CONF_TITLE] = (
-            f"{self._data[CONF_POOL_NAME]} - {self._data[CONF_COIN_NAME]} - {self._data[CONF_ADDRESS]}"
-        )
-        self._data[CONF_UNIQUE_ID] = (
-            f"{self._data[CONF_POOL_KEY]}_{self._data[CONF_COIN_KEY]}_{self._data[CONF_ADDRESS].lower()}"
-        )
-
-        return PoolInitData(self._data)
+        return await async_validate_config(self.hass, self._data)
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -194,6 +335,20 @@ class PoolConfigFlow(ConfigFlow, domain=DOMAIN):
             self._data[CONF_POOL_NAME] = POOL_SOURCE_MINING_CORE_NAME
             return await self.async_step_mining_core_pool(user_input)
 
+        if user_input[CONF_POOL_KEY] == POOL_SOURCE_CUSTOM_JSON_KEY:
+            self._data[CONF_POOL_NAME] = POOL_SOURCE_CUSTOM_JSON_NAME
+            return await self.async_step_custom_json_pool(user_input)
+
+        if user_input[CONF_POOL_KEY] == POOL_SOURCE_CGMINER_KEY:
+            self._data[CONF_POOL_NAME] = POOL_SOURCE_CGMINER_NAME
+            return await self.async_step_cgminer(user_input)
+
+        if user_input[CONF_POOL_KEY] == POOL_SOURCE_AUTO_DETECT_KEY:
+            return await self.async_step_auto_detect(user_input)
+
+        if user_input[CONF_POOL_KEY] == POOL_SOURCE_BULK_IMPORT_KEY:
+            return await self.async_step_bulk_import(user_input)
+
         errors["base"] = "Invalid pool source"
 
         return self.async_show_form(
@@ -355,38 +510,275 @@ class PoolConfigFlow(ConfigFlow, domain=DOMAIN):
         """Handle the mining core pool step."""
         errors: dict[str, str] = {}
 
-        coins: list[SelectOptionDict] = [
-            SelectOptionDict(value=coin.value, label=coin.name)
-            for coin in POOL_SOURCE_MINING_CORE_POOL_COINS
+        # if the user input CONF_POOL_URL is None, show the form
+        if user_input is None or user_input.get(CONF_POOL_URL) is None:
+            return self.async_show_form(
+                step_id="mining_core_pool",
+                data_schema=STEP_MINING_CORE_DATA_SCHEMA,
+                errors=errors,
+            )
+
+        self._data[CONF_POOL_URL] = user_input[CONF_POOL_URL].rstrip("/")
+
+        return await self.async_step_mining_core_coin()
+
+    async def async_step_mining_core_coin(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle the mining core coin step."""
+        errors: dict[str, str] = {}
+
+        # if the user input CONF_COIN_KEY is None, show the form
+        if user_input is None or user_input.get(CONF_COIN_KEY) is None:
+            # offer the pools of the instance, the known coins when not reachable
+            pools = await async_get_coin_discovery(
+                self.hass
+            ).async_get_mining_core_pools(self._data[CONF_POOL_URL])
+
+            coins: list[SelectOptionDict] = (
+                [
+                    SelectOptionDict(
+                        value=pool.id,
+                        label=pool.coin
+                        if pool.coin.lower() == pool.id
+                        else f"{pool.coin} ({pool.id})",
+                    )
+                    for pool in pools
+                ]
+                if pools
+                else [
+                    SelectOptionDict(value=coin.value, label=coin.name)
+                    for coin in POOL_SOURCE_MINING_CORE_POOL_COINS
+                ]
+            )
+
+            coin_schema = vol.Schema(
+                {
+                    vol.Required(CONF_COIN_KEY): SelectSelector(
+                        SelectSelectorConfig(
+                            options=coins,
+                            mode=SelectSelectorMode.DROPDOWN,
+                            # pool ids of an unreachable instance can be typed in
+                            custom_value=not pools,
+                        )
+                    ),
+                }
+            )
+
+            return self.async_show_form(
+                step_id="mining_core_coin",
+                data_schema=coin_schema,
+                errors=errors,
+            )
+
+        self._data.update(user_input)
+
+        return await self.async_step_wallet()
+
+    async def async_step_custom_json_pool(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle the custom JSON pool step."""
+        errors: dict[str, str] = {}
+
+        # if the user input CONF_JSON_URL is None, show the form
+        if user_input is not None and user_input.get(CONF_JSON_URL) is not None:
+            if is_valid_url_template(user_input[CONF_JSON_URL]):
+                self._data.update(user_input)
+                return await self.async_step_wallet(user_input)
+            errors[CONF_JSON_URL] = "invalid_url_template"
+
+        return self.async_show_form(
+            step_id="custom_json_pool",
+            data_schema=self.add_suggested_values_to_schema(
+                STEP_CUSTOM_JSON_DATA_SCHEMA, user_input
+            ),
+            errors=errors,
+        )
+
+    async def async_step_cgminer(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle the local miners step."""
+        errors: dict[str, str] = {}
+
+        # if the user input CONF_HOSTS is None, show the form
+        if user_input is not None and user_input.get(CONF_HOSTS) is not None:
+            try:
+                hosts = parse_hosts(user_input[CONF_HOSTS])
+            except ValueError:
+                hosts = []
+
+            if not hosts:
+                errors[CONF_HOSTS] = "invalid_hosts"
+            else:
+                self._data.update(user_input)
+                self._data[CONF_HOSTS] = hosts
+                self._data[CONF_COIN_KEY] = CryptoCoin.BTC.value
+
+                if (result := await self._create_entry(errors)) is not None:
+                    return result
+
+        return self.async_show_form(
+            step_id="cgminer",
+            data_schema=self.add_suggested_values_to_schema(
+                STEP_CGMINER_DATA_SCHEMA, user_input
+            ),
+            errors=errors,
+        )
+
+    async def async_step_auto_detect(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle the auto-detect step."""
+        errors: dict[str, str] = {}
+
+        # if the user input CONF_ADDRESS is None, show the form
+        if user_input is not None and user_input.get(CONF_ADDRESS) is not None:
+            detected = await async_detect_pools(
+                self.hass, user_input[CONF_ADDRESS].strip()
+            )
+            if detected:
+                self._detected = {pool.key: pool for pool in detected}
+                return await self.async_step_auto_detect_select()
+            errors["base"] = "no_pool_detected"
+
+        return self.async_show_form(
+            step_id="auto_detect",
+            data_schema=self.add_suggested_values_to_schema(
+                STEP_WALLET_DATA_SCHEMA, user_input
+            ),
+            errors=errors,
+        )
+
+    async def async_step_auto_detect_select(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle the step picking one of the detected pools."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None and user_input.get(CONF_DETECTED_POOL) is not None:
+            detected = self._detected[user_input[CONF_DETECTED_POOL]]
+            self._data = dict(detected.config_data)
+
+            if (result := await self._create_entry(errors)) is not None:
+                return result
+
+        pools: list[SelectOptionDict] = [
+            SelectOptionDict(
+                value=key,
+                label=" - ".join(
+                    name
+                    for name in (
+                        pool.config_data[CONF_POOL_NAME],
+                        pool.config_data[CONF_COIN_NAME],
+                    )
+                    if name
+                )
+                + f" ({pool.online_count}/{pool.worker_count} workers online)",
+            )
+            for key, pool in self._detected.items()
         ]
 
-        coin_schema = vol.Schema(
+        detected_schema = vol.Schema(
             {
-                vol.Required(CONF_POOL_URL, default="http://umbrel.local:4000"): str,
-                vol.Required(CONF_COIN_KEY): SelectSelector(
-                    SelectSelectorConfig(
-                        options=coins,
-                        mode=SelectSelectorMode.DROPDOWN,
+                vol.Required(CONF_DETECTED_POOL, default=pools[0]["value"]): (
+                    SelectSelector(
+                        SelectSelectorConfig(
+                            options=pools, mode=SelectSelectorMode.LIST
+                        )
                     )
                 ),
             }
         )
 
-        # if the user input CONF_COIN_KEY or CONF_POOL_URL is None, show the form
-        if (
-            user_input is None
-            or user_input.get(CONF_COIN_KEY) is None
-            or user_input.get(CONF_POOL_URL) is None
-        ):
-            return self.async_show_form(
-                step_id="mining_core_pool",
-                data_schema=coin_schema,
-                errors=errors,
+        return self.async_show_form(
+            step_id="auto_detect_select",
+            data_schema=detected_schema,
+            errors=errors,
+        )
+
+    async def async_step_bulk_import(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle the bulk import step."""
+        errors: dict[str, str] = {}
+        placeholders = {"error": "-"}
+
+        # if the user input CONF_BULK_ENTRIES is None, show the form
+        if user_input is not None and user_input.get(CONF_BULK_ENTRIES) is not None:
+            try:
+                rows = parse_bulk_import(user_input[CONF_BULK_ENTRIES])
+            except ValueError as error:
+                errors[CONF_BULK_ENTRIES] = "invalid_bulk_entries"
+                placeholders["error"] = str(error)
+            else:
+                return await self._async_bulk_import(rows)
+
+        return self.async_show_form(
+            step_id="bulk_import",
+            data_schema=self.add_suggested_values_to_schema(
+                STEP_BULK_IMPORT_DATA_SCHEMA, user_input
+            ),
+            errors=errors,
+            description_placeholders=placeholders,
+        )
+
+    async def _async_bulk_import(self, rows: list[BulkImportRow]) -> ConfigFlowResult:
+        """Validate the rows at once and create an entry for each valid one."""
+
+        await async_check_pool_ids(self.hass, rows)
+
+        # the shared transport caps the concurrent requests to each pool server
+        results = await asyncio.gather(*(self._async_validate_row(row) for row in rows))
+
+        configured = {
+            entry.data.get(CONF_UNIQUE_ID) for entry in self._async_current_entries()
+        }
+        created = 0
+        failed: list[str] = []
+        for row, pool_data in zip(rows, results, strict=True):
+            if pool_data is None:
+                failed.append(f"{row.label} - {row.error}")
+                continue
+            if pool_data.unique_id in configured:
+                failed.append(f"{row.label} - Already configured")
+                continue
+
+            configured.add(pool_data.unique_id)
+            await self.hass.config_entries.flow.async_init(
+                DOMAIN, context={"source": SOURCE_IMPORT}, data=pool_data.config_data
             )
+            created += 1
+
+        return self.async_abort(
+            reason="bulk_import_finished",
+            description_placeholders={
+                "created": str(created),
+                "failed": "\n".join(failed) or "-",
+            },
+        )
 
-        self._data.update(user_input)
+    async def _async_validate_row(self, row: BulkImportRow) -> PoolInitData | None:
+        """Validate a row, returns None and sets the row error when it fails."""
+        if row.config_data is None:
+            return None
 
-        return await self.async_step_wallet(user_input)
+        try:
+            return await async_validate_config(self.hass, row.config_data)
+        except PoolDefinitionError as error:
+            row.error = f"Response does not match the pool: {error}"
+        except PoolConnectionError as error:
+            row.error = f"Cannot connect: {error}"
+        except Exception as error:
+            _LOGGER.exception("Unexpected exception importing line %s", row.line)
+            row.error = f"Unexpected error: {error}"
+        return None
+
+    async def async_step_import(self, import_data: dict[str, Any]) -> ConfigFlowResult:
+        """Create an entry validated by the bulk import."""
+        self._async_abort_entries_match({CONF_UNIQUE_ID: import_data[CONF_UNIQUE_ID]})
+        return self.async_create_entry(title=import_data[CONF_TITLE], data=import_data)
 
     async def async_step_wallet(
         self, user_input: dict[str, Any] | None = None
@@ -418,6 +810,9 @@ class PoolConfigFlow(ConfigFlow, domain=DOMAIN):
 
         try:
             pool_data = await self.validate_input()
+        except PoolDefinitionError:
+            _LOGGER.exception("Response does not match the pool definition")
+            errors["base"] = "invalid_paths"
         except PoolConnectionError:
             _LOGGER.exception("Connection exception")
             errors["base"] = "cannot_connect"
@@ -436,3 +831,104 @@ class PoolConfigFlow(ConfigFlow, domain=DOMAIN):
             )
 
         return None
+
+
+class PoolOptionsFlow(OptionsFlow):
+    """Handle the options for Miner Pool Stats."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the options."""
+        options = self.config_entry.options
+
+        if user_input is not None:
+            # keep the webhook url stable when the webhook is toggled
+            user_input[CONF_WEBHOOK_ID] = (
+                options.get(CONF_WEBHOOK_ID) or webhook.async_generate_id()
+            )
+            return self.async_create_entry(data=user_input)
+
+        options_fields: dict[Any, Any] = {
+            vol.Required(
+                CONF_LONG_TERM_STATISTICS,
+                default=options.get(CONF_LONG_TERM_STATISTICS, False),
+            ): bool,
+            vol.Required(
+                CONF_UPDATE_INTERVAL,
+                default=options.get(CONF_UPDATE_INTERVAL, 0),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=86400)),
+            vol.Required(
+                CONF_REQUEST_TIMEOUT,
+                default=options.get(CONF_REQUEST_TIMEOUT, 0),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=300)),
+            vol.Required(
+                CONF_HASH_RATE_DEADBAND,
+                default=options.get(
+                    CONF_HASH_RATE_DEADBAND, DEFAULT_HASH_RATE_DEADBAND
+                ),
+            ): vol.All(vol.Coerce(float), vol.Range(min=0, max=50)),
+            vol.Required(
+                CONF_ONLINE_THRESHOLD,
+                default=options.get(CONF_ONLINE_THRESHOLD, DEFAULT_ONLINE_THRESHOLD),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=1440)),
+            vol.Required(
+                CONF_WORKER_STATE_DEBOUNCE,
+                default=options.get(
+                    CONF_WORKER_STATE_DEBOUNCE, DEFAULT_WORKER_STATE_DEBOUNCE
+                ),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+        }
+
+        if self.config_entry.data[CONF_POOL_KEY] == POOL_SOURCE_MINING_CORE_KEY:
+            options_fields[
+                vol.Required(
+                    CONF_PUSH_NOTIFICATIONS,
+                    default=options.get(CONF_PUSH_NOTIFICATIONS, False),
+                )
+            ] = bool
+
+        if self.config_entry.data[CONF_POOL_KEY] in BATCH_POOL_SOURCES:
+            options_fields[
+                vol.Required(
+                    CONF_BATCH_REQUESTS,
+                    default=options.get(CONF_BATCH_REQUESTS, False),
+                )
+            ] = bool
+
+        options_fields[
+            vol.Required(CONF_WEBHOOK, default=options.get(CONF_WEBHOOK, False))
+        ] = bool
+        options_fields[
+            vol.Required(
+                CONF_CAPTURE_RESPONSES,
+                default=options.get(CONF_CAPTURE_RESPONSES, False),
+            )
+        ] = bool
+        options_fields[
+            vol.Required(
+                CONF_LOOP_WATCHDOG, default=options.get(CONF_LOOP_WATCHDOG, False)
+            )
+        ] = bool
+        options_fields[
+            vol.Required(
+                CONF_LOOP_WATCHDOG_THRESHOLD,
+                default=options.get(
+                    CONF_LOOP_WATCHDOG_THRESHOLD, DEFAULT_LOOP_WATCHDOG_THRESHOLD
+                ),
+            )
+        ] = vol.All(vol.Coerce(int), vol.Range(min=1, max=10000))
+
+        options_schema = vol.Schema(options_fields)
+
+        webhook_url = "-"
+        if options.get(CONF_WEBHOOK) and CONF_WEBHOOK_ID in options:
+            webhook_url = webhook.async_generate_url(
+                self.hass, options[CONF_WEBHOOK_ID]
+            )
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=options_schema,
+            description_placeholders={"webhook_url": webhook_url},
+        )
@@ -16,6 +16,45 @@ CONF_UNIQUE_ID = "unique_id"
 CONF_SOURCE = "source"
 CONF_API_KEY = "api_key"
 CONF_ACCOUNT_ID = "account_id"
+CONF_LONG_TERM_STATISTICS = "long_term_statistics"
+CONF_PUSH_NOTIFICATIONS = "push_notifications"
+CONF_BATCH_REQUESTS = "batch_requests"
+CONF_WEBHOOK = "webhook"
+CONF_WEBHOOK_ID = "webhook_id"
+CONF_CAPTURE_RESPONSES = "capture_responses"
+CONF_LOOP_WATCHDOG = "loop_watchdog"
+CONF_LOOP_WATCHDOG_THRESHOLD = "loop_watchdog_threshold"
+CONF_JSON_URL = "json_url"
+CONF_WORKERS_PATH = "workers_path"
+CONF_WORKER_NAME_PATH = "worker_name_path"
+CONF_HASH_RATE_PATH = "hash_rate_path"
+CONF_HASH_RATE_UNIT = "hash_rate_unit"
+CONF_BEST_DIFFICULTY_PATH = "best_difficulty_path"
+CONF_CURRENT_BALANCE_PATH = "current_balance_path"
+CONF_TOTAL_PAID_PATH = "total_paid_path"
+CONF_HOSTS = "hosts"
+CONF_ONLINE_THRESHOLD = "online_threshold"
+CONF_WORKER_STATE_DEBOUNCE = "worker_state_debounce"
+CONF_UPDATE_INTERVAL = "update_interval"
+CONF_REQUEST_TIMEOUT = "request_timeout"
+CONF_HASH_RATE_DEADBAND = "hash_rate_deadband"
+CONF_BULK_ENTRIES = "entries"
+CONF_DETECTED_POOL = "detected_pool"
+
+# Default time a step may block the event loop before a warning
+DEFAULT_LOOP_WATCHDOG_THRESHOLD = 50  # milliseconds
+
+# Default time since the last share after which a worker is offline
+DEFAULT_ONLINE_THRESHOLD = 30  # minutes
+
+# Default updates a worker state must hold before its transition is reported
+DEFAULT_WORKER_STATE_DEBOUNCE = 1
+
+# Default change of a hash rate below which its state is not updated
+DEFAULT_HASH_RATE_DEADBAND = 0  # percent
+
+# Fired with the workers that went online or offline in an update
+EVENT_WORKER_STATE = f"{DOMAIN}_worker_state"
 
 POOL_SOURCE_PUBLIC_POOL_KEY = "public_pool"
 POOL_SOURCE_PUBLIC_POOL_NAME = "Public Pool"
@@ -31,17 +70,31 @@ POOL_SOURCE_MINING_DUTCH_KEY = "mining_dutch"
 POOL_SOURCE_MINING_DUTCH_NAME = "Mining Dutch"
 POOL_SOURCE_MINING_CORE_KEY = "mining_core"
 POOL_SOURCE_MINING_CORE_NAME = "Mining Core"
+POOL_SOURCE_CUSTOM_JSON_KEY = "custom_json"
+POOL_SOURCE_CUSTOM_JSON_NAME = "Custom JSON"
+POOL_SOURCE_CGMINER_KEY = "cgminer"
+POOL_SOURCE_CGMINER_NAME = "Local miners (cgminer API)"
+POOL_SOURCE_AUTO_DETECT_KEY = "auto_detect"
+POOL_SOURCE_AUTO_DETECT_NAME = "Auto-detect"
+POOL_SOURCE_BULK_IMPORT_KEY = "bulk_import"
+POOL_SOURCE_BULK_IMPORT_NAME = "Bulk import"
 
 WALLET_ADDRESS = "Wallet Address"
 WORKER = "Worker"
 
 KEY_TOTAL_PAID = "total_paid"
 KEY_CURRENT_BALANCE = "current_balance"
+KEY_TOTAL_PAID_VALUE = "total_paid_value"
+KEY_CURRENT_BALANCE_VALUE = "current_balance_value"
+KEY_NETWORK_DIFFICULTY = "network_difficulty"
+KEY_TIME_TO_BLOCK = "time_to_block"
+KEY_BEST_SHARE_RATIO = "best_share_ratio"
 KEY_WORKER_COUNT = "worker_count"
 KEY_BEST_DIFFICULTY = "best_difficulty"
 KEY_HASH_RATE = "hash_rate"
 KEY_START_TIME = "start_time"
 KEY_LAST_SEEN = "last_seen"
+KEY_ONLINE = "online"
 
 UNIT_WORKER_COUNT = "workers"
 UNIT_HASH_RATE = "GH/s"
@@ -1,16 +1,62 @@
 """Coordinator for the Miner Pool Stats integration."""
 
-from datetime import timedelta
+from collections.abc import Mapping
+from contextlib import suppress
+from datetime import datetime, timedelta
 import logging
+from time import monotonic
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util.dt import utcnow
 
+from .batch import async_get_batch
+from .capture import ResponseCapture
+from .const import (
+    CONF_CAPTURE_RESPONSES,
+    CONF_COIN_KEY,
+    CONF_HASH_RATE_DEADBAND,
+    CONF_LONG_TERM_STATISTICS,
+    CONF_LOOP_WATCHDOG,
+    CONF_LOOP_WATCHDOG_THRESHOLD,
+    CONF_ONLINE_THRESHOLD,
+    CONF_POOL_KEY,
+    CONF_REQUEST_TIMEOUT,
+    CONF_UPDATE_INTERVAL,
+    CONF_WORKER_STATE_DEBOUNCE,
+    DEFAULT_HASH_RATE_DEADBAND,
+    DEFAULT_LOOP_WATCHDOG_THRESHOLD,
+    DEFAULT_ONLINE_THRESHOLD,
+    DEFAULT_WORKER_STATE_DEBOUNCE,
+    EVENT_WORKER_STATE,
+    CryptoCoin,
+)
 from .factory import PoolFactory
-from .pool import PoolAddressData, PoolClient, PoolConnectionError
+from .metrics import LoopWatchdog, PollMetrics, PollStage, current_poll_metrics
+from .pool import (
+    PoolAddressData,
+    PoolAddressWorkerData,
+    PoolClient,
+    PoolConnectionError,
+    PoolDataTier,
+    PoolInitData,
+    merge_tier_data,
+)
+from .prices import async_get_price_service
+from .solo import (
+    SOLO_POOL_SOURCES,
+    NetworkDifficultyCache,
+    SoloMiningData,
+    async_get_network_difficulty_cache,
+    get_solo_mining_data,
+)
+from .statistics import PoolStatisticsAggregator
+from .worker_state import WorkerStateTracker
 
 type PoolConfigEntry = ConfigEntry[PoolCoordinator]
 
@@ -19,6 +65,26 @@ _LOGGER = logging.getLogger(__name__)
 # Matches iotwatt data log interval
 REQUEST_REFRESH_DEFAULT_COOLDOWN = 5
 
+# Allowed scheduling jitter before a tier is considered due
+TIER_SCHEDULE_TOLERANCE = timedelta(seconds=5)
+
+# Safety polling interval while pushed data is arriving
+PUSH_UPDATE_INTERVAL = timedelta(minutes=30)
+
+# Polling intervals without a push before falling back to polling
+PUSH_TIMEOUT_POLL_INTERVALS = 3
+
+# Options applied to the running coordinator without reloading the entry
+LIVE_OPTIONS = frozenset(
+    {
+        CONF_UPDATE_INTERVAL,
+        CONF_REQUEST_TIMEOUT,
+        CONF_HASH_RATE_DEADBAND,
+        CONF_ONLINE_THRESHOLD,
+        CONF_WORKER_STATE_DEBOUNCE,
+    }
+)
+
 
 class PoolCoordinator(DataUpdateCoordinator[PoolAddressData]):
     """Coordinator for Pool."""
@@ -30,12 +96,56 @@ class PoolCoordinator(DataUpdateCoordinator[PoolAddressData]):
         self._data = None
         self._hass = hass
         self._entry = entry
+        self._options = dict(entry.options)
+        self._statistics: PoolStatisticsAggregator | None = None
+        self._tier_data: dict[PoolDataTier, PoolAddressData] = {}
+        self._tier_updated: dict[PoolDataTier, datetime] = {}
+        self._poll_interval = timedelta(seconds=300)
+        self._push_active = False
+        self._batched = False
+        self.metrics = PollMetrics()
+        self.watchdog: LoopWatchdog | None = None
+        if entry.options.get(CONF_LOOP_WATCHDOG, False):
+            self.watchdog = LoopWatchdog(
+                entry.title,
+                entry.options.get(
+                    CONF_LOOP_WATCHDOG_THRESHOLD, DEFAULT_LOOP_WATCHDOG_THRESHOLD
+                ),
+            )
+        self._push_timeout_unsub: CALLBACK_TYPE | None = None
+        self._worker_states = WorkerStateTracker(
+            entry.options.get(CONF_WORKER_STATE_DEBOUNCE, DEFAULT_WORKER_STATE_DEBOUNCE)
+        )
+        self._tracked_data: PoolAddressData | None = None
+        # price of the coin in the currency of Home Assistant
+        self.coin_price: float | None = None
+        self._price_coin: CryptoCoin | None = None
+        self._unregister_price: CALLBACK_TYPE | None = None
+        # solo mining figures, derived each update for solo pools
+        self.solo_data: SoloMiningData | None = None
+        self._solo_coin: CryptoCoin | None = None
+        self._remove_difficulty_listener: CALLBACK_TYPE | None = None
+        if entry.data[CONF_POOL_KEY] in SOLO_POOL_SOURCES:
+            with suppress(ValueError):
+                coin = CryptoCoin(entry.data[CONF_COIN_KEY])
+                if NetworkDifficultyCache.supports(coin):
+                    self._solo_coin = coin
+        # change of a worker hash rate in percent below which it keeps its state
+        self.hash_rate_deadband: float = entry.options.get(
+            CONF_HASH_RATE_DEADBAND, DEFAULT_HASH_RATE_DEADBAND
+        )
+        self._workers: dict[str, PoolAddressWorkerData] = {}
+        self._workers_data: PoolAddressData | None = None
+        if entry.options.get(CONF_LONG_TERM_STATISTICS, False):
+            self._statistics = PoolStatisticsAggregator(
+                hass, PoolInitData(dict(entry.data))
+            )
         super().__init__(
             hass=hass,
             logger=_LOGGER,
             config_entry=entry,
             name=entry.title,
-            update_interval=timedelta(seconds=300),
+            update_interval=self._poll_interval,
             request_refresh_debouncer=Debouncer(
                 hass,
                 _LOGGER,
@@ -49,7 +159,10 @@ class PoolCoordinator(DataUpdateCoordinator[PoolAddressData]):
 
         # create API instance
         config_data = dict(self._entry.data)
-        self._api = PoolFactory.get(self._hass, config_data)
+        self._api = await PoolFactory.async_get(self._hass, config_data)
+        if self._entry.options.get(CONF_CAPTURE_RESPONSES, False):
+            self._api.capture = ResponseCapture(self._hass, self._api.pool_config)
+        self._async_apply_options(self._entry.options, "setup")
 
         # validate the connection
         try:
@@ -59,7 +172,338 @@ class PoolCoordinator(DataUpdateCoordinator[PoolAddressData]):
 
     async def _async_update_data(self) -> PoolAddressData:
         """Get updated data from the server."""
+        self.metrics.start_poll()
+        token = current_poll_metrics.set(self.metrics)
+        start = monotonic()
+        data: PoolAddressData | None = None
+        error: str | None = None
+        try:
+            data = await self._async_update_tiers()
+            self._async_update_coin_price(data)
+            self._async_update_solo_data(data)
+            return data
+        except Exception as err:
+            error = str(err) or type(err).__name__
+            raise
+        finally:
+            current_poll_metrics.reset(token)
+            if self.watchdog is not None and data is not None:
+                # decoding and parsing run on the event loop
+                self.watchdog.add(
+                    "parse",
+                    self.metrics.stage_time(PollStage.DECODE)
+                    + self.metrics.stage_time(PollStage.PARSE),
+                    data.worker_count,
+                )
+            self.metrics.finish_poll(
+                monotonic() - start,
+                error,
+                data.worker_count if data is not None else None,
+            )
+
+    async def _async_update_tiers(self) -> PoolAddressData:
+        """Fetch the tiers that are due and merge them."""
+        current_time = utcnow()
+
         try:
-            return await self._api.async_get_data()
+            for tier, interval in self._api.data_tiers.items():
+                last_updated = self._tier_updated.get(tier)
+                # a configured update interval shorter than a tier's speeds it up
+                if (
+                    last_updated is not None
+                    and current_time - last_updated
+                    < min(interval, self._poll_interval) - TIER_SCHEDULE_TOLERANCE
+                ):
+                    continue
+                self._tier_data[tier] = await self._api.async_get_tier_data(tier)
+                self._tier_updated[tier] = current_time
         except PoolConnectionError as error:
             raise UpdateFailed(error) from error
+
+        data = merge_tier_data(
+            self._tier_data[PoolDataTier.FAST],
+            self._tier_data.get(PoolDataTier.SLOW),
+        )
+
+        if self._statistics is not None:
+            self._statistics.async_add(data)
+
+        return data
+
+    @callback
+    def _async_update_coin_price(self, data: PoolAddressData) -> None:
+        """Get the coin price from the shared prices when the pool reports funds."""
+        prices = async_get_price_service(self.hass)
+        if self._price_coin is None:
+            if data.total_paid is None and data.current_balance is None:
+                return
+            try:
+                coin = CryptoCoin(self._entry.data[CONF_COIN_KEY])
+            except ValueError:
+                return
+            if (
+                unregister := prices.async_register(coin, self._async_price_updated)
+            ) is None:
+                return
+            self._price_coin = coin
+            self._unregister_price = unregister
+
+        self.coin_price = prices.async_get_price(self._price_coin)
+
+    @callback
+    def _async_price_updated(self) -> None:
+        """Serve the refreshed coin price without waiting for the next poll."""
+        if self._price_coin is None:
+            return
+        price = async_get_price_service(self.hass).async_get_price(self._price_coin)
+        if price != self.coin_price:
+            self.coin_price = price
+            if self.data is not None:
+                self.async_update_listeners()
+
+    @callback
+    def _async_update_solo_data(self, data: PoolAddressData) -> None:
+        """Derive the solo mining figures with the shared network difficulty."""
+        if self._solo_coin is None:
+            return
+        cache = async_get_network_difficulty_cache(self.hass)
+        if self._remove_difficulty_listener is None:
+            self._remove_difficulty_listener = cache.async_add_listener(
+                self._solo_coin, self._async_difficulty_updated
+            )
+        self.solo_data = get_solo_mining_data(
+            data, cache.async_get_difficulty(self._solo_coin)
+        )
+
+    @callback
+    def _async_difficulty_updated(self) -> None:
+        """Derive the figures with the refreshed difficulty of the coin."""
+        if self._solo_coin is None or self.data is None:
+            return
+        difficulty = async_get_network_difficulty_cache(self.hass).async_get_difficulty(
+            self._solo_coin
+        )
+        if self.solo_data is None or difficulty != self.solo_data.network_difficulty:
+            self.solo_data = get_solo_mining_data(self.data, difficulty)
+            self.async_update_listeners()
+
+    @property
+    def has_solo_data(self) -> bool:
+        """Return True if solo mining figures are derived for the address."""
+        return self._solo_coin is not None
+
+    @property
+    def has_coin_price(self) -> bool:
+        """Return True if the coin price is served for the funds of the address."""
+        return self._price_coin is not None
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all registered listeners and measure the dispatch time."""
+        self._async_fire_worker_transitions()
+        start = monotonic()
+        super().async_update_listeners()
+        duration = monotonic() - start
+        self.metrics.add(PollStage.DISPATCH, duration)
+        if self.watchdog is not None:
+            self.watchdog.add(
+                "dispatch",
+                duration,
+                self.data.worker_count if self.data is not None else None,
+            )
+
+    @callback
+    def _async_fire_worker_transitions(self) -> None:
+        """Fire one event with the workers that changed state in this update."""
+        # failed polls update the listeners with the previous data
+        if self.data is None or self.data is self._tracked_data:
+            return
+        self._tracked_data = self.data
+
+        if transitions := self._worker_states.update(self.data):
+            self.hass.bus.async_fire(
+                EVENT_WORKER_STATE,
+                {
+                    "entry_id": self._entry.entry_id,
+                    "online": transitions.online,
+                    "offline": transitions.offline,
+                },
+            )
+
+    def get_worker(self, name: str) -> PoolAddressWorkerData | None:
+        """Get a worker of the current data by name."""
+        # indexed once per update instead of searched by every entity
+        if self._workers_data is not self.data:
+            self._workers_data = self.data
+            self._workers = (
+                {worker.name: worker for worker in self.data.worker_list}
+                if self.data is not None
+                else {}
+            )
+        return self._workers.get(name)
+
+    @property
+    def api(self) -> PoolClient:
+        """Return the pool client."""
+        return self._api
+
+    @property
+    def push_active(self) -> bool:
+        """Return True if the data is currently pushed by the pool."""
+        return self._push_active
+
+    @callback
+    def async_set_pushed_data(self, data: PoolAddressData) -> None:
+        """Apply data pushed by the pool and slow down polling."""
+        if not self._push_active:
+            _LOGGER.debug(
+                "Receiving pushed data for %s, slowing down polling", self.name
+            )
+            self._push_active = True
+            self._async_set_update_interval("push started")
+
+        if self._push_timeout_unsub is not None:
+            self._push_timeout_unsub()
+        self._push_timeout_unsub = async_call_later(
+            self.hass,
+            self._poll_interval * PUSH_TIMEOUT_POLL_INTERVALS,
+            self._async_push_timeout,
+        )
+
+        if self._statistics is not None:
+            self._statistics.async_add(data)
+
+        if self.solo_data is not None:
+            # pushed data reuses the difficulty of the last poll
+            self.solo_data = get_solo_mining_data(
+                data, self.solo_data.network_difficulty
+            )
+
+        self.async_set_updated_data(data)
+
+    @callback
+    def _async_push_timeout(self, _now: datetime) -> None:
+        """Handle pushed data that stopped arriving."""
+        self._push_timeout_unsub = None
+        self.async_push_stopped()
+
+    @callback
+    def async_push_stopped(self) -> None:
+        """Fall back to polling when the pool stops pushing data."""
+        if self._push_timeout_unsub is not None:
+            self._push_timeout_unsub()
+            self._push_timeout_unsub = None
+
+        if not self._push_active:
+            return
+
+        _LOGGER.debug("Pushed data stopped for %s, resuming polling", self.name)
+        self._push_active = False
+        self._async_set_update_interval("push stopped")
+        self._entry.async_create_task(
+            self.hass, self.async_request_refresh(), eager_start=True
+        )
+
+    @callback
+    def async_join_batch(self) -> CALLBACK_TYPE:
+        """Poll together with the other entries of the pool server."""
+        pool_config = self._api.pool_config
+        remove_from_batch = async_get_batch(
+            self.hass,
+            pool_config.pool_key,
+            pool_config.pool_url or "",
+            self._poll_interval,
+        ).async_add(self)
+        self._batched = True
+        self._async_set_update_interval("joined batch")
+
+        @callback
+        def _async_leave_batch() -> None:
+            remove_from_batch()
+            self._batched = False
+
+        return _async_leave_batch
+
+    @callback
+    def async_update_options(self, options: Mapping[str, Any]) -> bool:
+        """Apply changed options in place.
+
+        Returns False when an option changed that needs the entry reloaded.
+        """
+        changed = {
+            key
+            for key in options.keys() | self._options.keys()
+            if options.get(key) != self._options.get(key)
+        }
+        # the batch polls its members with the interval they joined with
+        if not changed <= LIVE_OPTIONS or (
+            self._batched and CONF_UPDATE_INTERVAL in changed
+        ):
+            return False
+
+        self._options = dict(options)
+        self._async_apply_options(options, "options updated")
+        if changed & {CONF_UPDATE_INTERVAL, CONF_ONLINE_THRESHOLD}:
+            # reschedule the polling and show the new online states right away
+            self._entry.async_create_task(
+                self.hass, self.async_request_refresh(), eager_start=True
+            )
+        return True
+
+    @callback
+    def _async_apply_options(self, options: Mapping[str, Any], reason: str) -> None:
+        """Apply the options that take effect without reloading the entry."""
+        self._api.online_threshold = timedelta(
+            minutes=options.get(CONF_ONLINE_THRESHOLD, DEFAULT_ONLINE_THRESHOLD)
+        )
+        self._api.request_timeout = options.get(CONF_REQUEST_TIMEOUT) or None
+        self._worker_states.debounce = options.get(
+            CONF_WORKER_STATE_DEBOUNCE, DEFAULT_WORKER_STATE_DEBOUNCE
+        )
+        self.hash_rate_deadband = options.get(
+            CONF_HASH_RATE_DEADBAND, DEFAULT_HASH_RATE_DEADBAND
+        )
+
+        # poll as often as the fastest tier requires unless configured
+        if update_interval := options.get(CONF_UPDATE_INTERVAL):
+            self._poll_interval = timedelta(seconds=update_interval)
+        else:
+            self._poll_interval = min(self._api.data_tiers.values())
+        self._async_set_update_interval(reason)
+
+    @callback
+    def _async_set_update_interval(self, reason: str) -> None:
+        """Apply the interval of the coordinator's own polling."""
+        update_interval = self._get_update_interval()
+        if update_interval != self.update_interval:
+            self.metrics.add_backoff("poll", update_interval, reason)
+        self.update_interval = update_interval
+
+    def _get_update_interval(self) -> timedelta | None:
+        """Get the interval of the coordinator's own polling."""
+        if self._push_active:
+            return max(self._poll_interval, PUSH_UPDATE_INTERVAL)
+        if self._batched:
+            # the batch refreshes the coordinator
+            return None
+        return self._poll_interval
+
+    @property
+    def long_term_statistics(self) -> bool:
+        """Return True if worker hash rates are imported as statistics."""
+        return self._statistics is not None
+
+    async def async_shutdown(self) -> None:
+        """Import the pending statistics and shut down the coordinator."""
+        if self._push_timeout_unsub is not None:
+            self._push_timeout_unsub()
+            self._push_timeout_unsub = None
+        if self._statistics is not None:
+            self._statistics.async_flush()
+        if self._unregister_price is not None:
+            self._unregister_price()
+            self._unregister_price = None
+        if self._remove_difficulty_listener is not None:
+            self._remove_difficulty_listener()
+            self._remove_difficulty_listener = None
+        await super().async_shutdown()
@@ -0,0 +1,435 @@
+"""Declarative pool definitions for the Miner Pool Stats integration."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import StrEnum
+import logging
+from operator import itemgetter
+import string
+from typing import Any, ClassVar
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util.dt import as_utc, utc_from_timestamp, utcnow
+
+from .hash import HashRate, HashRateUnit
+from .pool import (
+    PoolAddressData,
+    PoolAddressWorkerData,
+    PoolClient,
+    PoolConnectionError,
+    PoolInitData,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+type Getter = Callable[[Any], Any]
+
+
+class PoolDefinitionError(PoolConnectionError):
+    """Raised when a response does not match the pool definition."""
+
+
+class HashRateFormat(StrEnum):
+    """Formats of the worker hash rates."""
+
+    NUMBER = "number"  # a number in the hash rate unit of the definition
+    STRING = "string"  # a number with a unit suffix, e.g. "1.35T"
+
+
+class TimestampFormat(StrEnum):
+    """Formats of the worker timestamps."""
+
+    EPOCH = "epoch"  # seconds since the epoch
+    ISO = "iso"  # ISO 8601 date and time, UTC when it has no offset
+
+
+class OnlineRule(StrEnum):
+    """Rules deciding if a worker is online."""
+
+    ALWAYS = "always"
+    FLAG = "flag"  # the value is truthy
+    OFFLINE_FLAG = "offline_flag"  # the value is falsy
+    LAST_SEEN = "last_seen"  # the last share is within the online threshold
+
+
+class DuplicateWorkers(StrEnum):
+    """Handling of several entries with the same worker name."""
+
+    REPLACE = "replace"  # the last entry wins
+    KEEP_ONLINE = "keep_online"  # an offline entry does not replace another
+    COMBINE = "combine"  # hash rates are added, the best difficulty is kept
+
+
+@dataclass(frozen=True, kw_only=True)
+class PoolDefinition:
+    """Description of a pool API response.
+
+    Paths are dotted keys into the JSON response, numeric segments index
+    arrays and a segment ending with ``?`` returns None when it is missing.
+    The url and headers are templates of ``{address}``, ``{api_key}``,
+    ``{coin_key}``, ``{coin_path}`` and ``{pool_url}``.
+    """
+
+    url: str
+    headers: Mapping[str, str] = field(default_factory=dict)
+    timeout: float | None = None
+    coin_paths: Mapping[str, str] = field(default_factory=dict)
+
+    # worker collection, a list or a mapping of worker name to worker
+    workers: str
+    workers_by_name: bool = False
+    worker_name: str | None = None
+    worker_name_after_dot: bool = False
+    duplicate_workers: DuplicateWorkers = DuplicateWorkers.REPLACE
+
+    hash_rate: str
+    hash_rate_unit: HashRateUnit = HashRateUnit.H
+    hash_rate_format: HashRateFormat = HashRateFormat.NUMBER
+    best_difficulty: str | None = None
+    # keep the highest best difficulty recorded for the worker
+    best_difficulty_history: bool = False
+    last_seen: str | None = None
+    start_time: str | None = None
+    timestamp_format: TimestampFormat = TimestampFormat.ISO
+    online: OnlineRule = OnlineRule.ALWAYS
+    # path of the flag of the FLAG and OFFLINE_FLAG rules
+    online_path: str | None = None
+
+    total_paid: str | None = None
+    current_balance: str | None = None
+    pool_best_difficulty: str | None = None
+    # use the highest worker best difficulty when the pool has none
+    pool_best_difficulty_from_workers: bool = False
+    worker_count: str | None = None
+
+
+def get_template_fields(template: str) -> set[str]:
+    """Return the placeholders of a url or header template."""
+    return {name for _, name, _, _ in string.Formatter().parse(template) if name}
+
+
+def compile_path(path: str) -> Getter:
+    """Compile a dotted path into a getter."""
+    if not path:
+        return lambda data: data
+
+    steps = [
+        (int(key) if key.isdigit() else key, segment.endswith("?"))
+        for segment in path.split(".")
+        if (key := segment.rstrip("?"))
+    ]
+
+    if not any(optional for _, optional in steps):
+        if len(steps) == 1:
+            return itemgetter(steps[0][0])
+        keys = tuple(key for key, _ in steps)
+
+        def _get(data: Any) -> Any:
+            for key in keys:
+                data = data[key]
+            return data
+
+        return _get
+
+    def _get_optional(data: Any) -> Any:
+        for key, optional in steps:
+            if not optional:
+                data = data[key]
+                continue
+            try:
+                data = data[key]
+            except (IndexError, KeyError, TypeError):
+                return None
+            if data is None:
+                return None
+        return data
+
+    return _get_optional
+
+
+def _compile_float(path: str | None) -> Callable[[Any], float | None]:
+    """Compile a getter of a float, empty values are 0."""
+    if path is None:
+        return lambda _data: None
+    get = compile_path(path)
+    return lambda data: float(get(data) or 0)
+
+
+def _compile_hash_rate(definition: PoolDefinition) -> Callable[[Any], float]:
+    """Compile a getter of a worker hash rate in GH/s."""
+    get = compile_path(definition.hash_rate)
+    unit = definition.hash_rate_unit
+
+    if definition.hash_rate_format is HashRateFormat.STRING:
+        return lambda worker: (
+            HashRate.from_string(str(get(worker) or "0")).to_unit(HashRateUnit.GH).value
+        )
+    if unit is HashRateUnit.H:
+        return lambda worker: (
+            HashRate.from_number(float(get(worker) or 0)).to_unit(HashRateUnit.GH).value
+        )
+    return lambda worker: (
+        HashRate(float(get(worker) or 0), unit).to_unit(HashRateUnit.GH).value
+    )
+
+
+def _compile_timestamp(
+    path: str | None, timestamp_format: TimestampFormat
+) -> Callable[[Any], datetime | None]:
+    """Compile a getter of a worker timestamp in UTC."""
+    if path is None:
+        return lambda _worker: None
+    get = compile_path(path)
+
+    def _get_timestamp(worker: Any) -> datetime | None:
+        if (value := get(worker)) is None:
+            return None
+        if timestamp_format is TimestampFormat.EPOCH:
+            return utc_from_timestamp(float(value))
+        return as_utc(datetime.fromisoformat(value))
+
+    return _get_timestamp
+
+
+def _compile_online(
+    definition: PoolDefinition,
+) -> Callable[[Any, datetime | None, datetime], bool]:
+    """Compile the online rule of the workers.
+
+    The rule gets the worker, its last seen time and the oldest last seen
+    time of an online worker, computed once per poll.
+    """
+    rule = definition.online
+    if rule is OnlineRule.LAST_SEEN:
+        return lambda _worker, last_seen, cutoff: (
+            last_seen is not None and last_seen >= cutoff
+        )
+    if rule is OnlineRule.ALWAYS or definition.online_path is None:
+        return lambda _worker, _last_seen, _cutoff: True
+
+    get = compile_path(definition.online_path)
+    if rule is OnlineRule.FLAG:
+        return lambda worker, _last_seen, _cutoff: bool(get(worker))
+    return lambda worker, _last_seen, _cutoff: not bool(get(worker))
+
+
+def _compile_name(definition: PoolDefinition) -> Callable[[Any, Any], str]:
+    """Compile a getter of the worker name from the collection key and the worker."""
+    if definition.workers_by_name or definition.worker_name is None:
+        get: Callable[[Any, Any], Any] = lambda key, _worker: key
+    else:
+        get_name = compile_path(definition.worker_name)
+        get = lambda _key, worker: get_name(worker)
+
+    if definition.worker_name_after_dot:
+        return lambda key, worker: str(get(key, worker)).rsplit(".", 1)[-1]
+    return lambda key, worker: str(get(key, worker))
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledDefinition:
+    """Extractors of a pool definition."""
+
+    definition: PoolDefinition
+    iter_workers: Callable[[Any], Iterable[tuple[Any, Any]]]
+    worker_name: Callable[[Any, Any], str]
+    hash_rate: Callable[[Any], float]
+    best_difficulty: Callable[[Any], float | None]
+    last_seen: Callable[[Any], datetime | None]
+    start_time: Callable[[Any], datetime | None]
+    is_online: Callable[[Any, datetime | None, datetime], bool]
+    total_paid: Callable[[Any], float | None]
+    current_balance: Callable[[Any], float | None]
+    pool_best_difficulty: Callable[[Any], float | None]
+    worker_count: Getter | None
+
+
+def compile_definition(definition: PoolDefinition) -> CompiledDefinition:
+    """Compile a pool definition into extractors."""
+    get_workers = compile_path(definition.workers)
+
+    def _iter_workers(data: Any) -> Iterable[tuple[Any, Any]]:
+        workers = get_workers(data)
+        if not workers:
+            return ()
+        if definition.workers_by_name:
+            return workers.items()
+        return ((None, worker) for worker in workers)
+
+    return CompiledDefinition(
+        definition=definition,
+        iter_workers=_iter_workers,
+        worker_name=_compile_name(definition),
+        hash_rate=_compile_hash_rate(definition),
+        best_difficulty=_compile_float(definition.best_difficulty),
+        last_seen=_compile_timestamp(definition.last_seen, definition.timestamp_format),
+        start_time=_compile_timestamp(
+            definition.start_time, definition.timestamp_format
+        ),
+        is_online=_compile_online(definition),
+        total_paid=_compile_float(definition.total_paid),
+        current_balance=_compile_float(definition.current_balance),
+        pool_best_difficulty=_compile_float(definition.pool_best_difficulty),
+        worker_count=(
+            compile_path(definition.worker_count) if definition.worker_count else None
+        ),
+    )
+
+
+def _max_timestamp(value1: datetime | None, value2: datetime | None) -> datetime | None:
+    """Get the latest of two timestamps."""
+    if value1 is None or value2 is None:
+        return value1 or value2
+    return max(value1, value2)
+
+
+def _min_timestamp(value1: datetime | None, value2: datetime | None) -> datetime | None:
+    """Get the earliest of two timestamps."""
+    if value1 is None or value2 is None:
+        return value1 or value2
+    return min(value1, value2)
+
+
+class DeclarativePoolClient(PoolClient):
+    """Client of a pool described by a definition."""
+
+    definition: ClassVar[PoolDefinition]
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        pool_config: PoolInitData,
+        definition: PoolDefinition | None = None,
+    ) -> None:
+        """Initialize the client instance and compile its definition."""
+        super().__init__(hass, pool_config)
+        self._compiled = compile_definition(definition or self.definition)
+
+    def _format(self, template: str) -> str:
+        """Fill in a url or header template."""
+        definition = self._compiled.definition
+        fields = get_template_fields(template)
+        pool_config = self._pool_config
+
+        if "api_key" in fields and pool_config.api_key is None:
+            raise PoolConnectionError("Pool api key is not configured.")
+        if "pool_url" in fields and pool_config.pool_url is None:
+            raise PoolConnectionError("Pool url is not configured.")
+
+        return template.format(
+            address=pool_config.address,
+            api_key=pool_config.api_key,
+            coin_key=pool_config.coin_key,
+            coin_path=(
+                definition.coin_paths[pool_config.coin_key]
+                if "coin_path" in fields
+                else None
+            ),
+            pool_url=(pool_config.pool_url or "").rstrip("/"),
+        )
+
+    async def _async_fetch_data(self) -> Any:
+        """Fetch the raw response from the pool."""
+        definition = self._compiled.definition
+        return await self._async_get_json(
+            self._format(definition.url),
+            headers={
+                name: self._format(value) for name, value in definition.headers.items()
+            }
+            or None,
+            timeout=definition.timeout,
+        )
+
+    async def async_parse_data(self, json: Any) -> PoolAddressData:
+        """Parse a raw response of the pool."""
+        try:
+            return await self._async_parse_data(json)
+        except (AttributeError, IndexError, KeyError, TypeError, ValueError) as error:
+            raise PoolDefinitionError(
+                f"Response for '{self._pool_config.address}' does not match the"
+                f" pool definition: {self._get_error_message(error)}"
+            ) from error
+
+    async def _async_parse_data(self, json: Any) -> PoolAddressData:
+        """Walk the compiled paths over a response."""
+        compiled = self._compiled
+        definition = compiled.definition
+        duplicate_workers = definition.duplicate_workers
+        # one reference time for all workers of the poll
+        online_cutoff = utcnow() - self.online_threshold
+        history: dict[str, float] = {}
+
+        workers: dict[str, PoolAddressWorkerData] = {}
+        for key, worker_json in compiled.iter_workers(json):
+            last_seen = compiled.last_seen(worker_json)
+            worker = PoolAddressWorkerData(
+                name=compiled.worker_name(key, worker_json),
+                best_difficulty=compiled.best_difficulty(worker_json),
+                hash_rate=compiled.hash_rate(worker_json),
+                is_online=compiled.is_online(worker_json, last_seen, online_cutoff),
+                last_seen=last_seen,
+                start_time=compiled.start_time(worker_json),
+            )
+
+            if definition.best_difficulty_history:
+                # get the maximum stored for the best difficulty
+                if worker.name not in history:
+                    history[worker.name] = await self._get_max_best_difficulty(
+                        worker.name
+                    )
+                worker.best_difficulty = self._get_max_float(
+                    worker.best_difficulty, history[worker.name]
+                )
+
+            existing = workers.get(worker.name)
+            if existing is None or duplicate_workers is DuplicateWorkers.REPLACE:
+                workers[worker.name] = worker
+            elif duplicate_workers is DuplicateWorkers.KEEP_ONLINE:
+                # an old entry of the worker may be reported offline
+                if worker.is_online:
+                    workers[worker.name] = worker
+            else:
+                existing.hash_rate = self._combine_float_values(
+                    existing.hash_rate, worker.hash_rate
+                )
+                existing.best_difficulty = self._get_max_float(
+                    existing.best_difficulty, worker.best_difficulty
+                )
+                existing.is_online = existing.is_online or worker.is_online
+                existing.last_seen = _max_timestamp(
+                    existing.last_seen, worker.last_seen
+                )
+                existing.start_time = _min_timestamp(
+                    existing.start_time, worker.start_time
+                )
+
+        # if there are no workers, log a warning
+        if not workers:
+            _LOGGER.warning(
+                "No workers found for address %s", self._pool_config.address
+            )
+
+        pool_best_difficulty = compiled.pool_best_difficulty(json)
+        if (
+            pool_best_difficulty is None
+            and definition.pool_best_difficulty_from_workers
+        ):
+            pool_best_difficulty = max(
+                (worker.best_difficulty or 0.0 for worker in workers.values()),
+                default=0.0,
+            )
+
+        return PoolAddressData(
+            compiled.total_paid(json),
+            compiled.current_balance(json),
+            pool_best_difficulty,
+            (
+                int(compiled.worker_count(json))
+                if compiled.worker_count is not None
+                else len(workers)
+            ),
+            list(workers.values()),
+        )
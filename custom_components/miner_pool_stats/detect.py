@@ -0,0 +1,148 @@
+"""Detection of the pool an address mines on for the Miner Pool Stats integration."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    CONF_ADDRESS,
+    CONF_COIN_KEY,
+    CONF_COIN_NAME,
+    CONF_POOL_KEY,
+    CONF_POOL_NAME,
+    CONF_POOL_URL,
+    CONF_TITLE,
+    CONF_UNIQUE_ID,
+    POOL_SOURCE_CK_POOL_KEY,
+    POOL_SOURCE_CK_POOL_NAME,
+    POOL_SOURCE_COIN_MINERS_KEY,
+    POOL_SOURCE_COIN_MINERS_NAME,
+    POOL_SOURCE_PUBLIC_POOL_KEY,
+    POOL_SOURCE_PUBLIC_POOL_NAME,
+    POOL_SOURCE_SOLO_POOL_COINS,
+    POOL_SOURCE_SOLO_POOL_KEY,
+    POOL_SOURCE_SOLO_POOL_NAME,
+    CryptoCoin,
+)
+from .factory import PoolFactory
+from .pool import PoolConnectionError
+
+_LOGGER = logging.getLogger(__name__)
+
+# Time a single pool has to answer a probe in seconds
+PROBE_TIMEOUT: float = 5
+
+PUBLIC_POOL_URL = "https://public-pool.io:40557/"
+
+
+@dataclass(frozen=True)
+class DetectedPool:
+    """A pool that reported workers for the address."""
+
+    config_data: dict[str, Any]
+    worker_count: int
+    online_count: int
+
+    @property
+    def key(self) -> str:
+        """Return a key identifying the pool and coin."""
+        return f"{self.config_data[CONF_POOL_KEY]}_{self.config_data[CONF_COIN_KEY]}"
+
+
+def get_probe_configs(address: str) -> list[dict[str, Any]]:
+    """Get the config data of every pool that can be probed with an address alone."""
+
+    def _config(
+        pool_key: str,
+        pool_name: str,
+        coin: CryptoCoin | None,
+        pool_url: str | None = None,
+    ) -> dict[str, Any]:
+        config_data: dict[str, Any] = {
+            CONF_TITLE: "",
+            CONF_UNIQUE_ID: "",
+            CONF_POOL_KEY: pool_key,
+            CONF_POOL_NAME: pool_name,
+            # Coin-Miners reports the coin of the address
+            CONF_COIN_KEY: coin.value if coin else "",
+            CONF_COIN_NAME: coin.name if coin else "",
+            CONF_ADDRESS: address,
+        }
+        if pool_url is not None:
+            config_data[CONF_POOL_URL] = pool_url
+        return config_data
+
+    return [
+        _config(POOL_SOURCE_CK_POOL_KEY, POOL_SOURCE_CK_POOL_NAME, CryptoCoin.BTC),
+        _config(
+            POOL_SOURCE_PUBLIC_POOL_KEY,
+            POOL_SOURCE_PUBLIC_POOL_NAME,
+            CryptoCoin.BTC,
+            PUBLIC_POOL_URL,
+        ),
+        *(
+            _config(POOL_SOURCE_SOLO_POOL_KEY, POOL_SOURCE_SOLO_POOL_NAME, coin)
+            for coin in POOL_SOURCE_SOLO_POOL_COINS
+        ),
+        _config(POOL_SOURCE_COIN_MINERS_KEY, POOL_SOURCE_COIN_MINERS_NAME, None),
+    ]
+
+
+async def async_detect_pools(hass: HomeAssistant, address: str) -> list[DetectedPool]:
+    """Probe the pools for the address at the same time.
+
+    The remaining probes are cancelled as soon as a pool reports an online
+    worker, the pools that reported workers so far are returned.
+    """
+    tasks = [
+        asyncio.create_task(_async_probe(hass, config_data))
+        for config_data in get_probe_configs(address)
+    ]
+
+    detected: list[DetectedPool] = []
+    try:
+        for next_probe in asyncio.as_completed(tasks):
+            if (pool := await next_probe) is None:
+                continue
+            detected.append(pool)
+            if pool.online_count:
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    return detected
+
+
+async def _async_probe(
+    hass: HomeAssistant, config_data: dict[str, Any]
+) -> DetectedPool | None:
+    """Fetch the address from a pool, returns None when it has no workers there."""
+    try:
+        async with asyncio.timeout(PROBE_TIMEOUT):
+            client = await PoolFactory.async_get(hass, config_data)
+            data = await client.async_get_data()
+    except (PoolConnectionError, TimeoutError, KeyError, ValueError) as error:
+        # unknown addresses are answered with an error by most pools
+        _LOGGER.debug(
+            "Probing %s %s failed: %s",
+            config_data[CONF_POOL_NAME],
+            config_data[CONF_COIN_NAME],
+            error,
+        )
+        return None
+
+    if not data.worker_list:
+        return None
+
+    return DetectedPool(
+        config_data,
+        len(data.worker_list),
+        sum(worker.is_online for worker in data.worker_list),
+    )
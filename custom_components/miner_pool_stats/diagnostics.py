@@ -0,0 +1,107 @@
+"""Diagnostics support for the Miner Pool Stats integration."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.components.diagnostics import REDACTED, async_redact_data
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    CONF_ACCOUNT_ID,
+    CONF_ADDRESS,
+    CONF_API_KEY,
+    CONF_TITLE,
+    CONF_UNIQUE_ID,
+    CONF_WEBHOOK_ID,
+)
+from .coordinator import PoolConfigEntry
+from .transport import async_get_transport
+
+TO_REDACT = {
+    CONF_ACCOUNT_ID,
+    CONF_ADDRESS,
+    CONF_API_KEY,
+    CONF_TITLE,
+    CONF_UNIQUE_ID,
+    CONF_WEBHOOK_ID,
+}
+
+
+def _redact_address(text: str | None, address: str) -> str | None:
+    """Redact the address from an error message."""
+    if text is None or not address:
+        return text
+    return text.replace(address, REDACTED)
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: PoolConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = entry.runtime_data
+    metrics = coordinator.metrics
+    update_interval = coordinator.update_interval
+    address = entry.data[CONF_ADDRESS]
+
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": async_redact_data(entry.options, TO_REDACT),
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "last_exception": _redact_address(
+                str(coordinator.last_exception)
+                if coordinator.last_exception is not None
+                else None,
+                address,
+            ),
+            "update_interval": (
+                update_interval.total_seconds() if update_interval else None
+            ),
+            "push_active": coordinator.push_active,
+            "worker_count": (
+                coordinator.data.worker_count if coordinator.data else None
+            ),
+        },
+        "polls": [
+            asdict(record) | {"error": _redact_address(record.error, address)}
+            for record in metrics.poll_history
+        ],
+        "stages": {
+            stage: {
+                "last_ms": statistics.last,
+                "p95_ms": statistics.percentile(95),
+            }
+            for stage, statistics in metrics.stages.items()
+        },
+        "payload_bytes": {
+            "last": metrics.payload_bytes.last,
+            "p95": metrics.payload_bytes.percentile(95),
+        },
+        "backoff": [
+            {
+                "time": record.time,
+                "source": record.source,
+                "delay": record.delay.total_seconds() if record.delay else None,
+                "reason": _redact_address(record.reason, address),
+            }
+            for record in metrics.backoff_history
+        ],
+        "recorder_lookups": metrics.recorder_lookups,
+        "loop_watchdog": (
+            {
+                "threshold_ms": watchdog.threshold_ms,
+                "warnings": watchdog.warnings,
+                "histograms": watchdog.as_dict(),
+            }
+            if (watchdog := coordinator.watchdog) is not None
+            else None
+        ),
+        "transport": {
+            host: asdict(statistics)
+            for host, statistics in async_get_transport(hass).host_statistics.items()
+        },
+    }
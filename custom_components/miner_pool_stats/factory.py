@@ -3,10 +3,13 @@
 from typing import Any
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.importlib import async_import_module
 
 from .const import (
+    POOL_SOURCE_CGMINER_KEY,
     POOL_SOURCE_CK_POOL_KEY,
     POOL_SOURCE_COIN_MINERS_KEY,
+    POOL_SOURCE_CUSTOM_JSON_KEY,
     POOL_SOURCE_F2_POOL_KEY,
     POOL_SOURCE_MINING_CORE_KEY,
     POOL_SOURCE_MINING_DUTCH_KEY,
@@ -14,38 +17,35 @@ from .const import (
     POOL_SOURCE_SOLO_POOL_KEY,
 )
 from .pool import CONF_POOL_KEY, PoolClient, PoolInitData
-from .pool_ckpool import CKPoolClient
-from .pool_coin_miners import CoinMinersPoolClient
-from .pool_f2 import F2PoolClient
-from .pool_mining_core import MiningCorePoolClient
-from .pool_mining_dutch import MiningDutchPoolClient
-from .pool_public import PublicPoolClient
-from .pool_solo import SoloPoolClient
+
+# Module and class of the client of each pool source, imported on first use
+POOL_CLIENTS: dict[str, tuple[str, str]] = {
+    POOL_SOURCE_COIN_MINERS_KEY: ("pool_coin_miners", "CoinMinersPoolClient"),
+    POOL_SOURCE_PUBLIC_POOL_KEY: ("pool_public", "PublicPoolClient"),
+    POOL_SOURCE_F2_POOL_KEY: ("pool_f2", "F2PoolClient"),
+    POOL_SOURCE_SOLO_POOL_KEY: ("pool_solo", "SoloPoolClient"),
+    POOL_SOURCE_CK_POOL_KEY: ("pool_ckpool", "CKPoolClient"),
+    POOL_SOURCE_MINING_DUTCH_KEY: ("pool_mining_dutch", "MiningDutchPoolClient"),
+    POOL_SOURCE_MINING_CORE_KEY: ("pool_mining_core", "MiningCorePoolClient"),
+    POOL_SOURCE_CUSTOM_JSON_KEY: ("pool_custom_json", "CustomJsonPoolClient"),
+    POOL_SOURCE_CGMINER_KEY: ("pool_cgminer", "CgminerPoolClient"),
+}
 
 
 class PoolFactory:
     """Factory for creating PoolClient instances."""
 
     @staticmethod
-    def get(hass: HomeAssistant, config_data: dict[str, Any]) -> PoolClient:
+    async def async_get(hass: HomeAssistant, config_data: dict[str, Any]) -> PoolClient:
         """Get a PoolClient instance based on the pool source."""
 
         source = config_data[CONF_POOL_KEY]
-        pool_config = PoolInitData(config_data)
-
-        if source == POOL_SOURCE_COIN_MINERS_KEY:
-            return CoinMinersPoolClient(hass, pool_config)
-        if source == POOL_SOURCE_PUBLIC_POOL_KEY:
-            return PublicPoolClient(hass, pool_config)
-        if source == POOL_SOURCE_F2_POOL_KEY:
-            return F2PoolClient(hass, pool_config)
-        if source == POOL_SOURCE_SOLO_POOL_KEY:
-            return SoloPoolClient(hass, pool_config)
-        if source == POOL_SOURCE_CK_POOL_KEY:
-            return CKPoolClient(hass, pool_config)
-        if source == POOL_SOURCE_MINING_DUTCH_KEY:
-            return MiningDutchPoolClient(hass, pool_config)
-        if source == POOL_SOURCE_MINING_CORE_KEY:
-            return MiningCorePoolClient(hass, pool_config)
-
-        raise ValueError(f"Unsupported pool source: {source}")
+        if (client := POOL_CLIENTS.get(source)) is None:
+            raise ValueError(f"Unsupported pool source: {source}")
+
+        # the module is imported in the executor the first time it is used
+        module_name, class_name = client
+        module = await async_import_module(hass, f"{__package__}.{module_name}")
+        client_class: type[PoolClient] = getattr(module, class_name)
+
+        return client_class(hass, PoolInitData(config_data))
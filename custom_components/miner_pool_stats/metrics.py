@@ -0,0 +1,213 @@
+"""Poll instrumentation for the Miner Pool Stats integration."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import StrEnum
+import logging
+import math
+
+from homeassistant.util.dt import utcnow
+
+_LOGGER = logging.getLogger(__name__)
+
+# Number of polls kept to compute the percentiles
+METRICS_SAMPLE_COUNT = 100
+
+# Number of polls and backoff changes kept for the diagnostics
+HISTORY_COUNT = 20
+
+
+class PollStage(StrEnum):
+    """Stages of a poll."""
+
+    DNS = "dns"
+    CONNECT = "connect"
+    TTFB = "ttfb"
+    DOWNLOAD = "download"
+    DECODE = "decode"
+    PARSE = "parse"
+    RECORDER = "recorder"
+    DISPATCH = "dispatch"
+    TOTAL = "total"
+
+
+class SampleStatistics:
+    """Last value and percentiles of the recent samples."""
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.samples: deque[float] = deque(maxlen=METRICS_SAMPLE_COUNT)
+
+    def add(self, value: float) -> None:
+        """Add a sample."""
+        self.samples.append(value)
+
+    @property
+    def last(self) -> float | None:
+        """Return the last sample."""
+        return self.samples[-1] if self.samples else None
+
+    def percentile(self, percent: float) -> float | None:
+        """Return the nearest-rank percentile of the samples."""
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+        return ordered[rank - 1]
+
+
+@dataclass
+class PollRecord:
+    """Outcome of a single poll."""
+
+    started: datetime
+    duration_ms: float
+    error: str | None
+    payload_bytes: int
+    worker_count: int | None
+    recorder_lookups: int
+
+
+@dataclass
+class BackoffRecord:
+    """Change of the polling or reconnect delay."""
+
+    time: datetime
+    source: str
+    delay: timedelta | None
+    reason: str
+
+
+class PollMetrics:
+    """Per-stage timings and payload sizes of the polls of a config entry."""
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.stages = {stage: SampleStatistics() for stage in PollStage}
+        self.payload_bytes = SampleStatistics()
+        self.poll_history: deque[PollRecord] = deque(maxlen=HISTORY_COUNT)
+        self.backoff_history: deque[BackoffRecord] = deque(maxlen=HISTORY_COUNT)
+        self.recorder_lookups = 0
+        self._poll: dict[PollStage, float] | None = None
+        self._poll_started = utcnow()
+        self._poll_bytes = 0
+        self._poll_recorder_lookups = 0
+
+    @property
+    def poll_in_progress(self) -> bool:
+        """Return True if a poll is being measured."""
+        return self._poll is not None
+
+    def start_poll(self) -> None:
+        """Start measuring a poll."""
+        self._poll = dict.fromkeys(PollStage, 0.0)
+        self._poll_started = utcnow()
+        self._poll_bytes = 0
+        self._poll_recorder_lookups = 0
+
+    def finish_poll(
+        self,
+        total: float,
+        error: str | None = None,
+        worker_count: int | None = None,
+    ) -> None:
+        """Store the measurements and the outcome of the current poll."""
+        if self._poll is None:
+            return
+        self._poll[PollStage.TOTAL] = total
+        for stage, seconds in self._poll.items():
+            # dispatching happens after the poll and is added on its own
+            if stage is not PollStage.DISPATCH:
+                self.stages[stage].add(seconds * 1000)
+        self.payload_bytes.add(self._poll_bytes)
+        self.poll_history.append(
+            PollRecord(
+                started=self._poll_started,
+                duration_ms=total * 1000,
+                error=error,
+                payload_bytes=self._poll_bytes,
+                worker_count=worker_count,
+                recorder_lookups=self._poll_recorder_lookups,
+            )
+        )
+        self._poll = None
+
+    def add(self, stage: PollStage, seconds: float) -> None:
+        """Add the time spent in a stage, a stage can occur several times per poll."""
+        if self._poll is not None:
+            self._poll[stage] += seconds
+        else:
+            self.stages[stage].add(seconds * 1000)
+
+    def add_payload(self, size: int) -> None:
+        """Add the size of a downloaded payload."""
+        if self._poll is not None:
+            self._poll_bytes += size
+        else:
+            self.payload_bytes.add(size)
+
+    def add_recorder_lookup(self) -> None:
+        """Count a lookup of a previous state in the recorder."""
+        self.recorder_lookups += 1
+        if self._poll is not None:
+            self._poll_recorder_lookups += 1
+
+    def add_backoff(self, source: str, delay: timedelta | None, reason: str) -> None:
+        """Record a change of the polling or reconnect delay."""
+        self.backoff_history.append(BackoffRecord(utcnow(), source, delay, reason))
+
+    def stage_time(self, stage: PollStage) -> float:
+        """Return the time spent in a stage of the current poll in seconds."""
+        return self._poll[stage] if self._poll is not None else 0.0
+
+
+# Metrics of the poll running in the current task, used by the transport
+current_poll_metrics: ContextVar[PollMetrics | None] = ContextVar(
+    "current_poll_metrics", default=None
+)
+
+
+class LoopWatchdog:
+    """Track how long the steps of an entry block the event loop."""
+
+    # Upper bounds of the histogram buckets in milliseconds
+    BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+    def __init__(self, name: str, threshold_ms: float) -> None:
+        """Initialize the watchdog."""
+        self.name = name
+        self.threshold_ms = threshold_ms
+        self.histograms: dict[str, list[int]] = {}
+        self.warnings = 0
+
+    def add(self, step: str, seconds: float, worker_count: int | None) -> None:
+        """Add the time a step ran on the event loop, warning above the threshold."""
+        duration_ms = seconds * 1000
+        histogram = self.histograms.setdefault(step, [0] * (len(self.BUCKETS_MS) + 1))
+        histogram[bisect_left(self.BUCKETS_MS, duration_ms)] += 1
+
+        if duration_ms > self.threshold_ms:
+            self.warnings += 1
+            _LOGGER.warning(
+                "%s blocked the event loop for %.1f ms in %s with %s workers,"
+                " above the threshold of %s ms",
+                self.name,
+                duration_ms,
+                step,
+                worker_count,
+                self.threshold_ms,
+            )
+
+    def as_dict(self) -> dict[str, dict[str, int]]:
+        """Return the histograms with the bucket labels."""
+        labels = [f"<={bound}ms" for bound in self.BUCKETS_MS]
+        labels.append(f">{self.BUCKETS_MS[-1]}ms")
+        return {
+            step: dict(zip(labels, histogram, strict=True))
+            for step, histogram in self.histograms.items()
+        }
@@ -0,0 +1,166 @@
+"""Mining Core WebSocket notifications for the Miner Pool Stats integration."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import replace
+from datetime import timedelta
+import logging
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import ClientError, WSMsgType
+from yarl import URL
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.json import json_loads
+
+from .hash import HashRate, HashRateUnit
+from .pool import PoolAddressWorkerData, PoolInitData
+
+if TYPE_CHECKING:
+    from .coordinator import PoolConfigEntry, PoolCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+NOTIFICATIONS_PATH = "notifications"
+HEARTBEAT_INTERVAL: float = 30
+RECONNECT_MIN_DELAY: float = 5
+RECONNECT_MAX_DELAY: float = 300
+
+NOTIFICATION_HASHRATE_UPDATED = "hashrateupdated"
+# notifications that change the balance or payout figures of a miner
+NOTIFICATIONS_REFRESH = {"blockfound", "blockunlocked", "payment"}
+
+
+def get_notifications_url(pool_url: str) -> URL:
+    """Get the WebSocket notification relay url of a Mining Core instance."""
+    url = URL(pool_url)
+    scheme = "wss" if url.scheme == "https" else "ws"
+    return url.with_scheme(scheme).with_path(f"/{NOTIFICATIONS_PATH}")
+
+
+class MiningCoreNotificationListener:
+    """Apply Mining Core WebSocket notifications to the coordinator data."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: PoolConfigEntry,
+        coordinator: PoolCoordinator,
+        pool_config: PoolInitData,
+    ) -> None:
+        """Initialize the listener."""
+        self._hass = hass
+        self._entry = entry
+        self._coordinator = coordinator
+        self._pool_config = pool_config
+        self._url = get_notifications_url(pool_config.pool_url or "")
+
+    @callback
+    def async_start(self) -> None:
+        """Start listening, the task is cancelled when the entry is unloaded."""
+        self._entry.async_create_background_task(
+            self._hass,
+            self._async_run(),
+            f"{self._pool_config.title} Mining Core notifications",
+        )
+
+    async def _async_run(self) -> None:
+        """Keep the WebSocket connected, reconnecting with a backoff."""
+
+        delay = RECONNECT_MIN_DELAY
+        while True:
+            try:
+                await self._async_listen()
+            except (ClientError, TimeoutError) as error:
+                _LOGGER.debug(
+                    "Mining Core notifications from %s failed: %s", self._url, error
+                )
+                delay = min(delay * 2, RECONNECT_MAX_DELAY)
+                reason = str(error) or type(error).__name__
+            else:
+                delay = RECONNECT_MIN_DELAY
+                reason = "connection closed"
+
+            self._coordinator.metrics.add_backoff(
+                "notifications", timedelta(seconds=delay), reason
+            )
+            self._coordinator.async_push_stopped()
+            await asyncio.sleep(delay)
+
+    async def _async_listen(self) -> None:
+        """Listen until the connection is closed."""
+
+        session = async_get_clientsession(self._hass)
+        _LOGGER.debug("Connecting to Mining Core notifications at %s", self._url)
+
+        async with session.ws_connect(self._url, heartbeat=HEARTBEAT_INTERVAL) as ws:
+            async for message in ws:
+                if message.type != WSMsgType.TEXT:
+                    break
+                try:
+                    notification = json_loads(message.data)
+                except ValueError:
+                    _LOGGER.debug("Invalid notification: %s", message.data)
+                    continue
+                if isinstance(notification, dict):
+                    self._async_handle_notification(notification)
+
+    @callback
+    def _async_handle_notification(self, notification: dict[str, Any]) -> None:
+        """Handle a notification of the relay."""
+
+        notification_type = str(notification.get("type", "")).lower()
+        if notification.get("poolId") != self._pool_config.coin_key:
+            return
+        if notification.get("miner") != self._pool_config.address:
+            return
+
+        if notification_type == NOTIFICATION_HASHRATE_UPDATED:
+            self._async_apply_hashrate(notification)
+        elif notification_type in NOTIFICATIONS_REFRESH:
+            # balances are not part of the notification, fetch them
+            self._entry.async_create_task(
+                self._hass, self._coordinator.async_request_refresh(), eager_start=True
+            )
+
+    @callback
+    def _async_apply_hashrate(self, notification: dict[str, Any]) -> None:
+        """Apply a worker hash rate update to the coordinator data."""
+
+        data = self._coordinator.data
+        worker_name = notification.get("worker")
+        if data is None or worker_name is None:
+            return
+
+        # Hashrate is provided in H/s, convert to GH/s
+        try:
+            hash_rate = (
+                HashRate.from_number(float(notification.get("hashrate") or 0))
+                .to_unit(HashRateUnit.GH)
+                .value
+            )
+        except (TypeError, ValueError):
+            _LOGGER.debug("Invalid hashrate in notification: %s", notification)
+            return
+
+        workers = {worker.name: worker for worker in data.worker_list}
+        if worker_name in workers:
+            # the online state of a known worker comes from the polled data
+            workers[worker_name] = replace(workers[worker_name], hash_rate=hash_rate)
+        else:
+            workers[worker_name] = PoolAddressWorkerData(
+                name=worker_name,
+                best_difficulty=None,
+                hash_rate=hash_rate,
+                is_online=hash_rate > 0,
+            )
+
+        self._coordinator.async_set_pushed_data(
+            replace(
+                data,
+                worker_count=len(workers),
+                worker_list=list(workers.values()),
+            )
+        )
@@ -1,13 +1,25 @@
 """API for the Miner Pool Stats integration."""
 
+from __future__ import annotations
+
 from abc import abstractmethod
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+from enum import StrEnum
 from functools import partial
-from typing import Any
+import logging
+from time import monotonic
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from aiohttp import ClientError, ClientTimeout
 
 from homeassistant.components.recorder import get_instance, history
 from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN
 from homeassistant.core import HomeAssistant
+from homeassistant.util.dt import as_utc, parse_datetime
+from homeassistant.util.json import json_loads
 
 from .const import (
     CONF_ADDRESS,
@@ -19,14 +31,32 @@ from .const import (
     CONF_POOL_URL,
     CONF_TITLE,
     CONF_UNIQUE_ID,
+    DEFAULT_ONLINE_THRESHOLD,
     KEY_BEST_DIFFICULTY,
 )
+from .metrics import PollStage, current_poll_metrics
+from .transport import async_get_transport
+
+if TYPE_CHECKING:
+    from .capture import ResponseCapture
+
+_LOGGER = logging.getLogger(__name__)
+
+# Same as the aiohttp default
+DEFAULT_TIMEOUT = ClientTimeout(total=5 * 60, sock_connect=30)
 
 
 class PoolConnectionError(Exception):
     """Raised when data can not be fetched from the server."""
 
 
+class PoolDataTier(StrEnum):
+    """Groups of pool data that change at different rates."""
+
+    FAST = "fast"  # workers, hash rates and online status
+    SLOW = "slow"  # total paid and current balance
+
+
 @dataclass
 class PoolInitData:
     """Representation of Pool initialization data."""
@@ -64,6 +94,8 @@ class PoolAddressWorkerData:
     best_difficulty: float | None
     hash_rate: float | None
     is_online: bool
+    last_seen: datetime | None = None
+    start_time: datetime | None = None
 
 
 @dataclass
@@ -76,29 +108,185 @@ class PoolAddressData:
     worker_count: int
     worker_list: list[PoolAddressWorkerData]
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> PoolAddressData:
+        """Create an instance from a dictionary in the shape of this class."""
+        worker_list = [
+            PoolAddressWorkerData(
+                name=str(worker["name"]),
+                best_difficulty=_optional_float(worker.get("best_difficulty")),
+                hash_rate=_optional_float(worker.get("hash_rate")),
+                is_online=bool(worker.get("is_online", True)),
+                last_seen=_optional_datetime(worker.get("last_seen")),
+                start_time=_optional_datetime(worker.get("start_time")),
+            )
+            for worker in data["worker_list"]
+        ]
+        return cls(
+            total_paid=_optional_float(data.get("total_paid")),
+            current_balance=_optional_float(data.get("current_balance")),
+            best_difficulty=_optional_float(data.get("best_difficulty")),
+            worker_count=int(data.get("worker_count", len(worker_list))),
+            worker_list=worker_list,
+        )
+
+
+def _optional_float(value: Any) -> float | None:
+    """Convert a value to a float, keeping None."""
+    return None if value is None else float(value)
+
+
+def _optional_datetime(value: Any) -> datetime | None:
+    """Convert an ISO 8601 string to a datetime in UTC, keeping None."""
+    if value is None or (parsed := parse_datetime(str(value))) is None:
+        return None
+    return as_utc(parsed)
+
+
+def merge_tier_data(
+    fast_data: PoolAddressData, slow_data: PoolAddressData | None
+) -> PoolAddressData:
+    """Merge the slow tier fields into the fast tier data."""
+    if slow_data is None:
+        return fast_data
+    return replace(
+        fast_data,
+        total_paid=slow_data.total_paid,
+        current_balance=slow_data.current_balance,
+    )
+
 
 class PoolClient:
     """Client for interacting with the pool."""
 
+    # Tiers fetched by the client and how often each is refreshed. When the
+    # slow tier is not declared, its fields are returned with the fast tier.
+    data_tiers: ClassVar[Mapping[PoolDataTier, timedelta]] = MappingProxyType(
+        {PoolDataTier.FAST: timedelta(seconds=300)}
+    )
+
     def __init__(self, hass: HomeAssistant, pool_config: PoolInitData) -> None:
         """Initialize the client instance."""
         self._hass = hass
         self._pool_config = pool_config
+        self._transport = async_get_transport(hass)
+        # writes the responses to the corpus when set
+        self.capture: ResponseCapture | None = None
+        # time since the last share after which a worker is offline
+        self.online_threshold = timedelta(minutes=DEFAULT_ONLINE_THRESHOLD)
+        # replaces the timeout of the requests when set
+        self.request_timeout: float | None = None
+
+    @property
+    def pool_config(self) -> PoolInitData:
+        """Return the pool configuration."""
+        return self._pool_config
 
     async def async_initialize(self, config_data: dict[str, Any]) -> dict[str, Any]:
         """Perform async initialization of client instance."""
         await self.async_get_data()
         return config_data
 
-    @abstractmethod
     async def async_get_data(self) -> PoolAddressData:
         """Fetch data from the pool."""
+        json = await self._async_fetch_data()
+
+        metrics = current_poll_metrics.get()
+        if metrics is None:
+            return await self.async_parse_data(json)
+
+        # recorder lookups made while parsing are measured on their own
+        recorder_time = metrics.stage_time(PollStage.RECORDER)
+        start = monotonic()
+        data = await self.async_parse_data(json)
+        metrics.add(
+            PollStage.PARSE,
+            monotonic()
+            - start
+            - (metrics.stage_time(PollStage.RECORDER) - recorder_time),
+        )
+        return data
+
+    @abstractmethod
+    async def _async_fetch_data(self) -> Any:
+        """Fetch the raw response from the pool."""
+
+    @abstractmethod
+    async def async_parse_data(self, json: Any) -> PoolAddressData:
+        """Parse a raw response of the pool."""
+
+    async def async_parse_pushed_data(self, payload: Any) -> PoolAddressData:
+        """Parse data pushed in the PoolAddressData shape or the pool's own shape."""
+        if isinstance(payload, dict) and "worker_list" in payload:
+            return PoolAddressData.from_dict(payload)
+        return await self.async_parse_data(payload)
+
+    async def async_get_tier_data(self, tier: PoolDataTier) -> PoolAddressData:
+        """Fetch the data of a single tier from the pool.
+
+        Clients with separate endpoints per tier override this to fetch only
+        the requested tier, the default fetches all data.
+        """
+        return await self.async_get_data()
+
+    async def _async_get_body(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> bytes:
+        """Get the response body from the pool."""
+        _LOGGER.debug("Fetching workers from %s", url)
+
+        timeout = self.request_timeout or timeout
+        start = monotonic()
+        try:
+            response = await self._transport.async_get(
+                url,
+                headers,
+                ClientTimeout(total=timeout) if timeout else DEFAULT_TIMEOUT,
+            )
+        except (ClientError, TimeoutError) as error:
+            raise PoolConnectionError(
+                f"Lookup of '{self._pool_config.address}' failed: {self._get_error_message(error)}"
+            ) from error
+
+        if self.capture is not None:
+            self.capture.async_add(url, response, monotonic() - start)
+
+        if response.status != 200:
+            raise PoolConnectionError(
+                f"Lookup of '{self._pool_config.address}' failed: Status code {response.status}"
+            )
+
+        return response.body
+
+    async def _async_get_json(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> Any:
+        """Get a JSON response from the pool."""
+        body = await self._async_get_body(url, headers, timeout)
+
+        start = monotonic()
+        try:
+            return json_loads(body)
+        except ValueError as error:
+            raise PoolConnectionError(
+                f"Lookup of '{self._pool_config.address}' failed: Invalid JSON response"
+            ) from error
+        finally:
+            if (metrics := current_poll_metrics.get()) is not None:
+                metrics.add(PollStage.DECODE, monotonic() - start)
 
     async def _get_max_best_difficulty(self, worker_name: str) -> float:
         """Get the maximum value for the difficulty sensor."""
 
         entity_id = f"{SENSOR_DOMAIN}.{self._pool_config.unique_id}_{worker_name}_{KEY_BEST_DIFFICULTY}"
 
+        start = monotonic()
         val = await get_instance(self._hass).async_add_executor_job(
             partial(
                 history.get_last_state_changes,
@@ -107,6 +295,9 @@ class PoolClient:
                 entity_id=entity_id,
             )
         )
+        if (metrics := current_poll_metrics.get()) is not None:
+            metrics.add(PollStage.RECORDER, monotonic() - start)
+            metrics.add_recorder_lookup()
 
         if val is not None:
             states = val.get(entity_id)
@@ -0,0 +1,221 @@
+"""cgminer API Client for the Miner Pool Stats integration."""
+
+import asyncio
+from collections.abc import Mapping
+from contextlib import suppress
+from datetime import datetime, timedelta
+import logging
+import re
+from time import monotonic
+from types import MappingProxyType
+from typing import Any, ClassVar
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util.dt import utc_from_timestamp, utcnow
+from homeassistant.util.json import json_loads
+
+from .const import CONF_HOSTS
+from .hash import HashRate, HashRateUnit
+from .metrics import PollStage, current_poll_metrics
+from .pool import (
+    PoolAddressData,
+    PoolAddressWorkerData,
+    PoolClient,
+    PoolConnectionError,
+    PoolDataTier,
+    PoolInitData,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Port of the cgminer API
+DEFAULT_PORT = 4028
+
+# Miners queried at the same time
+MINER_CONCURRENCY_LIMIT = 32
+
+# Default time a single miner has to answer in seconds
+MINER_TIMEOUT: float = 3
+
+# The miner closes the connection after each command, so both are sent at once
+COMMAND = b'{"command":"summary+pools"}'
+
+# Drift of the computed start time of a miner that is not a restart
+START_TIME_TOLERANCE = timedelta(seconds=10)
+
+# Hash rate fields of the summary by preference, firmwares report different ones
+SUMMARY_HASH_RATES = (
+    ("GHS 5s", HashRateUnit.GH),
+    ("MHS 5s", HashRateUnit.MH),
+    ("GHS av", HashRateUnit.GH),
+    ("MHS av", HashRateUnit.MH),
+)
+
+
+def parse_hosts(value: str) -> list[str]:
+    """Parse a list of miners separated by commas or whitespace.
+
+    Raises ValueError when a miner is not a host with an optional port.
+    """
+    hosts = [host for host in re.split(r"[\s,]+", value) if host]
+    for host in hosts:
+        split_host(host)
+    return hosts
+
+
+def split_host(host: str) -> tuple[str, int]:
+    """Split a miner into its host and port, IPv6 addresses with a port use brackets."""
+    name, separator, port = host.rpartition(":")
+    if not separator or (":" in name and not name.endswith("]")):
+        return host.strip("[]"), DEFAULT_PORT
+    if not name or not port.isdigit() or not 0 < int(port) < 65536:
+        raise ValueError(f"Invalid miner '{host}'")
+    return name.strip("[]"), int(port)
+
+
+class CgminerPoolClient(PoolClient):
+    """Client polling miners on the local network over the cgminer API."""
+
+    data_tiers: ClassVar[Mapping[PoolDataTier, timedelta]] = MappingProxyType(
+        {PoolDataTier.FAST: timedelta(seconds=30)}
+    )
+
+    def __init__(self, hass: HomeAssistant, pool_config: PoolInitData) -> None:
+        """Initialize the client instance."""
+        super().__init__(hass, pool_config)
+        self._hosts = {
+            host: split_host(host) for host in pool_config.config_data[CONF_HOSTS]
+        }
+        self._semaphore = asyncio.Semaphore(MINER_CONCURRENCY_LIMIT)
+        self._start_times: dict[str, datetime] = {}
+
+    async def _async_fetch_data(self) -> Any:
+        """Query all miners, unreachable miners have no response."""
+        responses = await asyncio.gather(
+            *(self._async_query(host, port) for host, port in self._hosts.values())
+        )
+        if all(response is None for response in responses):
+            raise PoolConnectionError(
+                f"Lookup of '{self._pool_config.address}' failed:"
+                f" none of the {len(responses)} miners answered"
+            )
+        return dict(zip(self._hosts, responses, strict=True))
+
+    async def _async_query(self, host: str, port: int) -> Any:
+        """Send the command to a miner, returns None when it does not answer."""
+        async with self._semaphore:
+            start = monotonic()
+            try:
+                async with asyncio.timeout(self.request_timeout or MINER_TIMEOUT):
+                    reader, writer = await asyncio.open_connection(host, port)
+                    try:
+                        writer.write(COMMAND)
+                        await writer.drain()
+                        body = await reader.read()
+                    finally:
+                        writer.close()
+                        with suppress(OSError):
+                            await writer.wait_closed()
+            except (OSError, TimeoutError) as error:
+                _LOGGER.debug(
+                    "Miner %s:%s did not answer: %s",
+                    host,
+                    port,
+                    self._get_error_message(error),
+                )
+                return None
+
+        if (metrics := current_poll_metrics.get()) is not None:
+            metrics.add(PollStage.DOWNLOAD, monotonic() - start)
+            metrics.add_payload(len(body))
+
+        start = monotonic()
+        try:
+            # the response is terminated by a null byte
+            return json_loads(body.rstrip(b"\x00"))
+        except ValueError:
+            _LOGGER.debug("Miner %s:%s sent an invalid response", host, port)
+            return None
+        finally:
+            if (metrics := current_poll_metrics.get()) is not None:
+                metrics.add(PollStage.DECODE, monotonic() - start)
+
+    async def async_parse_data(self, json: Any) -> PoolAddressData:
+        """Parse the responses of the miners."""
+
+        # one reference time for all miners of the poll
+        reference = utcnow()
+        workers: list[PoolAddressWorkerData] = []
+        for name, response in json.items():
+            worker = None
+            if response is not None:
+                try:
+                    worker = self._parse_miner(name, response, reference)
+                except (IndexError, KeyError, TypeError, ValueError) as error:
+                    _LOGGER.debug("Unexpected response of miner %s: %s", name, error)
+            workers.append(
+                worker or PoolAddressWorkerData(name, None, 0.0, is_online=False)
+            )
+
+        return PoolAddressData(
+            None,  # total_paid - not known by the miners
+            None,  # current_balance - not known by the miners
+            max((worker.best_difficulty or 0.0 for worker in workers), default=0.0),
+            len(workers),
+            workers,
+        )
+
+    def _parse_miner(
+        self, name: str, response: Any, reference: datetime
+    ) -> PoolAddressWorkerData:
+        """Parse the summary and pools of a miner."""
+        summary = response["summary"][0]["SUMMARY"][0]
+        pools = response["pools"][0].get("POOLS") or []
+
+        hash_rate = 0.0
+        for key, unit in SUMMARY_HASH_RATES:
+            if key in summary:
+                hash_rate = (
+                    HashRate(float(summary[key]), unit).to_unit(HashRateUnit.GH).value
+                )
+                break
+
+        best_difficulty = max(
+            [float(summary.get("Best Share") or 0)]
+            + [float(pool.get("Best Share") or 0) for pool in pools]
+        )
+
+        # seconds since the epoch, 0 before the first share
+        last_share = max(
+            (
+                share_time
+                for pool in pools
+                if isinstance(share_time := pool.get("Last Share Time"), int | float)
+            ),
+            default=0,
+        )
+
+        return PoolAddressWorkerData(
+            name,
+            best_difficulty,
+            hash_rate,
+            # the miner is hashing for a pool
+            is_online=any(pool.get("Status") == "Alive" for pool in pools)
+            if pools
+            else hash_rate > 0,
+            last_seen=utc_from_timestamp(last_share) if last_share > 0 else None,
+            start_time=self._get_start_time(name, summary, reference),
+        )
+
+    def _get_start_time(
+        self, name: str, summary: dict[str, Any], reference: datetime
+    ) -> datetime | None:
+        """Get the start time of a miner from its uptime, stable between polls."""
+        if "Elapsed" not in summary:
+            return None
+        start_time = reference - timedelta(seconds=float(summary["Elapsed"]))
+        previous = self._start_times.get(name)
+        if previous is not None and abs(start_time - previous) < START_TIME_TOLERANCE:
+            return previous
+        self._start_times[name] = start_time.replace(microsecond=0)
+        return self._start_times[name]
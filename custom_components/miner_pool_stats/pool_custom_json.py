@@ -0,0 +1,66 @@
+"""Custom JSON Pool Client for the Miner Pool Stats integration."""
+
+import hashlib
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    CONF_BEST_DIFFICULTY_PATH,
+    CONF_CURRENT_BALANCE_PATH,
+    CONF_HASH_RATE_PATH,
+    CONF_HASH_RATE_UNIT,
+    CONF_JSON_URL,
+    CONF_TOTAL_PAID_PATH,
+    CONF_WORKER_NAME_PATH,
+    CONF_WORKERS_PATH,
+)
+from .definition import DeclarativePoolClient, PoolDefinition, get_template_fields
+from .hash import HashRateUnit
+from .pool import PoolInitData
+
+# Placeholders allowed in the url of a custom pool
+URL_TEMPLATE_FIELDS = frozenset({"address", "api_key", "coin_key"})
+
+
+def is_valid_url_template(template: str) -> bool:
+    """Return True if the url only uses the allowed placeholders."""
+    try:
+        fields = get_template_fields(template)
+    except ValueError:
+        return False
+    return (
+        template.startswith(("http://", "https://")) and fields <= URL_TEMPLATE_FIELDS
+    )
+
+
+def get_url_id(template: str) -> str:
+    """Get a short id of the url, telling entries of different custom pools apart."""
+    return hashlib.sha256(template.encode()).hexdigest()[:8]
+
+
+def definition_from_config(config_data: dict[str, Any]) -> PoolDefinition:
+    """Create the definition of a pool configured by the user."""
+    worker_name = config_data.get(CONF_WORKER_NAME_PATH) or None
+    return PoolDefinition(
+        url=config_data[CONF_JSON_URL],
+        workers=config_data.get(CONF_WORKERS_PATH) or "",
+        # without a name path the workers are a mapping keyed by name
+        workers_by_name=worker_name is None,
+        worker_name=worker_name,
+        hash_rate=config_data[CONF_HASH_RATE_PATH],
+        hash_rate_unit=HashRateUnit[config_data.get(CONF_HASH_RATE_UNIT, "H")],
+        best_difficulty=config_data.get(CONF_BEST_DIFFICULTY_PATH) or None,
+        total_paid=config_data.get(CONF_TOTAL_PAID_PATH) or None,
+        current_balance=config_data.get(CONF_CURRENT_BALANCE_PATH) or None,
+    )
+
+
+class CustomJsonPoolClient(DeclarativePoolClient):
+    """Client of a JSON pool API described in the config entry."""
+
+    def __init__(self, hass: HomeAssistant, pool_config: PoolInitData) -> None:
+        """Initialize the client instance and compile the configured paths."""
+        super().__init__(
+            hass, pool_config, definition_from_config(pool_config.config_data)
+        )
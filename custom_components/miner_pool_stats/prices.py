@@ -0,0 +1,225 @@
+"""Shared coin prices for the Miner Pool Stats integration."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import asyncio
+from collections import Counter
+from collections.abc import Callable, Mapping
+import logging
+from time import monotonic
+
+from aiohttp import ClientError, ClientTimeout
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.json import json_loads
+
+from .const import DOMAIN, CryptoCoin
+from .transport import async_get_transport
+
+_LOGGER = logging.getLogger(__name__)
+
+# Time the prices are served from memory in seconds
+PRICE_TTL: float = 10 * 60
+
+COINGECKO_URL = "https://api.coingecko.com/api/v3/simple/price"
+
+COINGECKO_TIMEOUT = ClientTimeout(total=30)
+
+# CoinGecko ids of the coins with a market price
+COINGECKO_IDS: dict[CryptoCoin, str] = {
+    CryptoCoin.ALEO: "aleo",
+    CryptoCoin.BCH: "bitcoin-cash",
+    CryptoCoin.BTC: "bitcoin",
+    CryptoCoin.BTG: "bitcoin-gold",
+    CryptoCoin.CFX: "conflux-token",
+    CryptoCoin.CKB: "nervos-network",
+    CryptoCoin.CLORE: "clore-ai",
+    CryptoCoin.DASH: "dash",
+    CryptoCoin.DOGE: "dogecoin",
+    CryptoCoin.ELA: "elastos",
+    CryptoCoin.ERG: "ergo",
+    CryptoCoin.ETC: "ethereum-classic",
+    CryptoCoin.ETHW: "ethereum-pow-iou",
+    CryptoCoin.HTR: "hathor",
+    CryptoCoin.IRON: "iron-fish",
+    CryptoCoin.KAS: "kaspa",
+    CryptoCoin.KDA: "kadena",
+    CryptoCoin.LTC: "litecoin",
+    CryptoCoin.NMC: "namecoin",
+    CryptoCoin.RVN: "ravencoin",
+    CryptoCoin.XEC: "ecash",
+    CryptoCoin.XMR: "monero",
+    CryptoCoin.ZEC: "zcash",
+    CryptoCoin.ZEN: "zencash",
+}
+
+DATA_PRICES: HassKey[PriceService] = HassKey(f"{DOMAIN}_prices")
+
+
+class PriceProvider(ABC):
+    """Source of coin prices."""
+
+    @abstractmethod
+    def supports(self, coin: CryptoCoin) -> bool:
+        """Return True if the provider has a price for the coin."""
+
+    @abstractmethod
+    async def async_get_prices(
+        self, coins: set[CryptoCoin], currency: str
+    ) -> dict[CryptoCoin, float]:
+        """Get the prices of the coins in the currency."""
+
+
+class CoinGeckoPriceProvider(PriceProvider):
+    """Prices of the public CoinGecko API, all coins in one request."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the provider."""
+        self._transport = async_get_transport(hass)
+
+    def supports(self, coin: CryptoCoin) -> bool:
+        """Return True if the coin is listed on CoinGecko."""
+        return coin in COINGECKO_IDS
+
+    async def async_get_prices(
+        self, coins: set[CryptoCoin], currency: str
+    ) -> dict[CryptoCoin, float]:
+        """Get the prices of the coins in the currency."""
+        ids = {COINGECKO_IDS[coin]: coin for coin in coins}
+        currency = currency.lower()
+        response = await self._transport.async_get(
+            f"{COINGECKO_URL}?ids={','.join(sorted(ids))}&vs_currencies={currency}",
+            None,
+            COINGECKO_TIMEOUT,
+        )
+        if response.status != 200:
+            raise ValueError(f"Status code {response.status}")
+
+        return {
+            ids[coin_id]: float(prices[currency])
+            for coin_id, prices in json_loads(response.body).items()
+            if coin_id in ids and currency in prices
+        }
+
+
+class StaticPriceProvider(PriceProvider):
+    """Fixed prices, a local stand-in for the price API."""
+
+    def __init__(self, prices: Mapping[CryptoCoin, float]) -> None:
+        """Initialize the provider."""
+        self.prices = dict(prices)
+        self.requests = 0
+
+    def supports(self, coin: CryptoCoin) -> bool:
+        """Return True if the coin has a price."""
+        return coin in self.prices
+
+    async def async_get_prices(
+        self, coins: set[CryptoCoin], currency: str
+    ) -> dict[CryptoCoin, float]:
+        """Get the fixed prices of the coins, the currency is ignored."""
+        self.requests += 1
+        return {coin: self.prices[coin] for coin in coins if coin in self.prices}
+
+
+class PriceService:
+    """Serve the prices of the coins in use to all config entries.
+
+    The entries register their coin, the prices of all registered coins are
+    fetched in one request at most once per TTL and served from memory. Stale
+    prices are refreshed in the background, the registered entries are called
+    back once the request is done. When a fetch fails the previous prices are
+    kept.
+    """
+
+    def __init__(self, hass: HomeAssistant, provider: PriceProvider) -> None:
+        """Initialize the service."""
+        self._hass = hass
+        self._provider = provider
+        self._coins: Counter[CryptoCoin] = Counter()
+        self._listeners: list[Callable[[], None]] = []
+        self._prices: dict[CryptoCoin, float] = {}
+        self._currency: str | None = None
+        self._updated: float | None = None
+        # coins of the last request
+        self._requested: set[CryptoCoin] = set()
+        self._pending: asyncio.Task[None] | None = None
+
+    @callback
+    def async_register(
+        self, coin: CryptoCoin, update_callback: Callable[[], None]
+    ) -> CALLBACK_TYPE | None:
+        """Register a coin in use, returns None when it has no price.
+
+        The callback is called whenever the prices have been fetched.
+        """
+        if not self._provider.supports(coin):
+            return None
+
+        self._coins[coin] += 1
+        self._listeners.append(update_callback)
+
+        @callback
+        def _async_unregister() -> None:
+            self._listeners.remove(update_callback)
+            self._coins[coin] -= 1
+            if self._coins[coin] <= 0:
+                del self._coins[coin]
+                self._prices.pop(coin, None)
+
+        return _async_unregister
+
+    @callback
+    def async_get_price(self, coin: CryptoCoin) -> float | None:
+        """Get the price of a registered coin in the currency of Home Assistant.
+
+        A stale price is returned as is while it is refreshed in the background.
+        """
+        currency = self._hass.config.currency
+        stale = (
+            self._updated is None
+            or monotonic() - self._updated >= PRICE_TTL
+            or currency != self._currency
+            # a coin registered since the last request
+            or coin not in self._requested
+        )
+        if stale and (self._pending is None or self._pending.done()):
+            self._pending = self._hass.async_create_background_task(
+                self._async_update(currency), f"{DOMAIN} prices", eager_start=True
+            )
+        return self._prices.get(coin)
+
+    async def _async_update(self, currency: str) -> None:
+        """Fetch the prices of all registered coins."""
+        coins = set(self._coins)
+        try:
+            self._prices = await self._provider.async_get_prices(coins, currency)
+        except (ClientError, TimeoutError, KeyError, TypeError, ValueError) as error:
+            _LOGGER.warning("Unable to update the coin prices: %s", error)
+            if currency != self._currency:
+                self._prices.clear()
+
+        # a failed request is retried after the TTL instead of with every poll
+        self._updated = monotonic()
+        self._requested = coins
+        self._currency = currency
+
+        for update_callback in list(self._listeners):
+            update_callback()
+
+
+@callback
+def async_get_price_service(
+    hass: HomeAssistant, provider: PriceProvider | None = None
+) -> PriceService:
+    """Get the price service shared by the config entries.
+
+    The provider is used when the service is created, CoinGecko by default.
+    """
+    if (service := hass.data.get(DATA_PRICES)) is None:
+        service = hass.data[DATA_PRICES] = PriceService(
+            hass, provider or CoinGeckoPriceProvider(hass)
+        )
+    return service
@@ -4,23 +4,39 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from datetime import datetime
 
 from homeassistant.components.sensor import (
     DOMAIN as SENSOR_DOMAIN,
+    SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.const import EntityCategory
+from homeassistant.const import (
+    PERCENTAGE,
+    EntityCategory,
+    UnitOfInformation,
+    UnitOfTime,
+)
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.helpers.typing import StateType
 
 from .const import (
+    DOMAIN,
     KEY_BEST_DIFFICULTY,
+    KEY_BEST_SHARE_RATIO,
     KEY_CURRENT_BALANCE,
+    KEY_CURRENT_BALANCE_VALUE,
     KEY_HASH_RATE,
+    KEY_LAST_SEEN,
+    KEY_NETWORK_DIFFICULTY,
+    KEY_START_TIME,
+    KEY_TIME_TO_BLOCK,
     KEY_TOTAL_PAID,
+    KEY_TOTAL_PAID_VALUE,
     KEY_WORKER_COUNT,
     UNIT_DIFFICULTY,
     UNIT_HASH_RATE,
@@ -29,7 +45,9 @@ from .const import (
 )
 from .coordinator import PoolConfigEntry, PoolCoordinator
 from .entity import PoolAddressDeviceEntity, PoolAddressWorkerDeviceEntity
+from .metrics import PollMetrics, PollStage, SampleStatistics
 from .pool import PoolAddressData, PoolAddressWorkerData, PoolInitData
+from .solo import SoloMiningData
 
 # Coordinator is used to centralize the data updates.
 PARALLEL_UPDATES = 0
@@ -41,13 +59,38 @@ class PoolAddressSensorEntityDescription(SensorEntityDescription):
 
     value_fn: Callable[[PoolAddressData], StateType]
     is_currency: bool = False
+    # the coin amount is valued with the coin price in the local currency
+    is_fiat: bool = False
 
 
 @dataclass(frozen=True, kw_only=True)
 class PoolAddressWorkerEntityDescription(SensorEntityDescription):
     """Class describing Pool Address Worker sensor entities."""
 
-    value_fn: Callable[[PoolAddressWorkerData], StateType]
+    value_fn: Callable[[PoolAddressWorkerData], StateType | datetime]
+    long_term_statistics: bool = False
+    # keep the state for changes within the hash rate deadband option
+    deadband: bool = False
+
+
+@dataclass(frozen=True, kw_only=True)
+class PoolMetricsSensorEntityDescription(SensorEntityDescription):
+    """Class describing poll metrics sensor entities."""
+
+    value_fn: Callable[[PollMetrics], StateType]
+
+
+@dataclass(frozen=True, kw_only=True)
+class PoolSoloSensorEntityDescription(SensorEntityDescription):
+    """Class describing solo mining sensor entities."""
+
+    value_fn: Callable[[SoloMiningData], StateType]
+
+
+def _metrics_value(statistics: SampleStatistics, percentile: float | None) -> StateType:
+    """Get the last value or a percentile of the statistics."""
+    value = statistics.last if percentile is None else statistics.percentile(percentile)
+    return None if value is None else round(value, 1)
 
 
 ADDRESS_SENSOR_DESCRIPTIONS = [
@@ -67,6 +110,26 @@ ADDRESS_SENSOR_DESCRIPTIONS = [
         value_fn=lambda data: data.current_balance,
         entity_category=EntityCategory.DIAGNOSTIC,
     ),
+    PoolAddressSensorEntityDescription(
+        key=KEY_TOTAL_PAID_VALUE,
+        translation_key=KEY_TOTAL_PAID_VALUE,
+        device_class=SensorDeviceClass.MONETARY,
+        state_class=SensorStateClass.TOTAL,
+        suggested_display_precision=2,
+        is_fiat=True,
+        value_fn=lambda data: data.total_paid,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    PoolAddressSensorEntityDescription(
+        key=KEY_CURRENT_BALANCE_VALUE,
+        translation_key=KEY_CURRENT_BALANCE_VALUE,
+        device_class=SensorDeviceClass.MONETARY,
+        state_class=SensorStateClass.TOTAL,
+        suggested_display_precision=2,
+        is_fiat=True,
+        value_fn=lambda data: data.current_balance,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
     PoolAddressSensorEntityDescription(
         key=KEY_WORKER_COUNT,
         translation_key=KEY_WORKER_COUNT,
@@ -101,6 +164,85 @@ WORKER_SENSOR_DESCRIPTIONS = [
         native_unit_of_measurement=UNIT_HASH_RATE,
         value_fn=lambda worker: worker.hash_rate,
         entity_category=EntityCategory.DIAGNOSTIC,
+        long_term_statistics=True,
+        deadband=True,
+    ),
+    PoolAddressWorkerEntityDescription(
+        key=KEY_LAST_SEEN,
+        translation_key=KEY_LAST_SEEN,
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=lambda worker: worker.last_seen,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    PoolAddressWorkerEntityDescription(
+        key=KEY_START_TIME,
+        translation_key=KEY_START_TIME,
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=lambda worker: worker.start_time,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+]
+
+SOLO_SENSOR_DESCRIPTIONS = [
+    PoolSoloSensorEntityDescription(
+        key=KEY_NETWORK_DIFFICULTY,
+        translation_key=KEY_NETWORK_DIFFICULTY,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UNIT_DIFFICULTY,
+        value_fn=lambda solo: solo.network_difficulty,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    PoolSoloSensorEntityDescription(
+        key=KEY_TIME_TO_BLOCK,
+        translation_key=KEY_TIME_TO_BLOCK,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_unit_of_measurement=UnitOfTime.DAYS,
+        suggested_display_precision=1,
+        value_fn=lambda solo: solo.time_to_block,
+    ),
+    PoolSoloSensorEntityDescription(
+        key=KEY_BEST_SHARE_RATIO,
+        translation_key=KEY_BEST_SHARE_RATIO,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+        suggested_display_precision=4,
+        value_fn=lambda solo: solo.best_share_ratio,
+    ),
+]
+
+METRICS_SENSOR_DESCRIPTIONS = [
+    *(
+        PoolMetricsSensorEntityDescription(
+            key=f"poll_{stage}_{suffix}",
+            translation_key=f"poll_{stage}_{suffix}",
+            device_class=SensorDeviceClass.DURATION,
+            state_class=SensorStateClass.MEASUREMENT,
+            native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+            value_fn=lambda metrics, stage=stage, percentile=percentile: _metrics_value(
+                metrics.stages[stage], percentile
+            ),
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_registry_enabled_default=False,
+        )
+        for stage in PollStage
+        for suffix, percentile in (("last", None), ("p95", 95))
+    ),
+    *(
+        PoolMetricsSensorEntityDescription(
+            key=f"poll_payload_{suffix}",
+            translation_key=f"poll_payload_{suffix}",
+            device_class=SensorDeviceClass.DATA_SIZE,
+            state_class=SensorStateClass.MEASUREMENT,
+            native_unit_of_measurement=UnitOfInformation.BYTES,
+            value_fn=lambda metrics, percentile=percentile: _metrics_value(
+                metrics.payload_bytes, percentile
+            ),
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_registry_enabled_default=False,
+        )
+        for suffix, percentile in (("last", None), ("p95", 95))
     ),
 ]
 
@@ -116,6 +258,8 @@ async def async_setup_entry(
     sensors: list[SensorEntity] = []
 
     for address_desc in ADDRESS_SENSOR_DESCRIPTIONS:
+        if address_desc.is_fiat and not coordinator.has_coin_price:
+            continue
         address_value = address_desc.value_fn(coordinator.data)
         if address_value is not None:
             address_sensor = PoolAddressSensorEntity(
@@ -123,8 +267,23 @@ async def async_setup_entry(
             )
             sensors.append(address_sensor)
 
+    entity_registry = er.async_get(hass)
+
     for worker_desc in WORKER_SENSOR_DESCRIPTIONS:
+        # the worker history is imported as statistics instead of recorded
+        # states, only the sensors users already have are kept
+        skip_new = coordinator.long_term_statistics and worker_desc.long_term_statistics
+
         for worker in coordinator.data.worker_list:
+            if skip_new and (
+                entity_registry.async_get_entity_id(
+                    SENSOR_DOMAIN,
+                    DOMAIN,
+                    f"{config_entry.entry_id}-{worker.name}-{worker_desc.key}",
+                )
+                is None
+            ):
+                continue
             worker_value = worker_desc.value_fn(worker)
             if worker_value is not None:
                 worker_sensor = PoolAddressWorkerSensorEntity(
@@ -132,6 +291,17 @@ async def async_setup_entry(
                 )
                 sensors.append(worker_sensor)
 
+    if coordinator.has_solo_data:
+        sensors.extend(
+            PoolSoloSensorEntity(coordinator, solo_desc, config_entry)
+            for solo_desc in SOLO_SENSOR_DESCRIPTIONS
+        )
+
+    sensors.extend(
+        PoolMetricsSensorEntity(coordinator, metrics_desc, config_entry)
+        for metrics_desc in METRICS_SENSOR_DESCRIPTIONS
+    )
+
     async_add_entities(sensors)
 
 
@@ -161,6 +331,79 @@ class PoolAddressSensorEntity(PoolAddressDeviceEntity, SensorEntity):
                 ).name
             except ValueError:
                 self._attr_native_unit_of_measurement = pool_config.coin_name
+        elif self.entity_description.is_fiat:
+            self._attr_native_unit_of_measurement = coordinator.hass.config.currency
+        self._update_properties()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_properties()
+        self.async_write_ha_state()
+
+    @callback
+    def _update_properties(self) -> None:
+        """Update sensor properties."""
+        value = self.entity_description.value_fn(self.coordinator.data)
+        if self.entity_description.is_fiat:
+            price = self.coordinator.coin_price
+            value = None if value is None or price is None else float(value) * price
+        self._attr_native_value = value
+
+
+class PoolSoloSensorEntity(PoolAddressDeviceEntity, SensorEntity):
+    """Representation of a solo mining sensor."""
+
+    entity_description: PoolSoloSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: PoolCoordinator,
+        description: PoolSoloSensorEntityDescription,
+        config_entry: PoolConfigEntry,
+    ) -> None:
+        """Initialize the solo mining sensor."""
+        pool_config = PoolInitData(dict(config_entry.data))
+        super().__init__(coordinator, config_entry, pool_config)
+        self.entity_description = description
+        self._attr_unique_id = f"{config_entry.entry_id}-{description.key}"
+        self._attr_translation_key = description.translation_key
+        self.entity_id = f"{SENSOR_DOMAIN}.{pool_config.unique_id}_{description.key}"
+        self._update_properties()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_properties()
+        self.async_write_ha_state()
+
+    @callback
+    def _update_properties(self) -> None:
+        """Update sensor properties."""
+        solo_data = self.coordinator.solo_data
+        self._attr_native_value = (
+            None if solo_data is None else self.entity_description.value_fn(solo_data)
+        )
+
+
+class PoolMetricsSensorEntity(PoolAddressDeviceEntity, SensorEntity):
+    """Representation of a poll metrics sensor."""
+
+    entity_description: PoolMetricsSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: PoolCoordinator,
+        description: PoolMetricsSensorEntityDescription,
+        config_entry: PoolConfigEntry,
+    ) -> None:
+        """Initialize the poll metrics sensor."""
+        pool_config = PoolInitData(dict(config_entry.data))
+        super().__init__(coordinator, config_entry, pool_config)
+        self.entity_description = description
+        self._attr_unique_id = f"{config_entry.entry_id}-{description.key}"
+        self._attr_translation_key = description.translation_key
+        self.entity_id = f"{SENSOR_DOMAIN}.{pool_config.unique_id}_{description.key}"
         self._update_properties()
 
     @callback
@@ -173,7 +416,7 @@ class PoolAddressSensorEntity(PoolAddressDeviceEntity, SensorEntity):
     def _update_properties(self) -> None:
         """Update sensor properties."""
         self._attr_native_value = self.entity_description.value_fn(
-            self.coordinator.data
+            self.coordinator.metrics
         )
 
 
@@ -206,27 +449,25 @@ class PoolAddressWorkerSensorEntity(PoolAddressWorkerDeviceEntity, SensorEntity)
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        updated_worker = next(
-            (
-                w
-                for w in self.coordinator.data.worker_list
-                if w.name == self.worker_name
-            ),
-            None,
-        )
+        # a worker missing from the data keeps its last values
+        updated_worker = self.coordinator.get_worker(self.worker_name)
         if updated_worker is not None:
             self.worker = updated_worker
-        else:
-            self.worker.is_online = False
         self._update_properties()
         self.async_write_ha_state()
 
     @callback
     def _update_properties(self) -> None:
         """Update sensor properties."""
-        self._attr_native_value = self.entity_description.value_fn(self.worker)
-
-    @property
-    def available(self) -> bool:
-        """Check if device and sensor is available in data."""
-        return super().available and self.worker.is_online
+        value = self.entity_description.value_fn(self.worker)
+        previous = self._attr_native_value
+        if (
+            self.entity_description.deadband
+            and isinstance(value, float)
+            and isinstance(previous, float)
+            and abs(value - previous)
+            < abs(previous) * self.coordinator.hash_rate_deadband / 100
+        ):
+            # an unchanged state is not written to the state machine
+            return
+        self._attr_native_value = value
@@ -0,0 +1,123 @@
+"""Services for the Miner Pool Stats integration."""
+
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import io
+import logging
+import pstats
+import time
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_CONFIG_ENTRY_ID
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .const import DOMAIN
+from .coordinator import PoolCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_PROFILE = "profile"
+
+ATTR_UPDATES = "updates"
+
+# Functions of the integration logged after profiling
+PROFILE_TOP_FUNCTIONS = 20
+
+SERVICE_PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_UPDATES, default=1): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=20)
+        ),
+    }
+)
+
+
+@callback
+def _async_get_coordinator(hass: HomeAssistant, entry_id: str) -> PoolCoordinator:
+    """Get the coordinator of a loaded config entry."""
+    entry = hass.config_entries.async_get_entry(entry_id)
+    if entry is None or entry.domain != DOMAIN:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="entry_not_found",
+            translation_placeholders={"entry_id": entry_id},
+        )
+    if entry.state is not ConfigEntryState.LOADED:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="entry_not_loaded",
+            translation_placeholders={"title": entry.title},
+        )
+    return entry.runtime_data
+
+
+async def _async_refresh_times(coordinator: PoolCoordinator, updates: int) -> None:
+    """Refresh a coordinator the given number of times."""
+    for _ in range(updates):
+        await coordinator.async_refresh()
+
+
+def _write_profile(profiler: cProfile.Profile, path: str) -> str:
+    """Write the stats file and return the top functions of the integration."""
+    profiler.dump_stats(path)
+    output = io.StringIO()
+    stats = pstats.Stats(profiler, stream=output)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(
+        rf"custom_components[\\/]{DOMAIN}[\\/]", PROFILE_TOP_FUNCTIONS
+    )
+    return output.getvalue()
+
+
+async def _async_profile(call: ServiceCall) -> None:
+    """Profile the next updates of the selected config entries."""
+    hass = call.hass
+    coordinators = [
+        _async_get_coordinator(hass, entry_id)
+        for entry_id in call.data[ATTR_CONFIG_ENTRY_ID]
+    ]
+    updates: int = call.data[ATTR_UPDATES]
+
+    # the deterministic profiler of the event loop thread records the fetch,
+    # parse, recorder and dispatch stages of the refreshes
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError as error:
+        raise HomeAssistantError(
+            translation_domain=DOMAIN,
+            translation_key="profiler_active",
+        ) from error
+    try:
+        await asyncio.gather(
+            *(
+                _async_refresh_times(coordinator, updates)
+                for coordinator in coordinators
+            )
+        )
+    finally:
+        profiler.disable()
+
+    path = hass.config.path(f"{DOMAIN}_profile.{int(time.time() * 1000000)}.cprof")
+    top_functions = await hass.async_add_executor_job(_write_profile, profiler, path)
+    _LOGGER.warning(
+        "Profile of %s updates of %s written to %s, top functions:\n%s",
+        updates,
+        ", ".join(coordinator.name for coordinator in coordinators),
+        path,
+        top_functions,
+    )
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Set up the services of the integration."""
+    hass.services.async_register(
+        DOMAIN, SERVICE_PROFILE, _async_profile, schema=SERVICE_PROFILE_SCHEMA
+    )
@@ -0,0 +1,177 @@
+"""Solo mining figures for the Miner Pool Stats integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+import logging
+from time import monotonic
+
+from aiohttp import ClientError, ClientTimeout
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.json import json_loads
+
+from .const import (
+    DOMAIN,
+    POOL_SOURCE_CK_POOL_KEY,
+    POOL_SOURCE_PUBLIC_POOL_KEY,
+    POOL_SOURCE_SOLO_POOL_KEY,
+    CryptoCoin,
+)
+from .pool import PoolAddressData
+from .transport import async_get_transport
+
+_LOGGER = logging.getLogger(__name__)
+
+# Pool sources where a block found by the address is paid to the address alone
+SOLO_POOL_SOURCES = {
+    POOL_SOURCE_CK_POOL_KEY,
+    POOL_SOURCE_PUBLIC_POOL_KEY,
+    POOL_SOURCE_SOLO_POOL_KEY,
+}
+
+# Time a network difficulty is served from memory in seconds
+DIFFICULTY_TTL: float = 10 * 60
+
+BLOCKCHAIR_URL = "https://api.blockchair.com/{chain}/stats"
+
+BLOCKCHAIR_TIMEOUT = ClientTimeout(total=30)
+
+# Blockchair chains of the coins whose difficulty is relative to 2^32 hashes
+BLOCKCHAIR_CHAINS: dict[CryptoCoin, str] = {
+    CryptoCoin.BCH: "bitcoin-cash",
+    CryptoCoin.BTC: "bitcoin",
+    CryptoCoin.DASH: "dash",
+    CryptoCoin.DOGE: "dogecoin",
+    CryptoCoin.LTC: "litecoin",
+    CryptoCoin.XEC: "ecash",
+}
+
+# Expected hashes to find a block at difficulty 1
+HASHES_PER_DIFFICULTY = 2**32
+
+# Worker hash rates are reported in GH/s
+HASHES_PER_GIGAHASH = 1e9
+
+DATA_NETWORK_DIFFICULTY: HassKey[NetworkDifficultyCache] = HassKey(
+    f"{DOMAIN}_network_difficulty"
+)
+
+
+@dataclass(frozen=True)
+class SoloMiningData:
+    """Solo mining figures of an address."""
+
+    network_difficulty: float | None
+    # expected time until the address finds a block in seconds
+    time_to_block: float | None
+    # best share of the address in percent of the network difficulty
+    best_share_ratio: float | None
+
+
+def get_solo_mining_data(
+    data: PoolAddressData, network_difficulty: float | None
+) -> SoloMiningData:
+    """Derive the solo mining figures from the data of a poll."""
+    if not network_difficulty:
+        return SoloMiningData(None, None, None)
+
+    hash_rate = sum(worker.hash_rate or 0.0 for worker in data.worker_list)
+    return SoloMiningData(
+        network_difficulty,
+        network_difficulty * HASHES_PER_DIFFICULTY / (hash_rate * HASHES_PER_GIGAHASH)
+        if hash_rate > 0
+        else None,
+        data.best_difficulty / network_difficulty * 100
+        if data.best_difficulty is not None
+        else None,
+    )
+
+
+class NetworkDifficultyCache:
+    """Serve the network difficulty of each coin to all config entries.
+
+    The difficulty of a coin is fetched at most once per TTL and served from
+    memory. A stale difficulty is refreshed in the background, the listeners
+    of the coin are called once the request is done. When a fetch fails the
+    previous difficulty is kept and the fetch is retried after the TTL.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._difficulties: dict[CryptoCoin, float] = {}
+        self._updated: dict[CryptoCoin, float] = {}
+        self._pending: dict[CryptoCoin, asyncio.Task[None]] = {}
+        self._listeners: dict[CryptoCoin, list[Callable[[], None]]] = {}
+
+    @staticmethod
+    def supports(coin: CryptoCoin) -> bool:
+        """Return True if the network difficulty of the coin is known."""
+        return coin in BLOCKCHAIR_CHAINS
+
+    @callback
+    def async_add_listener(
+        self, coin: CryptoCoin, update_callback: Callable[[], None]
+    ) -> CALLBACK_TYPE:
+        """Call back whenever the difficulty of the coin has been fetched."""
+        listeners = self._listeners.setdefault(coin, [])
+        listeners.append(update_callback)
+
+        @callback
+        def _async_remove_listener() -> None:
+            listeners.remove(update_callback)
+
+        return _async_remove_listener
+
+    @callback
+    def async_get_difficulty(self, coin: CryptoCoin) -> float | None:
+        """Get the network difficulty of a coin.
+
+        A stale difficulty is returned as is while it is refreshed in the
+        background.
+        """
+        updated = self._updated.get(coin)
+        pending = self._pending.get(coin)
+        if (updated is None or monotonic() - updated >= DIFFICULTY_TTL) and (
+            pending is None or pending.done()
+        ):
+            self._pending[coin] = self._hass.async_create_background_task(
+                self._async_update(coin),
+                f"{DOMAIN} {coin.name} network difficulty",
+                eager_start=True,
+            )
+        return self._difficulties.get(coin)
+
+    async def _async_update(self, coin: CryptoCoin) -> None:
+        """Fetch the network difficulty of a coin."""
+        url = BLOCKCHAIR_URL.format(chain=BLOCKCHAIR_CHAINS[coin])
+        try:
+            response = await async_get_transport(self._hass).async_get(
+                url, None, BLOCKCHAIR_TIMEOUT
+            )
+            if response.status != 200:
+                raise ValueError(f"Status code {response.status}")
+            self._difficulties[coin] = float(
+                json_loads(response.body)["data"]["difficulty"]
+            )
+        except (ClientError, TimeoutError, KeyError, TypeError, ValueError) as error:
+            _LOGGER.warning(
+                "Unable to update the network difficulty of %s: %s", coin.name, error
+            )
+
+        self._updated[coin] = monotonic()
+
+        for update_callback in list(self._listeners.get(coin, ())):
+            update_callback()
+
+
+@callback
+def async_get_network_difficulty_cache(hass: HomeAssistant) -> NetworkDifficultyCache:
+    """Get the network difficulty cache shared by the config entries."""
+    if (cache := hass.data.get(DATA_NETWORK_DIFFICULTY)) is None:
+        cache = hass.data[DATA_NETWORK_DIFFICULTY] = NetworkDifficultyCache(hass)
+    return cache
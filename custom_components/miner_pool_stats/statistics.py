@@ -0,0 +1,190 @@
+"""Long-term statistics import for the Miner Pool Stats integration."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import logging
+
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import slugify
+from homeassistant.util.dt import utcnow
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN, KEY_HASH_RATE, UNIT_HASH_RATE
+from .pool import PoolAddressData, PoolInitData
+
+_LOGGER = logging.getLogger(__name__)
+
+HOUR = timedelta(hours=1)
+
+# Partial hours flushed on unload, by statistic id, for the next setup to continue
+DATA_PARTIAL_BUCKETS: HassKey[dict[str, HourlyBucket]] = HassKey(
+    f"{DOMAIN}_partial_statistics"
+)
+
+
+@dataclass
+class HourlyBucket:
+    """Hash rate samples aggregated for one worker and one hour.
+
+    The mean is weighted by the time each sample was current, so it does not
+    depend on how often samples arrive, polled or pushed.
+    """
+
+    start: datetime
+    # sum of the earlier samples times the seconds each was current
+    total: float = 0.0
+    duration: float = 0.0
+    count: int = 0
+    min: float = 0.0
+    max: float = 0.0
+    last_value: float = 0.0
+    last_time: datetime | None = None
+
+    def add(self, value: float, sample_time: datetime) -> None:
+        """Add a sample to the bucket."""
+        if self.count == 0:
+            self.min = value
+            self.max = value
+        else:
+            self.min = min(self.min, value)
+            self.max = max(self.max, value)
+        if self.last_time is not None:
+            elapsed = max((sample_time - self.last_time).total_seconds(), 0.0)
+            self.total += self.last_value * elapsed
+            self.duration += elapsed
+        self.last_value = value
+        self.last_time = sample_time
+        self.count += 1
+
+    def to_statistic(self, end: datetime) -> StatisticData:
+        """Return the bucket as an hourly statistic row.
+
+        The last sample is current until the end, at most the end of the hour.
+        """
+        total = self.total
+        duration = self.duration
+        if self.last_time is not None:
+            elapsed = (min(end, self.start + HOUR) - self.last_time).total_seconds()
+            total += self.last_value * max(elapsed, 0.0)
+            duration += max(elapsed, 0.0)
+        return StatisticData(
+            start=self.start,
+            mean=total / duration if duration > 0 else self.last_value,
+            min=self.min,
+            max=self.max,
+        )
+
+
+class PoolStatisticsAggregator:
+    """Aggregate worker hash rate samples into hourly external statistics."""
+
+    def __init__(self, hass: HomeAssistant, pool_config: PoolInitData) -> None:
+        """Initialize the aggregator."""
+        self._hass = hass
+        self._pool_config = pool_config
+        self._buckets: dict[str, HourlyBucket] = {}
+
+    def statistic_id(self, worker_name: str) -> str:
+        """Get the external statistic id of a worker."""
+        return f"{DOMAIN}:{slugify(f'{self._pool_config.unique_id}_{worker_name}_{KEY_HASH_RATE}')}"
+
+    @callback
+    def async_add(
+        self, data: PoolAddressData, sample_time: datetime | None = None
+    ) -> None:
+        """Add the worker samples of a poll and import the completed hours."""
+
+        sample_time = sample_time or utcnow()
+        hour = sample_time.replace(minute=0, second=0, microsecond=0)
+        completed: dict[str, HourlyBucket] = {}
+
+        for worker in data.worker_list:
+            if worker.hash_rate is None:
+                continue
+
+            bucket = self._buckets.get(worker.name)
+            if bucket is not None and bucket.start != hour:
+                completed[worker.name] = bucket
+                bucket = None
+            if bucket is None:
+                bucket = self._buckets[worker.name] = self._pop_partial_bucket(
+                    worker.name, hour
+                ) or HourlyBucket(hour)
+
+            bucket.add(worker.hash_rate, sample_time)
+
+        # workers that stopped reporting still have their last hour to import
+        for worker_name, bucket in list(self._buckets.items()):
+            if bucket.start != hour:
+                completed[worker_name] = self._buckets.pop(worker_name)
+
+        self._async_import(completed, sample_time)
+
+    @callback
+    def async_flush(self) -> None:
+        """Import all buckets, including the current partial hour.
+
+        The buckets are kept for the next setup of the entry, which continues
+        the partial hour instead of overwriting its row with fewer samples.
+        """
+        buckets, self._buckets = self._buckets, {}
+        now = utcnow()
+        self._async_import(buckets, now)
+
+        hour = now.replace(minute=0, second=0, microsecond=0)
+        partial = self._hass.data.setdefault(DATA_PARTIAL_BUCKETS, {})
+        for statistic_id, bucket in list(partial.items()):
+            if bucket.start < hour:
+                del partial[statistic_id]
+        partial.update(
+            (self.statistic_id(worker_name), bucket)
+            for worker_name, bucket in buckets.items()
+            if bucket.start == hour
+        )
+
+    @callback
+    def _pop_partial_bucket(
+        self, worker_name: str, hour: datetime
+    ) -> HourlyBucket | None:
+        """Take the bucket of a worker flushed earlier in the same hour."""
+        if (partial := self._hass.data.get(DATA_PARTIAL_BUCKETS)) is None:
+            return None
+        bucket = partial.pop(self.statistic_id(worker_name), None)
+        return bucket if bucket is not None and bucket.start == hour else None
+
+    @callback
+    def _async_import(self, buckets: dict[str, HourlyBucket], end: datetime) -> None:
+        """Import the buckets through the recorder statistics API."""
+
+        for worker_name, bucket in buckets.items():
+            if bucket.count == 0:
+                continue
+
+            statistic_id = self.statistic_id(worker_name)
+            _LOGGER.debug(
+                "Importing %s samples for %s at %s",
+                bucket.count,
+                statistic_id,
+                bucket.start,
+            )
+
+            metadata = StatisticMetaData(
+                mean_type=StatisticMeanType.ARITHMETIC,
+                has_sum=False,
+                name=f"{self._pool_config.title} {worker_name} Hashrate",
+                source=DOMAIN,
+                statistic_id=statistic_id,
+                unit_class=None,
+                unit_of_measurement=UNIT_HASH_RATE,
+            )
+            async_add_external_statistics(
+                self._hass, metadata, [bucket.to_statistic(end)]
+            )
@@ -0,0 +1,202 @@
+"""Shared HTTP transport for the Miner Pool Stats integration."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from time import monotonic
+from types import SimpleNamespace
+
+from aiohttp import (
+    ClientError,
+    ClientSession,
+    ClientTimeout,
+    TraceConfig,
+    TraceConnectionCreateEndParams,
+    TraceConnectionCreateStartParams,
+    TraceConnectionReuseconnParams,
+    TraceDnsResolveHostEndParams,
+    TraceDnsResolveHostStartParams,
+    TraceRequestEndParams,
+    TraceRequestStartParams,
+)
+from yarl import URL
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+from .metrics import PollStage, current_poll_metrics
+
+# Concurrent requests allowed to a single pool server
+HOST_CONCURRENCY_LIMIT = 4
+
+DATA_TRANSPORT: HassKey[PoolTransport] = HassKey(f"{DOMAIN}_transport")
+
+
+@dataclass
+class PoolResponse:
+    """Representation of a pool response."""
+
+    status: int
+    body: bytes
+
+
+@dataclass
+class HostStatistics:
+    """Request and connection counters of a pool server."""
+
+    requests: int = 0
+    errors: int = 0
+    bytes_received: int = 0
+    connections_created: int = 0
+    connections_reused: int = 0
+
+
+class PoolTransport:
+    """Pooled HTTP connections shared by all pool clients."""
+
+    def __init__(
+        self,
+        session: ClientSession,
+        host_statistics: dict[str, HostStatistics] | None = None,
+    ) -> None:
+        """Initialize the transport."""
+        self._session = session
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+        self.host_statistics = host_statistics if host_statistics is not None else {}
+
+    async def async_get(
+        self,
+        url: str,
+        headers: dict[str, str] | None,
+        timeout: ClientTimeout,
+    ) -> PoolResponse:
+        """Send a GET request, limiting the concurrent requests per host."""
+
+        host = URL(url).host or ""
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._host_semaphores[host] = asyncio.Semaphore(
+                HOST_CONCURRENCY_LIMIT
+            )
+
+        statistics = _get_host_statistics(self.host_statistics, host)
+        statistics.requests += 1
+
+        try:
+            async with (
+                semaphore,
+                self._session.get(url, headers=headers, timeout=timeout) as response,
+            ):
+                start = monotonic()
+                body = await response.read()
+        except (ClientError, TimeoutError):
+            statistics.errors += 1
+            raise
+
+        statistics.bytes_received += len(body)
+        if (metrics := current_poll_metrics.get()) is not None:
+            metrics.add(PollStage.DOWNLOAD, monotonic() - start)
+            metrics.add_payload(len(body))
+        return PoolResponse(response.status, body)
+
+
+def _get_host_statistics(
+    host_statistics: dict[str, HostStatistics], host: str
+) -> HostStatistics:
+    """Get the counters of a pool server."""
+    if (statistics := host_statistics.get(host)) is None:
+        statistics = host_statistics[host] = HostStatistics()
+    return statistics
+
+
+def _create_trace_config(host_statistics: dict[str, HostStatistics]) -> TraceConfig:
+    """Create a trace config recording the request stages of the current poll."""
+
+    async def on_request_start(
+        _session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceRequestStartParams,
+    ) -> None:
+        context.request_start = monotonic()
+        context.connection_time = 0.0
+        context.host = params.url.host or ""
+
+    async def on_dns_resolvehost_start(
+        _session: ClientSession,
+        context: SimpleNamespace,
+        _params: TraceDnsResolveHostStartParams,
+    ) -> None:
+        context.dns_start = monotonic()
+
+    async def on_dns_resolvehost_end(
+        _session: ClientSession,
+        context: SimpleNamespace,
+        _params: TraceDnsResolveHostEndParams,
+    ) -> None:
+        context.dns_time = monotonic() - context.dns_start
+        if (metrics := current_poll_metrics.get()) is not None:
+            metrics.add(PollStage.DNS, context.dns_time)
+
+    async def on_connection_create_start(
+        _session: ClientSession,
+        context: SimpleNamespace,
+        _params: TraceConnectionCreateStartParams,
+    ) -> None:
+        context.connection_start = monotonic()
+        context.dns_time = 0.0
+
+    async def on_connection_create_end(
+        _session: ClientSession,
+        context: SimpleNamespace,
+        _params: TraceConnectionCreateEndParams,
+    ) -> None:
+        context.connection_time = monotonic() - context.connection_start
+        _get_host_statistics(host_statistics, context.host).connections_created += 1
+        if (metrics := current_poll_metrics.get()) is not None:
+            metrics.add(PollStage.CONNECT, context.connection_time - context.dns_time)
+
+    async def on_connection_reuseconn(
+        _session: ClientSession,
+        context: SimpleNamespace,
+        _params: TraceConnectionReuseconnParams,
+    ) -> None:
+        _get_host_statistics(host_statistics, context.host).connections_reused += 1
+
+    async def on_request_end(
+        _session: ClientSession,
+        context: SimpleNamespace,
+        _params: TraceRequestEndParams,
+    ) -> None:
+        # the response headers have been received
+        if (metrics := current_poll_metrics.get()) is not None:
+            metrics.add(
+                PollStage.TTFB,
+                monotonic() - context.request_start - context.connection_time,
+            )
+
+    trace_config = TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_dns_resolvehost_start.append(on_dns_resolvehost_start)
+    trace_config.on_dns_resolvehost_end.append(on_dns_resolvehost_end)
+    trace_config.on_connection_create_start.append(on_connection_create_start)
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+    trace_config.on_request_end.append(on_request_end)
+    return trace_config
+
+
+@callback
+def async_get_transport(hass: HomeAssistant) -> PoolTransport:
+    """Get the transport shared by the config entries."""
+    if (transport := hass.data.get(DATA_TRANSPORT)) is None:
+        host_statistics: dict[str, HostStatistics] = {}
+        transport = hass.data[DATA_TRANSPORT] = PoolTransport(
+            async_create_clientsession(
+                hass, trace_configs=[_create_trace_config(host_statistics)]
+            ),
+            host_statistics,
+        )
+    return transport
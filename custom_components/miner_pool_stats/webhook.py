@@ -0,0 +1,53 @@
+"""Webhook for pushed data of the Miner Pool Stats integration."""
+
+from __future__ import annotations
+
+from http import HTTPStatus
+import logging
+
+from aiohttp.web import Request, Response
+
+from homeassistant.components import webhook
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+from .coordinator import PoolConfigEntry
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_register_webhook(
+    hass: HomeAssistant, entry: PoolConfigEntry, webhook_id: str
+) -> None:
+    """Register the webhook of a config entry, it is removed on unload."""
+
+    async def _async_handle_webhook(
+        hass: HomeAssistant, webhook_id: str, request: Request
+    ) -> Response:
+        """Apply data pushed to the webhook."""
+        coordinator = entry.runtime_data
+
+        try:
+            payload = await request.json()
+        except ValueError:
+            return Response(status=HTTPStatus.BAD_REQUEST, text="Invalid JSON")
+
+        try:
+            data = await coordinator.api.async_parse_pushed_data(payload)
+        except (AttributeError, KeyError, TypeError, ValueError) as error:
+            _LOGGER.debug("Invalid payload pushed to %s: %s", entry.title, error)
+            return Response(status=HTTPStatus.BAD_REQUEST, text="Invalid payload")
+
+        coordinator.async_set_pushed_data(data)
+        return Response(status=HTTPStatus.OK)
+
+    webhook.async_register(
+        hass,
+        DOMAIN,
+        entry.title,
+        webhook_id,
+        _async_handle_webhook,
+        allowed_methods=[webhook.METH_POST],
+    )
+    entry.async_on_unload(lambda: webhook.async_unregister(hass, webhook_id))
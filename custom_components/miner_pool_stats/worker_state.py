@@ -0,0 +1,70 @@
+"""Worker online state transitions for the Miner Pool Stats integration."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from .pool import PoolAddressData
+
+
+@dataclass
+class WorkerTransitions:
+    """Workers that went online or offline in an update."""
+
+    online: list[str] = field(default_factory=list)
+    offline: list[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        """Return True if a worker changed state."""
+        return bool(self.online or self.offline)
+
+
+class WorkerStateTracker:
+    """Report the workers whose online state changed.
+
+    A new state is only reported once it held for the given number of
+    consecutive updates, with a debounce above 1 a worker flapping for a
+    single poll is not reported. Workers missing from an update are offline.
+    """
+
+    def __init__(self, debounce: int) -> None:
+        """Initialize the tracker."""
+        self.debounce = debounce
+        self._reported: dict[str, bool] | None = None
+        # updates a worker held the opposite of its reported state for
+        self._pending: dict[str, int] = {}
+
+    def update(self, data: PoolAddressData) -> WorkerTransitions:
+        """Compare the workers of an update with the reported states."""
+        transitions = WorkerTransitions()
+        current = {worker.name: worker.is_online for worker in data.worker_list}
+
+        if self._reported is None:
+            # the first update is the baseline
+            self._reported = current
+            return transitions
+
+        reported = self._reported
+        for name in reported.keys() - current.keys():
+            if reported[name]:
+                current[name] = False
+            else:
+                # forget workers that are gone and reported offline
+                del reported[name]
+                self._pending.pop(name, None)
+
+        for name, is_online in current.items():
+            if reported.setdefault(name, is_online) == is_online:
+                self._pending.pop(name, None)
+                continue
+
+            count = self._pending.get(name, 0) + 1
+            if count < self.debounce:
+                self._pending[name] = count
+                continue
+
+            self._pending.pop(name, None)
+            reported[name] = is_online
+            (transitions.online if is_online else transitions.offline).append(name)
+
+        return transitions